@@ -0,0 +1,123 @@
+"""
+Fixtures for the benchmark suite, run with ``pytest-benchmark``:
+
+    pytest benchmarks --no-cov --benchmark-autosave
+    pytest benchmarks --no-cov --benchmark-compare
+
+Compile benchmarks use the newest installed version of ``solc``, or the one given
+with ``--solc-version`` or ``--solc-binary``, and are skipped if there is none.
+Install benchmarks download from a local HTTP server, and never use the network.
+"""
+import hashlib
+import json
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+
+import solcx
+from solcx.install import _get_os_name
+from solcx.utils.corpus import generate_corpus
+
+# (contracts, import depth) of the generated corpora
+CORPUS_SIZES = [(1, 1), (10, 1), (10, 5), (50, 1), (50, 10)]
+
+STANDIN_VERSION = "0.8.20"
+STANDIN_SOLC = """#!{executable}
+import sys
+
+if "--version" in sys.argv:
+    print("Version: {version}+commit.a1b79de6.Linux.g++")
+"""
+
+
+def pytest_addoption(parser):
+    parser.addoption("--solc-version", action="store", help="solc version to benchmark against")
+    parser.addoption("--solc-binary", action="store", help="solc binary to benchmark against")
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    # recorded with saved results, so runs against different compilers are not compared
+    try:
+        machine_info["solcx"] = metadata.version("py-solc-x")
+    except metadata.PackageNotFoundError:
+        # not installed, e.g. run from a checkout - the commit is recorded in `commit_info`
+        machine_info["solcx"] = None
+    solc_binary = _get_solc_binary(config)
+    if solc_binary is not None:
+        machine_info["solc"] = str(solcx.wrapper.get_solc_version(solc_binary))
+
+
+def _get_solc_binary(config):
+    if config.getoption("--solc-binary"):
+        return Path(config.getoption("--solc-binary"))
+    version = config.getoption("--solc-version")
+    if version is None:
+        installed = solcx.get_installed_solc_versions()
+        if not installed:
+            return None
+        version = installed[0]
+    return solcx.install.get_executable(version)
+
+
+@pytest.fixture(scope="session")
+def solc_binary(pytestconfig):
+    solc_binary = _get_solc_binary(pytestconfig)
+    if solc_binary is None:
+        pytest.skip("no solc versions are installed")
+    return solc_binary
+
+
+@pytest.fixture(
+    scope="session", params=CORPUS_SIZES, ids=lambda i: f"{i[0]}-contracts-depth-{i[1]}"
+)
+def corpus(request, tmp_path_factory):
+    contracts, depth = request.param
+    return generate_corpus(
+        tmp_path_factory.mktemp("corpus"), contracts, fanout=2, depth=depth, libraries=1
+    )
+
+
+@pytest.fixture(scope="session")
+def standin_mirror(tmp_path_factory):
+    """
+    Serve a binary mirror from a local HTTP server, holding a stand-in ``solc``
+    that only answers ``--version``. Yields the URL of the mirror.
+    """
+    if sys.platform == "win32":
+        pytest.skip("stand-in solc is a script with a shebang")
+
+    root = tmp_path_factory.mktemp("mirror")
+    os_name = _get_os_name()
+    filename = f"solc-{os_name}-amd64-v{STANDIN_VERSION}+commit.a1b79de6"
+    content = STANDIN_SOLC.format(executable=sys.executable, version=STANDIN_VERSION).encode()
+    # pad to the size of a real binary, so the download is not negligible
+    content += b"#" * (8 << 20)
+
+    folder = root.joinpath(f"{os_name}-amd64")
+    folder.mkdir()
+    folder.joinpath(filename).write_bytes(content)
+    binary_list = {
+        "builds": [
+            {
+                "path": filename,
+                "version": STANDIN_VERSION,
+                "sha256": f"0x{hashlib.sha256(content).hexdigest()}",
+            }
+        ],
+        "releases": {STANDIN_VERSION: filename},
+    }
+    folder.joinpath("list.json").write_text(json.dumps(binary_list))
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
@@ -0,0 +1,83 @@
+"""
+Benchmark resolving many pragma statements, comparing ``select_pragma_version``
+with ``PragmaResolver``.
+
+    python benchmarks/pragma_resolution.py [PRAGMA_FILE]
+
+PRAGMA_FILE holds one pragma statement per line, e.g. extracted from a corpus with
+``grep -rho "pragma solidity[^;]*;" contracts/``. Without it, 10,000 statements are
+generated using the forms most common in published contracts.
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+from packaging.version import Version
+
+from solcx import PragmaResolver
+from solcx.install import select_pragma_version
+
+# latest patch release of each minor version supported by py-solc-x
+LATEST_PATCH = {"0.4": 26, "0.5": 17, "0.6": 12, "0.7": 6, "0.8": 26}
+INSTALLABLE = [
+    Version(f"{minor}.{patch}")
+    for minor, latest in LATEST_PATCH.items()
+    for patch in range(11 if minor == "0.4" else 0, latest + 1)
+]
+INSTALLED = INSTALLABLE[-12:]
+
+# (weight, template) - `{v}` and `{w}` are replaced with released versions, `v <= w`
+FORMS = [
+    (30, "pragma solidity ^{v};"),
+    (20, "pragma solidity {v};"),
+    (12, "pragma solidity >={v} <0.9.0;"),
+    (8, "pragma solidity >={v};"),
+    (6, "pragma solidity >={v} <={w};"),
+    (5, "pragma solidity >={v}<{w};"),
+    (5, "pragma solidity ={v};"),
+    (4, "pragma solidity >0.4.23 <0.7.0;"),
+    (4, "pragma solidity ^{v} || ^{w};"),
+    (3, "pragma solidity >=0.4.22 <0.9.0;"),
+    (3, "pragma solidity >=0.5.0 <0.6.0 || ^0.8.0;"),
+]
+
+
+def generate_pragmas(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    weights, templates = zip(*FORMS)
+    pragmas = []
+    for template in rng.choices(templates, weights, k=count):
+        v, w = sorted(rng.sample(INSTALLABLE, 2))
+        pragmas.append(template.format(v=v, w=w))
+    return pragmas
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        pragmas = Path(sys.argv[1]).read_text().splitlines()
+    else:
+        pragmas = generate_pragmas(10_000)
+
+    start = time.perf_counter()
+    expected = [
+        (select_pragma_version(i, INSTALLED), select_pragma_version(i, INSTALLABLE))
+        for i in pragmas
+    ]
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolver = PragmaResolver(INSTALLED, INSTALLABLE)
+    results = resolver.resolve_many(pragmas)
+    batched = time.perf_counter() - start
+
+    assert [(i.installed, i.installable) for i in results] == expected
+    print(f"{len(pragmas)} pragmas, {len(set(pragmas))} distinct")
+    print(f"{'select_pragma_version':<28} {baseline * 1000:8.1f}ms")
+    print(
+        f"{'PragmaResolver.resolve_many':<28} {batched * 1000:8.1f}ms ({baseline / batched:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import solcx
+from solcx.utils.corpus import generate_corpus
+
+
+def flatten(paths: list) -> str:
+    # contracts are written in dependency order, so dropping the imports is enough
+    lines = ["// SPDX-License-Identifier: MIT", "pragma solidity >=0.5.0;"]
+    for path in paths:
+        lines += [
+            i
+            for i in path.read_text().splitlines()
+            if not i.startswith(("import ", "pragma ", "// SPDX"))
+        ]
+    return "\n".join(lines)
+
+
+def test_compile_source(benchmark, solc_binary, corpus):
+    benchmark(solcx.compile_source, flatten(corpus.paths), solc_binary=solc_binary)
+
+
+def test_compile_files(benchmark, solc_binary, corpus):
+    benchmark(solcx.compile_files, corpus.paths, solc_binary=solc_binary)
+
+
+def test_compile_standard(benchmark, solc_binary, corpus):
+    benchmark(solcx.compile_standard, corpus.get_standard_json(), solc_binary=solc_binary)
+
+
+def test_link_code(benchmark, solc_binary):
+    # 200 references to a library, each followed by 64 bytes of code
+    placeholder = "__Lib.sol:Lib" + "_" * 27
+    unlinked = ("6080604052" + placeholder + "00" * 64) * 200
+    libraries = {"Lib.sol:Lib": "0x" + "aa" * 20}
+    benchmark(solcx.link_code, unlinked, libraries, solc_binary=solc_binary)
+
+
+def test_compile_standard_large_ast(benchmark, solc_binary, tmp_path):
+    corpus = generate_corpus(tmp_path, contracts=5, statements=2000)
+    benchmark(solcx.compile_standard, corpus.get_standard_json(), solc_binary=solc_binary)
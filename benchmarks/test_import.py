@@ -0,0 +1,9 @@
+import subprocess
+import sys
+
+
+def test_import_time(benchmark):
+    # includes the startup time of the interpreter, see `python -X importtime`
+    benchmark.pedantic(
+        subprocess.run, ([sys.executable, "-c", "import solcx"],), {"check": True}, rounds=20
+    )
@@ -0,0 +1,64 @@
+import itertools
+import os
+import time
+
+import pytest
+from conftest import STANDIN_VERSION
+
+import solcx
+from solcx.install import SOLCX_BINARY_PATH_VARIABLE, get_solcx_install_folder
+from solcx.utils import registry
+
+
+@pytest.fixture
+def mirror(standin_mirror):
+    solcx.set_binary_mirrors([standin_mirror])
+    yield standin_mirror
+    solcx.set_binary_mirrors(None)
+
+
+@pytest.fixture
+def populated_folder(tmp_path):
+    install_folder = get_solcx_install_folder(tmp_path)
+
+    def populate(count):
+        for i in range(count):
+            install_folder.joinpath(f"solc-v0.{4 + i // 30}.{i % 30}").touch(mode=0o755)
+        # the registry does not cache folders modified within the last few seconds
+        mtime = time.time() - 60
+        os.utime(install_folder, (mtime, mtime))
+        return install_folder
+
+    return populate
+
+
+def test_install_solc(benchmark, mirror, tmp_path, monkeypatch):
+    # each round installs into a new, empty folder
+    folders = (tmp_path.joinpath(str(i)) for i in itertools.count())
+
+    def setup():
+        folder = next(folders)
+        folder.mkdir()
+        # set in the environment rather than passed, as a first install also sets the
+        # default version, which is looked up in the default folder
+        monkeypatch.setenv(SOLCX_BINARY_PATH_VARIABLE, str(folder))
+        return (STANDIN_VERSION,), {}
+
+    benchmark.pedantic(solcx.install_solc, setup=setup, rounds=10)
+
+
+@pytest.mark.parametrize("count", [10, 100])
+def test_get_installed_solc_versions(benchmark, populated_folder, count):
+    install_folder = populated_folder(count)
+
+    def lookup():
+        registry.invalidate(install_folder)
+        return solcx.get_installed_solc_versions(install_folder)
+
+    assert len(benchmark(lookup)) == count
+
+
+def test_get_installed_solc_versions_cached(benchmark, populated_folder):
+    install_folder = populated_folder(100)
+
+    assert len(benchmark(solcx.get_installed_solc_versions, install_folder)) == 100
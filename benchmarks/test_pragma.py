@@ -0,0 +1,20 @@
+import pytest
+from pragma_resolution import INSTALLABLE, generate_pragmas
+
+from solcx import PragmaResolver
+from solcx.install import select_pragma_version
+
+PRAGMAS = generate_pragmas(1000)
+
+
+def test_select_pragma_version(benchmark):
+    def resolve():
+        return [select_pragma_version(i, INSTALLABLE) for i in PRAGMAS]
+
+    benchmark(resolve)
+
+
+@pytest.mark.parametrize("count", [1000, 10_000])
+def test_pragma_resolver(benchmark, count):
+    pragmas = generate_pragmas(count)
+    benchmark(lambda: PragmaResolver(INSTALLABLE, INSTALLABLE).resolve_many(pragmas))
@@ -1,4 +1,5 @@
 from solcx import wrapper
+from solcx.archive import restore, snapshot
 from solcx.install import (
     compile_solc,
     get_compilable_solc_versions,
@@ -8,13 +9,23 @@ from solcx.install import (
     import_installed_solc,
     install_solc,
     install_solc_pragma,
+    prune,
+    set_binary_mirrors,
     set_solc_version,
     set_solc_version_pragma,
+    set_source_mirrors,
+    sync_binary_mirror,
 )
 from solcx.main import compile_files, compile_source, compile_standard, get_solc_version, link_code
+from solcx.pragma import PragmaResolver
+from solcx.prefetcher import prefetch
+from solcx.project import compile_project
+from solcx.wrapper import set_lean_mode
 
 __all__ = [
+    "PragmaResolver",
     "compile_files",
+    "compile_project",
     "compile_solc",
     "compile_source",
     "compile_standard",
@@ -27,7 +38,15 @@ __all__ = [
     "install_solc",
     "install_solc_pragma",
     "link_code",
+    "prefetch",
+    "prune",
+    "restore",
+    "set_binary_mirrors",
+    "set_lean_mode",
     "set_solc_version",
     "set_solc_version_pragma",
+    "set_source_mirrors",
+    "snapshot",
+    "sync_binary_mirror",
     "wrapper",
 ]
@@ -0,0 +1,111 @@
+"""
+Command line interface for py-solc-x, e.g. ``python -m solcx install 0.8.20``
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from solcx import archive, install
+from solcx.utils.store import gc_store
+
+SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def _parse_size(value: str) -> int:
+    # a number of bytes, optionally with a K, M or G suffix
+    value = value.strip().upper().rstrip("B")
+    try:
+        if value and value[-1] in SIZE_SUFFIXES:
+            return int(float(value[:-1]) * SIZE_SUFFIXES[value[-1]])
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: '{value}'")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m solcx")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    install_parser = subparsers.add_parser("install", help="Install a precompiled solc binary")
+    install_parser.add_argument("version")
+    install_parser.add_argument("--solcx-binary-path", default=None)
+    install_parser.add_argument(
+        "--mirror", action="append", help="Binary mirror to use, may be given multiple times"
+    )
+
+    sync_parser = subparsers.add_parser(
+        "sync-mirror", help="Download precompiled solc binaries into a local mirror directory"
+    )
+    sync_parser.add_argument("path")
+    sync_parser.add_argument(
+        "--version", action="append", dest="versions", help="Version to sync (default: all)"
+    )
+    sync_parser.add_argument(
+        "--os",
+        action="append",
+        dest="os_names",
+        choices=["linux", "macosx", "windows"],
+        help="Platform to sync (default: current platform)",
+    )
+
+    subparsers.add_parser(
+        "gc-store", help="Remove binaries from the shared store that are no longer installed"
+    )
+
+    prune_parser = subparsers.add_parser(
+        "prune", help="Remove the least recently used solc versions to stay within a disk quota"
+    )
+    prune_parser.add_argument(
+        "--max-bytes", type=_parse_size, required=True, help="Size limit, e.g. 500M or 2G"
+    )
+    prune_parser.add_argument(
+        "--keep", action="append", help="Version to never remove, may be given multiple times"
+    )
+    prune_parser.add_argument("--solcx-binary-path", default=None)
+
+    snapshot_parser = subparsers.add_parser(
+        "snapshot", help="Pack the installation folder into a compressed archive"
+    )
+    snapshot_parser.add_argument("path")
+    snapshot_parser.add_argument("--solcx-binary-path", default=None)
+    snapshot_parser.add_argument(
+        "--include-build", action="store_true", help="Include the source build folder"
+    )
+
+    restore_parser = subparsers.add_parser(
+        "restore", help="Restore the installation folder from a snapshot archive"
+    )
+    restore_parser.add_argument("path", help="Archive to restore, or - to read from stdin")
+    restore_parser.add_argument("--solcx-binary-path", default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "install":
+        if args.mirror:
+            install.set_binary_mirrors(args.mirror)
+        install.install_solc(args.version, solcx_binary_path=args.solcx_binary_path)
+
+    elif args.command == "sync-mirror":
+        synced = install.sync_binary_mirror(args.path, args.versions, args.os_names)
+        print(f"Synced {len(synced)} solc version(s) into {args.path}")
+
+    elif args.command == "gc-store":
+        removed = gc_store()
+        print(f"Removed {len(removed)} unused binaries from the store")
+
+    elif args.command == "prune":
+        pruned = install.prune(args.max_bytes, args.keep, args.solcx_binary_path)
+        print(f"Removed {len(pruned)} solc version(s): {', '.join(map(str, pruned))}")
+
+    elif args.command == "snapshot":
+        archive.snapshot(args.path, args.solcx_binary_path, args.include_build)
+        print(f"Saved snapshot to {args.path}")
+
+    elif args.command == "restore":
+        source = sys.stdin.buffer if args.path == "-" else args.path
+        restored = archive.restore(source, args.solcx_binary_path)
+        print(f"Restored {len(restored)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Snapshot and restore of an installation folder, e.g. to bootstrap CI containers.
+
+A snapshot is a gzipped tarball that starts with an index of every file and its
+sha256 digest. :func:`restore` reads it as a stream, so it can be piped from a
+download, and compares the index with the files on disk while the archive is
+still being decompressed. Files that already match are not written again, and
+the remaining files are written by a pool of threads.
+"""
+import json
+import logging
+import os
+import time
+from collections import deque
+from io import BytesIO
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple, Union
+
+from solcx import install
+from solcx.exceptions import SolcInstallationError
+from solcx.utils.lock import get_process_lock
+from solcx.utils.manifest import MANIFEST_FILENAME, read_manifest, update_manifest
+from solcx.utils.store import add_to_store, get_solcx_store_folder, link_from_store, sha256_file
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+LOGGER = logging.getLogger("solcx")
+
+INDEX_FILENAME = ".solcx-snapshot.json"
+SNAPSHOT_FORMAT = 1
+# binaries make up most of a snapshot and compress poorly beyond this level
+COMPRESS_LEVEL = 6
+# decompressed files held in memory by `restore` while waiting to be written, in bytes.
+# A single larger file is still restored, on its own
+MAX_PENDING_BYTES = 256 << 20
+
+
+def _is_temporary(name: str) -> bool:
+    # partial installs and atomically written files that are not yet in place
+    return name.endswith((".partial", ".tmp"))
+
+
+def _get_snapshot_files(install_folder: Path, include_build: bool) -> List[PurePosixPath]:
+    files = []
+    for root, dirs, names in os.walk(install_folder):
+        rel_root = Path(root).relative_to(install_folder)
+        if rel_root == Path(".") and not include_build:
+            dirs[:] = [i for i in dirs if i != install.BUILD_FOLDER]
+        dirs[:] = [i for i in dirs if not _is_temporary(i)]
+        for name in names:
+            if _is_temporary(name) or os.path.islink(os.path.join(root, name)):
+                continue
+            files.append(PurePosixPath(rel_root.joinpath(name).as_posix()))
+    return sorted(files)
+
+
+def _is_binary(name: PurePosixPath) -> bool:
+    return name.parts[0].startswith("solc-v")
+
+
+def _get_version(name: PurePosixPath) -> Optional[str]:
+    return name.parts[0][6:] if _is_binary(name) else None
+
+
+def _get_known_digest(
+    path: Path, name: PurePosixPath, manifest: Dict[str, Dict[str, Any]]
+) -> Optional[str]:
+    # installed binaries are never modified in place, so a manifest digest can be
+    # trusted without reading the binary as long as the size still matches
+    version = _get_version(name)
+    entry = manifest.get(version, {}) if version else {}
+    if entry.get("path") == name.as_posix() and entry.get("sha256"):
+        try:
+            if path.stat().st_size == entry["size"]:
+                return entry["sha256"]
+        except (KeyError, OSError):
+            pass
+    return None
+
+
+def _read_for_snapshot(
+    install_folder: Path, name: PurePosixPath, manifest: Dict[str, Dict[str, Any]]
+) -> Optional[Tuple[Dict[str, Any], Optional[bytes]]]:
+    # binaries are immutable and streamed from disk when archived, while other files
+    # may be rewritten at any time and are read once, so that the index matches them
+    path = install_folder.joinpath(name)
+    try:
+        stat = path.stat()
+        if _is_binary(name):
+            digest = _get_known_digest(path, name, manifest) or sha256_file(path)
+            content = None
+        else:
+            import hashlib
+
+            content = path.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+    except FileNotFoundError:
+        # removed since the folder was listed, e.g. by `prune`
+        return None
+
+    entry = {
+        "sha256": digest,
+        "size": stat.st_size if content is None else len(content),
+        "mode": stat.st_mode & 0o777,
+        "mtime": stat.st_mtime,
+    }
+    return entry, content
+
+
+def snapshot(
+    path: Union[Path, str],
+    solcx_binary_path: Optional[Union[Path, str]] = None,
+    include_build: bool = False,
+    max_workers: Optional[int] = None,
+) -> Path:
+    """
+    Pack an installation folder into a single compressed archive.
+
+    The archive contains every installed binary, the install manifest and the
+    cached release metadata. Files are hashed in parallel, reusing the digests
+    in the install manifest where possible.
+
+    Args:
+      path (Union[Path, str]): Archive to create. It is written atomically.
+      solcx_binary_path (Optional[Union[Path, str]]): User-defined path,
+        used to override the default installation directory.
+      include_build (bool): If ``True``, also include the source build folder
+        kept by :func:`~solcx.install.compile_solc`.
+      max_workers (Optional[int]): Maximum number of files hashed concurrently.
+
+    Returns:
+      Path: The archive.
+    """
+    import tarfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    install_folder = install.get_solcx_install_folder(solcx_binary_path)
+    path = Path(path)
+    manifest = read_manifest(install_folder)
+    names = _get_snapshot_files(install_folder, include_build)
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        results = list(
+            executor.map(lambda i: _read_for_snapshot(install_folder, i, manifest), names)
+        )
+    files = {name: result for name, result in zip(names, results) if result is not None}
+    index = {
+        "format": SNAPSHOT_FORMAT,
+        "files": {name.as_posix(): entry for name, (entry, _) in files.items()},
+    }
+
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tarfile.open(temp_path, "w:gz", compresslevel=COMPRESS_LEVEL) as tar:
+            _add_member(tar, INDEX_FILENAME, json.dumps(index).encode(), 0o644, time.time())
+            for name, (entry, content) in files.items():
+                if content is not None:
+                    _add_member(tar, name.as_posix(), content, entry["mode"], entry["mtime"])
+                    continue
+                with install_folder.joinpath(name).open("rb") as fp:
+                    _add_member(tar, name.as_posix(), fp, entry["mode"], entry["mtime"])
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    LOGGER.info(f"Saved {len(files)} files from {install_folder} to {path}")
+    return path
+
+
+def _add_member(
+    tar: Any, name: str, content: Union[bytes, IO[bytes]], mode: int, mtime: float
+) -> None:
+    import tarfile
+
+    info = tarfile.TarInfo(name)
+    info.mode = mode
+    info.mtime = int(mtime)
+    if isinstance(content, bytes):
+        info.size = len(content)
+        tar.addfile(info, BytesIO(content))
+    else:
+        info.size = os.fstat(content.fileno()).st_size
+        tar.addfile(info, content)
+
+
+def _get_restore_path(install_folder: Path, name: str) -> Path:
+    # never write outside of the installation folder
+    posix_name = PurePosixPath(name)
+    if posix_name.is_absolute() or ".." in posix_name.parts or not posix_name.parts:
+        raise SolcInstallationError(f"Invalid path in solcx snapshot: '{name}'")
+    return install_folder.joinpath(*posix_name.parts)
+
+
+def _matches(path: Path, name: PurePosixPath, entry: Dict, manifest: Dict) -> bool:
+    # whether the file on disk already has the digest recorded in the snapshot
+    try:
+        if path.stat().st_size != entry["size"]:
+            return False
+        return (_get_known_digest(path, name, manifest) or sha256_file(path)) == entry["sha256"]
+    except OSError:
+        return False
+
+
+def _restore_file(path: Path, name: PurePosixPath, content: bytes, entry: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    version = _get_version(name)
+    if version is None:
+        install._atomic_install_file(path, content, executable=bool(entry["mode"] & 0o111))
+    else:
+        store = get_solcx_store_folder()
+        # the same lock as installing the version, so concurrent installs are not clobbered
+        with get_process_lock(version):
+            if not (store and link_from_store(store, entry["sha256"], path)):
+                install._atomic_install_file(path, content)
+                if store:
+                    add_to_store(store, path, entry["sha256"], link=True)
+    os.utime(path, (entry["mtime"], entry["mtime"]))
+
+
+def restore(
+    path: Union[Path, str, IO[bytes]],
+    solcx_binary_path: Optional[Union[Path, str]] = None,
+    max_workers: Optional[int] = None,
+) -> List[Path]:
+    """
+    Restore an archive created by :func:`snapshot` into an installation folder.
+
+    The archive is read as a stream. While it is decompressed, files already on
+    disk are compared to the digests in the archive, and are skipped if they
+    match. Every other file is checked against its digest, and then written
+    atomically by a pool of threads. Decompressed files waiting to be written
+    are held in memory up to ``MAX_PENDING_BYTES``. Versions installed in the
+    folder but missing from the archive are kept.
+
+    Args:
+      path (Union[Path, str, IO[bytes]]): Archive, or a binary file object to
+        read it from.
+      solcx_binary_path (Optional[Union[Path, str]]): User-defined path,
+        used to override the default installation directory.
+      max_workers (Optional[int]): Maximum number of files hashed or written
+        concurrently.
+
+    Returns:
+      List: Paths of the files that were written.
+    """
+    import hashlib
+    import tarfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    install_folder = install.get_solcx_install_folder(solcx_binary_path)
+    manifest = read_manifest(install_folder)
+    if isinstance(path, (Path, str)):
+        name, fileobj = str(path), None
+    else:
+        name, fileobj = None, path
+
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    restored = []
+    with tarfile.open(name, "r|gz", fileobj=fileobj) as tar, ThreadPoolExecutor(
+        max_workers
+    ) as executor:
+        member = tar.next()
+        if member is None or member.name != INDEX_FILENAME:
+            raise SolcInstallationError(f"'{path}' is not a solcx snapshot")
+        index = json.load(tar.extractfile(member))  # type: ignore[arg-type]
+        if index.get("format") != SNAPSHOT_FORMAT:
+            raise SolcInstallationError(f"Unsupported solcx snapshot format: {index.get('format')}")
+
+        files: Dict[str, Dict] = index["files"]
+        targets = {i: _get_restore_path(install_folder, i) for i in files}
+        # compare with the files on disk ahead of the stream
+        matches = {
+            i: executor.submit(_matches, targets[i], PurePosixPath(i), files[i], manifest)
+            for i in files
+        }
+
+        # bound the decompressed data held in memory while waiting to be written
+        pending: Deque[Tuple["Future", int]] = deque()
+        pending_bytes = 0
+        snapshot_manifest = None
+        while (member := tar.next()) is not None:
+            if member.name not in files or not member.isfile():
+                raise SolcInstallationError(f"Unexpected entry in solcx snapshot: '{member.name}'")
+            entry = files[member.name]
+            if member.name == MANIFEST_FILENAME:
+                snapshot_manifest = tar.extractfile(member).read()  # type: ignore[union-attr]
+                continue
+            if matches[member.name].result():
+                continue
+
+            while pending and pending_bytes + member.size > MAX_PENDING_BYTES:
+                future, size = pending.popleft()
+                future.result()
+                pending_bytes -= size
+
+            content = tar.extractfile(member).read()  # type: ignore[union-attr]
+            if hashlib.sha256(content).hexdigest() != entry["sha256"]:
+                raise SolcInstallationError(f"Corrupt entry in solcx snapshot: '{member.name}'")
+
+            target = targets[member.name]
+            future = executor.submit(
+                _restore_file, target, PurePosixPath(member.name), content, entry
+            )
+            pending.append((future, len(content)))
+            pending_bytes += len(content)
+            restored.append(target)
+
+        for future, _ in pending:
+            future.result()
+
+    # the manifest is merged rather than replaced, to keep the entries of versions
+    # that were installed locally but are not part of the snapshot
+    if snapshot_manifest is not None:
+        for version, entry in json.loads(snapshot_manifest).items():
+            if manifest.get(version) != entry:
+                update_manifest(install_folder, version, entry)
+
+    LOGGER.info(f"Restored {len(restored)} of {len(files)} files from {path} to {install_folder}")
+    return restored
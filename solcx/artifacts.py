@@ -0,0 +1,133 @@
+"""
+Per-contract artifact files, written from compiler output.
+
+Each output of each contract, such as its ABI or bytecode, is written to its own
+file, in a folder named after the source file that defines the contract. Files
+are written in parallel by a bounded pool of I/O threads, each one atomically via
+a temporary file that replaces it. Files that already have the same content are
+left untouched, so that tools which compare modification times do not redo work
+for unchanged artifacts.
+"""
+import json
+import os
+import re
+import threading
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Union
+
+from solcx.utils import instrument
+
+# number of I/O threads used to write artifacts, if not given
+DEFAULT_IO_WORKERS = 8
+# file name of the AST of a source, in the folder of its contracts
+AST_FILENAME = "ast.json"
+
+# characters that are not allowed in file names on Windows, e.g. in `<stdin>`
+INVALID_CHARACTERS_REGEX = re.compile(r'[<>:"|?*]')
+
+
+def get_source_folder(artifacts_dir: Union[Path, str], source: str) -> Path:
+    """
+    Return the folder that the artifacts of the contracts in a source file are
+    written to.
+
+    The folder has the path of the source within ``artifacts_dir``, without any
+    root or drive, e.g. ``/home/user/contracts/Foo.sol`` is written to
+    ``<artifacts_dir>/home/user/contracts/Foo.sol/``.
+    """
+    parts = [
+        INVALID_CHARACTERS_REGEX.sub("_", i)
+        for i in PurePosixPath(source.replace("\\", "/")).parts
+        if i not in ("/", ".", "..")
+    ]
+    return Path(artifacts_dir).joinpath(*parts)
+
+
+def _encode(value: Any) -> bytes:
+    # bytecode, metadata and other string outputs are written as given
+    if isinstance(value, str):
+        return value.encode()
+    return json.dumps(value, sort_keys=True).encode()
+
+
+def get_artifacts(contracts: Dict, artifacts_dir: Union[Path, str]) -> Dict[Path, bytes]:
+    """
+    Return the content of each artifact file for a compiler output.
+
+    Args:
+      contracts (Dict): Compiler output, as returned by
+        :func:`~solcx.main.compile_files`, keyed by ``"<source>:<contract>"``.
+      artifacts_dir (Union[Path, str]): Folder that artifacts are written to.
+
+    Returns:
+      Dict: Content of each file, keyed by path. Outputs are written to
+      ``<contract>.<output>``, e.g. ``Foo.abi`` and ``Foo.bin``, and the AST of
+      each source to ``ast.json``.
+    """
+    artifacts = {}
+    for key, data in contracts.items():
+        source, name = key.rsplit(":", maxsplit=1)
+        folder = get_source_folder(artifacts_dir, source)
+        for output, value in data.items():
+            # the AST is given for every contract, but is the same for the whole source
+            path = folder.joinpath(AST_FILENAME if output == "ast" else f"{name}.{output}")
+            artifacts[path] = _encode(value)
+    return artifacts
+
+
+def write_file(path: Path, content: bytes) -> bool:
+    """
+    Write a file atomically, unless it already has the given content.
+
+    Returns:
+      bool: ``True`` if the file was written.
+    """
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except OSError:
+        pass
+
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def write_artifacts(
+    contracts: Dict, artifacts_dir: Union[Path, str], max_workers: Optional[int] = None
+) -> List[Path]:
+    """
+    Write per-contract artifact files for a compiler output.
+
+    See :func:`get_artifacts` for the layout of the files. Files that already
+    exist with the same content are not modified.
+
+    Args:
+      contracts (Dict): Compiler output, as returned by
+        :func:`~solcx.main.compile_files`.
+      artifacts_dir (Union[Path, str]): Folder to write artifacts to.
+      max_workers (Optional[int]): Maximum number of files written concurrently.
+
+    Returns:
+      List: Paths of the files that were written, i.e. that were new or changed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with instrument.span("write.artifacts") as span:
+        artifacts = get_artifacts(contracts, artifacts_dir)
+        for folder in set(i.parent for i in artifacts):
+            folder.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(
+            max_workers or DEFAULT_IO_WORKERS, thread_name_prefix="solcx-artifacts"
+        ) as executor:
+            written = list(executor.map(write_file, artifacts, artifacts.values()))
+
+        changed = [path for path, is_written in zip(artifacts, written) if is_written]
+        span.set(files=len(artifacts), written=len(changed))
+    return changed
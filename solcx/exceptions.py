@@ -1,18 +1,46 @@
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from solcx.utils.rusage import ResourceUsage
+
+
+class _Payload:
+    # attribute that may be given a callable, which is called each time it is read,
+    # so that large payloads are only loaded on demand and not kept in memory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj, self.name)
+        return value() if callable(value) else value
+
+    def __set__(self, obj: Any, value: Optional[Union[str, Callable[[], str]]]) -> None:
+        setattr(obj, self.name, value)
 
 
 class SolcError(Exception):
     message = "An error occurred during execution"
 
+    stdin_data = _Payload()
+    stdout_data = _Payload()
+    stderr_data = _Payload()
+    _stdin_data: Optional[Union[str, Callable[[], str]]]
+    _stdout_data: Optional[Union[str, Callable[[], str]]]
+    _stderr_data: Optional[Union[str, Callable[[], str]]]
+
     def __init__(
         self,
         message: Optional[str] = None,
         command: Optional[List[str]] = None,
         return_code: Optional[int] = None,
-        stdin_data: Optional[str] = None,
+        stdin_data: Optional[Union[str, Callable[[], str]]] = None,
         stdout_data: Optional[str] = None,
         stderr_data: Optional[str] = None,
         error_dict: Optional[Dict] = None,
+        rusage: Optional["ResourceUsage"] = None,
     ) -> None:
         if message is not None:
             self.message = message
@@ -22,6 +50,31 @@ class SolcError(Exception):
         self.stderr_data = stderr_data
         self.stdout_data = stdout_data
         self.error_dict = error_dict
+        self.rusage = rusage
+
+    def spill(self, threshold: int = 0) -> None:
+        """
+        Move ``stdin_data``, ``stdout_data`` and ``stderr_data`` to temporary files
+        on disk, so that keeping the error does not keep them in memory. They are
+        read back each time they are accessed.
+
+        Args:
+          threshold (int): Payloads of up to this many characters are kept in memory.
+        """
+        from solcx.utils.spool import SpilledText
+
+        for name in ("_stdin_data", "_stdout_data", "_stderr_data"):
+            value = getattr(self, name)
+            if value is None or isinstance(value, SpilledText):
+                continue
+            if callable(value):
+                value = value()
+            setattr(self, name, SpilledText(value) if len(value) > threshold else value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # payloads given as callables are read, as they cannot be pickled
+        state = {k: v() if callable(v) else v for k, v in vars(self).items()}
+        return type(self), self.args, state
 
     def __str__(self) -> str:
         return (
@@ -67,5 +120,13 @@ class DownloadError(Exception):
     pass
 
 
+class ChecksumError(DownloadError):
+    pass
+
+
+class LockTimeoutError(TimeoutError):
+    pass
+
+
 class UnexpectedVersionWarning(Warning):
     pass
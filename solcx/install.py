@@ -1,7 +1,8 @@
 """
 Install solc
 """
-import argparse
+import io
+import json
 import logging
 import os
 import re
@@ -9,22 +10,31 @@ import shutil
 import stat
 import subprocess
 import sys
-import tarfile
-import tempfile
+import threading
 import time
 import warnings
-import zipfile
 from base64 import b64encode
-from io import BytesIO
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+from urllib.parse import urlparse
 
-import requests
-from packaging.specifiers import SpecifierSet
 from packaging.version import InvalidVersion, Version
 
 from solcx import wrapper
 from solcx.exceptions import (
+    ChecksumError,
     DownloadError,
     SolcInstallationError,
     SolcNotInstalled,
@@ -32,7 +42,22 @@ from solcx.exceptions import (
     UnexpectedVersionWarning,
     UnsupportedVersionError,
 )
+from solcx.utils import instrument, registry
 from solcx.utils.lock import get_process_lock
+from solcx.utils.manifest import get_manifest_entry, update_manifest
+from solcx.utils.releases import get_github_releases
+from solcx.utils.store import (
+    add_to_store,
+    gc_store,
+    get_solcx_store_folder,
+    link_from_store,
+    link_or_copy,
+    sha256_file,
+)
+from solcx.utils.usage import get_last_used, record_usage, remove_usage
+
+if TYPE_CHECKING:
+    import hashlib
 
 try:
     from tqdm import tqdm  # type: ignore[import-untyped]
@@ -44,12 +69,27 @@ BINARY_DOWNLOAD_BASE = "https://binaries.soliditylang.org/{}-amd64/{}"
 SOURCE_DOWNLOAD_BASE = "https://github.com/ethereum/solidity/releases/download/v{}/{}"
 GITHUB_RELEASES = "https://api.github.com/repos/ethereum/solidity/releases?per_page=100"
 
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
 MINIMAL_SOLC_VERSION = Version("0.4.11")
 LOGGER = logging.getLogger("solcx")
+PRAGMA_COMPARATOR_REGEX = re.compile(r"(([<>]?=?|\^)\d+\.\d+\.\d+)")
 
 SOLCX_BINARY_PATH_VARIABLE = "SOLCX_BINARY_PATH"
+SOLCX_BINARY_MIRRORS_VARIABLE = "SOLCX_BINARY_MIRRORS"
+SOLCX_SOURCE_MIRRORS_VARIABLE = "SOLCX_SOURCE_MIRRORS"
+SOLCX_COMPILER_LAUNCHER_VARIABLE = "SOLCX_COMPILER_LAUNCHER"
+
+# from-source builds are kept within the installation folder
+BUILD_FOLDER = ".build"
+SOURCE_MARKER = ".solcx-extracted"
+RELEASE_CACHE_FILENAME = ".solcx-releases.json"
 
 _default_solc_binary = None
+_default_solc_binary_resolved = False
+_created_install_folders: Set[Path] = set()
+_binary_mirrors: Optional[List[str]] = None
+_source_mirrors: Optional[List[str]] = None
 
 
 def _get_os_name() -> str:
@@ -67,6 +107,8 @@ def _convert_and_validate_version(version: Union[str, Version]) -> Version:
     # validate the value, and return a Version object
     if not isinstance(version, Version):
         version = Version(version.lstrip("v"))
+    from packaging.specifiers import SpecifierSet
+
     if version not in SpecifierSet(">=0.4.11"):
         raise UnsupportedVersionError("py-solc-x does not support solc versions <0.4.11")
     return version
@@ -76,6 +118,189 @@ def _unlink_solc(solc_path: Path) -> None:
     solc_path.unlink()
     if _get_os_name() == "windows":
         shutil.rmtree(solc_path.parent)
+        solc_path = solc_path.parent
+    if solc_path.name.startswith("solc-v"):
+        update_manifest(solc_path.parent, solc_path.name[6:], None)
+
+
+def _get_partial_path(path: Path) -> Path:
+    # the leading dot hides partially written installs from `get_installed_solc_versions`
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.partial")
+
+
+def _atomic_install_file(
+    path: Path,
+    content: Optional[bytes] = None,
+    source: Optional[Path] = None,
+    link: bool = False,
+    executable: bool = True,
+) -> None:
+    # write `content` (or a copy of `source`) to a temporary file alongside `path`,
+    # and only rename it into place once it is complete, synced and executable.
+    # With `link`, `source` is hardlinked or reflinked rather than copied if possible.
+    temp_path = _get_partial_path(path)
+    try:
+        if source is not None and link:
+            # a hardlink shares the inode of `source`, which may not be writable
+            link_or_copy(source, temp_path)
+        else:
+            if source is not None:
+                shutil.copyfile(source, temp_path)
+            with temp_path.open("ab") as fp:
+                if content is not None:
+                    fp.write(content)
+                fp.flush()
+                os.fsync(fp.fileno())
+            if executable:
+                temp_path.chmod(temp_path.stat().st_mode | stat.S_IEXEC)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _as_mirror_base(mirror: Union[Path, str]) -> str:
+    # mirrors may be given as http(s) or file URLs, or as plain local directories
+    mirror = str(mirror)
+    if len(urlparse(mirror).scheme) < 2:
+        # no scheme, or a windows drive letter
+        return Path(mirror).expanduser().resolve().as_uri()
+    return mirror.rstrip("/")
+
+
+def _split_mirrors(value: str) -> List[str]:
+    return [i.strip() for i in value.split(",") if i.strip()]
+
+
+def set_binary_mirrors(mirrors: Optional[Sequence[Union[Path, str]]]) -> None:
+    """
+    Set the mirrors used to download precompiled ``solc`` binaries.
+
+    Each mirror must follow the layout of https://binaries.soliditylang.org, i.e.
+    ``<mirror>/<os>-amd64/list.json`` alongside the binaries that it lists.
+    Mirrors are tried in the given order, falling back to the next one when a
+    download fails. A mirror directory can be populated with
+    :func:`sync_binary_mirror`.
+
+    Args:
+      mirrors (Optional[Sequence[Union[Path, str]]]): http(s) URLs, ``file://``
+        URLs or local directories. If ``None``, the ``SOLCX_BINARY_MIRRORS``
+        environment variable (comma-separated) is used, falling back to
+        https://binaries.soliditylang.org.
+    """
+    global _binary_mirrors
+    _binary_mirrors = None if mirrors is None else [_as_mirror_base(i) for i in mirrors]
+
+
+def set_source_mirrors(mirrors: Optional[Sequence[Union[Path, str]]]) -> None:
+    """
+    Set the mirrors used to download ``solc`` source code for :func:`compile_solc`.
+
+    Each mirror must follow the layout of GitHub release downloads, i.e.
+    ``<mirror>/v<version>/solidity_<version>.tar.gz``.
+
+    Args:
+      mirrors (Optional[Sequence[Union[Path, str]]]): http(s) URLs, ``file://``
+        URLs or local directories. If ``None``, the ``SOLCX_SOURCE_MIRRORS``
+        environment variable (comma-separated) is used, falling back to GitHub.
+    """
+    global _source_mirrors
+    _source_mirrors = None if mirrors is None else [_as_mirror_base(i) for i in mirrors]
+
+
+def get_binary_mirrors() -> List[str]:
+    """
+    Return URL templates for each configured binary mirror, in order of preference.
+
+    Templates are formatted with the OS name and the filename, in the same way as
+    ``BINARY_DOWNLOAD_BASE``.
+
+    Returns:
+      List: URL templates.
+    """
+    mirrors = _binary_mirrors
+    if mirrors is None and os.getenv(SOLCX_BINARY_MIRRORS_VARIABLE):
+        mirrors = [
+            _as_mirror_base(i) for i in _split_mirrors(os.environ[SOLCX_BINARY_MIRRORS_VARIABLE])
+        ]
+    if not mirrors:
+        return [BINARY_DOWNLOAD_BASE]
+    return [f"{i}/{{}}-amd64/{{}}" for i in mirrors]
+
+
+def get_source_mirrors() -> List[str]:
+    """
+    Return URL templates for each configured source mirror, in order of preference.
+
+    Templates are formatted with the version and the filename, in the same way as
+    ``SOURCE_DOWNLOAD_BASE``.
+
+    Returns:
+      List: URL templates.
+    """
+    mirrors = _source_mirrors
+    if mirrors is None and os.getenv(SOLCX_SOURCE_MIRRORS_VARIABLE):
+        mirrors = [
+            _as_mirror_base(i) for i in _split_mirrors(os.environ[SOLCX_SOURCE_MIRRORS_VARIABLE])
+        ]
+    if not mirrors:
+        return [SOURCE_DOWNLOAD_BASE]
+    return [f"{i}/v{{}}/{{}}" for i in mirrors]
+
+
+def _local_path_from_url(url: str) -> Optional[Path]:
+    parsed = urlparse(url)
+    if parsed.scheme != "file":
+        return None
+
+    from urllib.request import url2pathname
+
+    return Path(url2pathname(parsed.netloc + parsed.path))
+
+
+def _get_binary_list(templates: Optional[List[str]] = None, os_name: Optional[str] = None) -> Dict:
+    # fetch `list.json` from the first mirror that returns a valid response
+    import requests
+
+    if templates is None:
+        templates = get_binary_mirrors()
+
+    exc: Exception = ConnectionError("No binary mirrors are configured")
+    for template in templates:
+        url = template.format(os_name or _get_os_name(), "list.json")
+        try:
+            if path := _local_path_from_url(url):
+                with path.open() as fp:
+                    return json.load(fp)
+
+            data = requests.get(url)
+            if data.status_code != 200:
+                raise ConnectionError(f"Status {data.status_code} when getting {url}")
+            return data.json()
+        except (OSError, ValueError) as e:
+            LOGGER.warning(f"Unable to get solc versions from {url}: {e}")
+            exc = e
+
+    raise exc
+
+
+def _download_from_mirrors(
+    templates: List[str], *args: str, show_progress: bool, sha256: Optional[str] = None
+) -> bytes:
+    # download a file from the first mirror that has it, with a matching digest
+    exc: Exception = DownloadError("No mirrors are configured")
+    for template in templates:
+        url = template.format(*args)
+        try:
+            with instrument.span("install.download", url=url) as span:
+                content = _download_solc(url, show_progress, sha256=sha256)
+                span.set(bytes=len(content))
+            return content
+        except (OSError, DownloadError) as e:
+            LOGGER.warning(f"{e}")
+            exc = e
+
+    raise exc
 
 
 def get_solcx_install_folder(solcx_binary_path: Optional[Union[Path, str]] = None) -> Path:
@@ -97,7 +322,9 @@ def get_solcx_install_folder(solcx_binary_path: Optional[Union[Path, str]] = Non
         return Path(solcx_binary_path)
     else:
         path = Path.home().joinpath(".solcx")
-        path.mkdir(exist_ok=True)
+        if path not in _created_install_folders:
+            path.mkdir(exist_ok=True)
+            _created_install_folders.add(path)
         return path
 
 
@@ -112,6 +339,10 @@ def import_installed_solc(solcx_binary_path: Optional[Union[Path, str]] = None)
     Search for and copy installed ``solc`` versions into the local installation
     folder.
 
+    Candidates are hashed and probed concurrently, and binaries with identical
+    content are only probed once. Imported binaries are hardlinked or reflinked
+    where possible instead of being copied.
+
     Args:
       solcx_binary_path (Optional[Union[Path, str]]): User-defined path, used to
         override the default installation directory.
@@ -119,50 +350,76 @@ def import_installed_solc(solcx_binary_path: Optional[Union[Path, str]] = None)
     Returns:
       List: Imported solc versions
     """
-    path_list = []
-    if solc_in_path := _get_which_solc():
-        path_list.append(solc_in_path)
-
-    # on OSX, also copy all versions of solc from cellar
-    if _get_os_name() == "macosx":
-        path_list.extend(Path("/usr/local/Cellar").glob("solidity*/**/solc"))
+    from concurrent.futures import ThreadPoolExecutor
 
+    path_list = _get_import_candidates()
     imported_versions = []
     solcx_binary_path = get_solcx_install_folder(solcx_binary_path=solcx_binary_path)
-    installed_versions = get_installed_solc_versions(solcx_binary_path=solcx_binary_path)
-
-    for path in path_list:
-        try:
-            version = wrapper.get_solc_version(path)
-        except Exception:
-            continue
+    installed_versions = set(get_installed_solc_versions(solcx_binary_path=solcx_binary_path))
+
+    with ThreadPoolExecutor() as executor:
+        # identical binaries, e.g. a symlink on PATH into the cellar, are only probed once
+        candidates: Dict[str, Path] = {}
+        for path, digest in zip(path_list, executor.map(_try_sha256_file, path_list)):
+            if digest is not None:
+                candidates.setdefault(digest, path)
+        probed = list(
+            zip(candidates.items(), executor.map(_try_get_solc_version, candidates.values()))
+        )
 
-        if version in installed_versions:
-            # Already installed.
+    for (digest, path), version in probed:
+        if version is None or version in installed_versions:
             continue
 
-        base_path = get_solcx_install_folder(solcx_binary_path)
-        copy_path = base_path.joinpath(f"solc-v{version.base_version}")
+        copy_path = solcx_binary_path.joinpath(f"solc-v{version.base_version}")
         if _get_os_name() == "windows":
             copy_path.mkdir()
             copy_path = copy_path.joinpath("solc.exe")
 
-        shutil.copy(path, copy_path)
+        store = get_solcx_store_folder()
+        if store:
+            add_to_store(store, path, digest)
+        # the entry may have been removed by `gc_store` in another process since
+        if not store or not link_from_store(store, digest, copy_path):
+            _atomic_install_file(copy_path, source=path, link=True)
 
-        try:
-            version_check = wrapper.get_solc_version(copy_path)
-        except Exception:
+        # a copy with the probed digest is the binary that was already executed
+        if sha256_file(copy_path) != digest and _try_get_solc_version(copy_path) != version:
             _unlink_solc(copy_path)
+            continue
 
-        else:
-            if version != version_check:
-                _unlink_solc(copy_path)
-            else:
-                imported_versions.append(version)
+        _record_install(version, path.as_posix(), solcx_binary_path, digest, verified=False)
+        installed_versions.add(version)
+        imported_versions.append(version)
 
     return imported_versions
 
 
+def _get_import_candidates() -> List[Path]:
+    path_list = []
+    if solc_in_path := _get_which_solc():
+        path_list.append(solc_in_path)
+
+    # on OSX, also copy all versions of solc from cellar
+    if _get_os_name() == "macosx":
+        path_list.extend(Path("/usr/local/Cellar").glob("solidity*/**/solc"))
+    return path_list
+
+
+def _try_sha256_file(path: Path) -> Optional[str]:
+    try:
+        return sha256_file(path)
+    except OSError:
+        return None
+
+
+def _try_get_solc_version(path: Path) -> Optional[Version]:
+    try:
+        return wrapper.get_solc_version(path)
+    except Exception:
+        return None
+
+
 def get_executable(
     version: Optional[Union[str, Version]] = None,
     solcx_binary_path: Optional[Union[Path, str]] = None,
@@ -181,6 +438,7 @@ def get_executable(
     """
     if not version:
         if binary := get_default_solc_binary():
+            _record_usage(binary)
             return binary
 
         raise SolcNotInstalled(
@@ -189,21 +447,64 @@ def get_executable(
         )
 
     version = _convert_and_validate_version(version)
-    solc_bin = get_solcx_install_folder(solcx_binary_path).joinpath(f"solc-v{version.base_version}")
-    if _get_os_name() == "windows":
-        solc_bin = solc_bin.joinpath("solc.exe")
-    if not solc_bin.exists():
+    install_folder = get_solcx_install_folder(solcx_binary_path)
+    entry = registry.get_installed_entry(install_folder, Version(version.base_version))
+    if entry is None and _wait_for_prefetch(install_folder, version):
+        entry = registry.get_installed_entry(install_folder, Version(version.base_version))
+    if entry is None:
         raise SolcNotInstalled(
             f"solc {version.base_version} has not been installed."
             f" Use solcx.install_solc('{version.base_version}') to install."
         )
-    return solc_bin
+    record_usage(install_folder, str(entry.version))
+    return entry.path
+
 
+def _wait_for_prefetch(install_folder: Path, version: Version) -> bool:
+    from solcx.prefetcher import wait_for_prefetch
+
+    return wait_for_prefetch(install_folder, Version(version.base_version))
+
+
+def _get_install_entry(solc_path: Path) -> Optional[Path]:
+    # return the `solc-v*` entry of the install folder that holds a binary, or `None`
+    # if the binary was not installed by solcx
+    if sys.platform == "win32":
+        solc_path = solc_path.parent
+    return solc_path if solc_path.name.startswith("solc-v") else None
 
-def get_default_solc_binary():
+
+def _record_usage(solc_path: Path) -> None:
+    # record a use of the default binary, if it was installed by solcx
+    if entry := _get_install_entry(solc_path):
+        record_usage(entry.parent, entry.name[6:])
+
+
+def get_default_solc_binary() -> Optional[Path]:
+    # the default is resolved on first use rather than at import time, so that
+    # importing solcx does not search $PATH or touch the installation folder
+    global _default_solc_binary, _default_solc_binary_resolved
+    if not _default_solc_binary_resolved:
+        _default_solc_binary_resolved = True
+        if _default_solc_binary is None:
+            _default_solc_binary = _find_default_solc_binary()
     return _default_solc_binary
 
 
+def _find_default_solc_binary() -> Optional[Path]:
+    # try to use the result of `which`/`where` as the default
+    try:
+        if path := _get_which_solc():
+            return path
+    except Exception:
+        pass
+
+    # if not available, use the most recent solcx installed version
+    if installed := get_installed_solc_versions():
+        return get_executable(installed[0])
+    return None
+
+
 def set_solc_version(
     version: Union[str, Version],
     silent: bool = False,
@@ -221,12 +522,30 @@ def set_solc_version(
         used to override the default installation directory.
     """
     version = _convert_and_validate_version(version)
-    global _default_solc_binary
+    global _default_solc_binary, _default_solc_binary_resolved
     _default_solc_binary = get_executable(version, solcx_binary_path)
+    _default_solc_binary_resolved = True
     if not silent:
         LOGGER.info(f"Using solc version {version}")
 
 
+def _as_spec(item: str) -> str:
+    ret = item.replace("^", "~=")
+
+    if ret and ret[0].isnumeric():
+        return f"=={ret}"
+
+    elif ret and len(ret) >= 2 and ret[0] == "=" and ret[1] != "=":
+        return f"={ret}"
+
+    return ret
+
+
+def _get_pragma_specs(comparator_set: str) -> List[str]:
+    # convert one `||`-separated branch of a pragma into PEP 440 specifiers
+    return [_as_spec(i[0]) for i in PRAGMA_COMPARATOR_REGEX.findall(comparator_set)]
+
+
 def select_pragma_version(pragma_string: str, version_list: List[Version]) -> Optional[Version]:
     """
     Get a matching version from the given pragma string and a version list.
@@ -238,24 +557,13 @@ def select_pragma_version(pragma_string: str, version_list: List[Version]) -> Op
     Returns:
         Optional[Version]: A selected version from the given list.
     """
+    from packaging.specifiers import SpecifierSet
 
     comparator_set_range = pragma_string.replace(" ", "").split("||")
-    comparator_regex = re.compile(r"(([<>]?=?|\^)\d+\.\d+\.\d+)")
     version = None
 
-    def _as_spec(item: str) -> str:
-        ret = item.replace("^", "~=")
-
-        if ret and ret[0].isnumeric():
-            return f"=={ret}"
-
-        elif ret and len(ret) >= 2 and ret[0] == "=" and ret[1] != "=":
-            return f"={ret}"
-
-        return ret
-
     for comparator_set in comparator_set_range:
-        specs = ",".join([_as_spec(i[0]) for i in comparator_regex.findall(comparator_set)])
+        specs = ",".join(_get_pragma_specs(comparator_set))
         spec = SpecifierSet(specs)
         matching = sorted(list(spec.filter(version_list)), reverse=True)
         selected = matching[0] if matching else None
@@ -344,12 +652,11 @@ def get_installable_solc_versions() -> List[Version]:
     Returns:
       List: List of Versions objects of installable ``solc`` versions.
     """
-    data = requests.get(BINARY_DOWNLOAD_BASE.format(_get_os_name(), "list.json"))
-    if data.status_code != 200:
-        raise ConnectionError(
-            f"Status {data.status_code} when getting solc versions from binaries.soliditylang.org"
-        )
-    version_list = sorted((Version(i) for i in data.json()["releases"]), reverse=True)
+    return _get_installable_versions(_get_binary_list())
+
+
+def _get_installable_versions(binary_list: Dict) -> List[Version]:
+    version_list = sorted((Version(i) for i in binary_list["releases"]), reverse=True)
     version_list = [i for i in version_list if i >= MINIMAL_SOLC_VERSION]
     return version_list
 
@@ -360,11 +667,14 @@ def get_compilable_solc_versions(
     """
     Return a list of all ``solc`` versions that can be compiled from source by py-solc-x.
 
+    Release metadata is cached in the installation folder, and only revalidated
+    with Github once the ``SOLCX_RELEASE_CACHE_TTL`` (default one hour) expires.
+
     Args:
       headers (Optional[Dict]): Headers to include in the request to Github.
-      rate_limit_wait_time (float): A value to use when waiting for rate-limiting.
-        Defaults to 3.0 but will increment to the value plus it's half for the
-        subsequent call.
+      rate_limit_wait_time (float): A value to use when waiting for rate-limiting,
+        if Github does not give a reset time. Defaults to 3.0 but will increment
+        to the value plus it's half for each retry.
 
     Returns:
       List: List of Versions objects of installable `solc` versions.
@@ -379,37 +689,20 @@ def get_compilable_solc_versions(
         auth = b64encode(os.environ["GITHUB_TOKEN"].encode()).decode()
         headers = {"Authorization": f"Basic {auth}"}
 
-    data = requests.get(GITHUB_RELEASES, headers=headers)
-    if data.status_code != 200:
-        msg = (
-            f"Status {data.status_code} when getting solc versions from Github:"
-            f" '{data.json()['message']}'"
-        )
-        if data.status_code == 403:
-            msg += (
-                "\n\nIf this issue persists, generate a Github API token and store"
-                " it as the environment variable `GITHUB_TOKEN`:\n"
-                "https://github.blog/2013-05-16-personal-api-tokens/"
-            )
-            LOGGER.warning(msg)
-
-            # Wait and retry
-            time.sleep(rate_limit_wait_time)
-            return get_compilable_solc_versions(
-                headers, rate_limit_wait_time=rate_limit_wait_time + (rate_limit_wait_time / 2)
-            )
-
-        raise ConnectionError(msg)
-
-    for release in data.json():
+    releases = get_github_releases(
+        GITHUB_RELEASES,
+        get_solcx_install_folder().joinpath(RELEASE_CACHE_FILENAME),
+        headers,
+        rate_limit_wait_time=rate_limit_wait_time,
+    )
+    for release in releases:
         try:
             version = Version(release["tag_name"].lstrip("v"))
         except InvalidVersion:
             # ignore non-standard releases (e.g. the 0.8.x preview)
             continue
 
-        asset = next((i for i in release["assets"] if re.match(pattern, i["name"])), False)
-        if asset:
+        if any(re.match(pattern, i) for i in release["assets"]):
             version_list.append(version)
         if version == MINIMAL_SOLC_VERSION:
             break
@@ -430,7 +723,7 @@ def get_installed_solc_versions(
       List: List of Version objects of installed ``solc`` versions.
     """
     install_path = get_solcx_install_folder(solcx_binary_path=solcx_binary_path)
-    return sorted([Version(i.name[6:]) for i in install_path.glob("solc-v*")], reverse=True)
+    return sorted(registry.get_installed(install_path), reverse=True)
 
 
 def install_solc(
@@ -458,59 +751,102 @@ def install_solc(
         if version == "latest"
         else _convert_and_validate_version(version)
     )
-
+    # a version that is being prefetched is waited for, rather than downloaded again
+    install_folder = get_solcx_install_folder(solcx_binary_path)
+    if _is_already_installed(version, solcx_binary_path):
+        _log_already_installed(version, solcx_binary_path)
+        return version
+    _wait_for_prefetch(install_folder, version)
+    return _install_solc(version, show_progress, solcx_binary_path)
+
+
+def _install_solc(
+    version: Version,
+    show_progress: bool,
+    solcx_binary_path: Union[Path, str, None],
+    binary_list: Optional[Dict] = None,
+) -> Version:
+    # `binary_list` may be given when installing many versions, so that
+    # `list.json` is only fetched once
     os_name = _get_os_name()
-    process_lock = get_process_lock(str(version))
 
-    with process_lock:
-        if _check_for_installed_version(version, solcx_binary_path):
-            path = get_solcx_install_folder(solcx_binary_path=solcx_binary_path).joinpath(
-                f"solc-v{version}"
-            )
-            LOGGER.info(f"solc {version} already installed at: {path}")
-            return version
+    # installs are atomic, and only hold the lock of the version while moving the
+    # downloaded binary into place, see `_commit_install`
+    if _is_already_installed(version, solcx_binary_path):
+        return version
 
-        data = requests.get(BINARY_DOWNLOAD_BASE.format(_get_os_name(), "list.json"))
-        if data.status_code != 200:
-            raise ConnectionError(
-                f"Status {data.status_code} when getting versions from binaries.soliditylang.org"
-            )
-        try:
-            filename = data.json()["releases"][str(version)]
-        except KeyError:
-            raise SolcInstallationError(f"Solc binary for v{version} is not available for this OS")
+    if binary_list is None:
+        binary_list = _get_binary_list()
+    try:
+        filename = binary_list["releases"][str(version)]
+    except KeyError:
+        raise SolcInstallationError(f"Solc binary for v{version} is not available for this OS")
+    sha256 = _get_build_sha256(binary_list, filename)
+
+    if os_name in ("linux", "macosx"):
+        _install_solc_unix(
+            version, filename, show_progress, solcx_binary_path=solcx_binary_path, sha256=sha256
+        )
+    elif os_name == "windows":
+        _install_solc_windows(
+            version, filename, show_progress, solcx_binary_path=solcx_binary_path, sha256=sha256
+        )
 
-        if os_name in ("linux", "macosx"):
-            _install_solc_unix(
-                version, filename, show_progress, solcx_binary_path=solcx_binary_path
-            )
-        elif os_name == "windows":
-            _install_solc_windows(
-                version, filename, show_progress, solcx_binary_path=solcx_binary_path
+    base_version = version if isinstance(version, str) else version.base_version
+    try:
+        _validate_installation(Version(base_version), solcx_binary_path=solcx_binary_path)
+    except SolcInstallationError as exc:
+        if os_name != "windows":
+            exc.args = (
+                f"{exc.args[0]} If this issue persists, you can try to compile from "
+                f"source code using `solcx.compile_solc('{version}')`.",
             )
-
-        base_version = version if isinstance(version, str) else version.base_version
-        try:
-            _validate_installation(Version(base_version), solcx_binary_path=solcx_binary_path)
-        except SolcInstallationError as exc:
-            if os_name != "windows":
-                exc.args = (
-                    f"{exc.args[0]} If this issue persists, you can try to compile from "
-                    f"source code using `solcx.compile_solc('{version}')`.",
-                )
-            raise exc
+        raise exc
 
     return version
 
 
+def _commit_install(
+    version: Version,
+    temp_path: Path,
+    install_path: Path,
+    source: str,
+    solcx_binary_path: Union[Path, str, None],
+    sha256: Optional[str] = None,
+) -> None:
+    # move a binary (or on Windows, a folder) that was downloaded or built under a
+    # temporary name into place. Only this step holds the exclusive lock of the
+    # version, so that compiles with an installed binary never wait for a download
+    # or build, and an install never replaces a binary while it is running.
+    try:
+        with get_process_lock(str(version)):
+            # another process may have installed the version in the meantime
+            if not install_path.exists():
+                os.replace(temp_path, install_path)
+                _record_install(version, source, solcx_binary_path, sha256)
+    finally:
+        if temp_path.is_dir():
+            shutil.rmtree(temp_path, ignore_errors=True)
+        else:
+            temp_path.unlink(missing_ok=True)
+
+
 def compile_solc(
     version: Optional[Union[str, Version]] = None,
     show_progress: bool = False,
     solcx_binary_path: Optional[Union[Path, str]] = None,
+    jobs: Optional[int] = None,
+    compiler_launcher: Optional[str] = None,
+    keep_build: bool = False,
 ) -> Version:
     """
     Install a version of `solc` by downloading and compiling source code.
 
+    Sources are built in ``.build/solidity_<version>`` within the installation
+    folder. With ``keep_build``, the build directory is kept, so rebuilding a
+    version is incremental and does not download the source again. Different
+    versions may be built at the same time.
+
     Args:
         version (Union[str, Version]): Version of `solc` to install.
           Use literal ``"latest"`` or ``None`` to install the latest version.
@@ -519,6 +855,14 @@ def compile_solc(
           Requires installing the `tqdm` package.
         solcx_binary_path (Optional[Union[Path, str]]): User-defined path, used to
           override the default installation directory.
+        jobs (Optional[int]): Number of parallel build jobs. Defaults to the
+          number of CPUs.
+        compiler_launcher (Optional[str]): Compiler launcher such as ``ccache``.
+          Defaults to the ``SOLCX_COMPILER_LAUNCHER`` environment variable, or to
+          ``ccache`` if it is installed. Use an empty string to disable.
+        keep_build (bool): If ``True``, keep the build directory after a
+          successful install. It takes several GB, and is not removed by
+          :func:`prune`. Defaults to ``False``.
 
     Returns:
         Version: The version of the compiler installed.
@@ -536,47 +880,45 @@ def compile_solc(
         # Shouldn't get here - but is for type-check.
         raise ValueError(version)
 
-    process_lock = get_process_lock(str(solc_version))
+    if _is_already_installed(solc_version, solcx_binary_path):
+        _log_already_installed(solc_version, solcx_binary_path)
+        return solc_version
 
-    with process_lock:
-        if _check_for_installed_version(solc_version, solcx_binary_path):
-            path = get_solcx_install_folder(solcx_binary_path).joinpath(
-                f"solc-v{solc_version.base_version}"
-            )
-            LOGGER.info(f"solc {solc_version.base_version} already installed at: {path}")
+    # builds of a version share its build directory, but only the final step of the
+    # install holds the lock of the version, see `_commit_install`
+    with get_process_lock(f"build-{solc_version.base_version}"):
+        if _is_already_installed(solc_version, solcx_binary_path):
             return solc_version
 
-        temp_path = _get_temp_folder()
-        download = SOURCE_DOWNLOAD_BASE.format(
-            solc_version.base_version, f"solidity_{solc_version.base_version}.tar.gz"
+        install_folder = get_solcx_install_folder(solcx_binary_path)
+        install_path = install_folder.joinpath(f"solc-v{solc_version.base_version}")
+        source_path = _get_solc_source(
+            solc_version, install_folder.joinpath(BUILD_FOLDER), show_progress
         )
-        install_path = get_solcx_install_folder(solcx_binary_path).joinpath(
-            f"solc-v{solc_version.base_version}"
-        )
-
-        content = _download_solc(download, show_progress)
-        with tarfile.open(fileobj=BytesIO(content)) as tar:
-            tar.extractall(temp_path)
+        build_path = source_path / "build"
 
-        temp_path = temp_path / f"solidity_{solc_version.base_version}"
-
-        LOGGER.info("Running dependency installation script `install_deps.sh`...")
-        install_script = temp_path / "scripts" / "install_deps.sh"
-        if install_script.is_file():
+        # dependencies are only installed before the first build of a version
+        install_script = source_path / "scripts" / "install_deps.sh"
+        if install_script.is_file() and not build_path.joinpath("CMakeCache.txt").exists():
+            LOGGER.info("Running dependency installation script `install_deps.sh`...")
             try:
                 subprocess.check_call(["sh", install_script], stderr=subprocess.DEVNULL)
             except subprocess.CalledProcessError as exc:
                 LOGGER.warning(exc, exc_info=True)
 
-        original_path = os.getcwd()
-        build_path = temp_path / "build"
         build_path.mkdir(parents=True, exist_ok=True)
-        os.chdir(str(build_path.resolve()))
+        cmake_cmd = ["cmake", ".."]
+        if launcher := _get_compiler_launcher(compiler_launcher):
+            cmake_cmd += [
+                f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+            ]
+        make_cmd = ["make", f"-j{jobs or os.cpu_count() or 1}"]
 
         try:
-            for cmd in (["cmake", ".."], ["make"]):
-                LOGGER.info(f"Running `{cmd[0]}`...")
-                subprocess.check_call(cmd, stderr=subprocess.DEVNULL)
+            for cmd in (cmake_cmd, make_cmd):
+                LOGGER.info(f"Running `{' '.join(cmd)}`...")
+                subprocess.check_call(cmd, cwd=build_path, stderr=subprocess.DEVNULL)
 
         except subprocess.CalledProcessError as exc:
             err_msg = (
@@ -591,17 +933,165 @@ def compile_solc(
                 )
             raise SolcInstallationError(err_msg)
 
-        finally:
-            os.chdir(original_path)
-
-        solc_path = build_path / "solc" / "solc"
-        solc_path.rename(install_path)
-        install_path.chmod(install_path.stat().st_mode | stat.S_IEXEC)
+        temp_path = _get_partial_path(install_path)
+        _atomic_install_file(temp_path, source=build_path / "solc" / "solc")
+        _commit_install(
+            solc_version,
+            temp_path,
+            install_path,
+            f"solidity_{solc_version.base_version}.tar.gz",
+            solcx_binary_path,
+        )
         _validate_installation(solc_version, solcx_binary_path)
+        if not keep_build:
+            shutil.rmtree(source_path)
 
     return solc_version
 
 
+def prune(
+    max_bytes: int,
+    keep: Optional[Sequence[Union[str, Version]]] = None,
+    solcx_binary_path: Optional[Union[Path, str]] = None,
+) -> List[Version]:
+    """
+    Remove the least recently used ``solc`` versions until the installed binaries
+    use at most ``max_bytes`` bytes.
+
+    Versions are ordered by the last time :func:`get_executable` returned them,
+    or by when they were installed if they have never been used. Versions in
+    ``keep``, the active version, and versions that are being installed or are
+    running in any process are never removed.
+
+    Args:
+      max_bytes (int): Maximum total size of the installed binaries, in bytes.
+      keep (Optional[Sequence[Union[str, Version]]]): Versions to never remove.
+      solcx_binary_path (Optional[Union[Path, str]]): User-defined path,
+        used to override the default installation directory.
+
+    Returns:
+      List: Removed versions, least recently used first.
+    """
+    install_folder = get_solcx_install_folder(solcx_binary_path)
+    pinned = {Version(_convert_and_validate_version(i).base_version) for i in keep or []}
+    active = get_default_solc_binary()
+
+    entries = []
+    for entry in registry.get_installed(install_folder).values():
+        try:
+            size = _get_install_size(entry.path)
+            last_used = get_last_used(install_folder, str(entry.version))
+            last_used = last_used or entry.path.stat().st_mtime
+        except OSError:
+            continue
+        entries.append((last_used, entry, size))
+
+    total = sum(size for _, _, size in entries)
+    removed = []
+    for _, entry, size in sorted(entries, key=lambda i: i[0]):
+        if total <= max_bytes:
+            break
+        if entry.version in pinned or entry.path == active:
+            continue
+
+        # compiles hold the shared lock of their version, so a version that is
+        # in use cannot be locked exclusively and is skipped
+        lock = get_process_lock(str(entry.version))
+        if not lock.acquire(blocking=False):
+            LOGGER.info(f"Not removing solc {entry.version}, as it is in use")
+            continue
+        try:
+            if not entry.path.exists():
+                continue
+            _unlink_solc(entry.path)
+            remove_usage(install_folder, str(entry.version))
+        finally:
+            lock.release()
+
+        LOGGER.info(f"Removed solc {entry.version} from {install_folder}")
+        total -= size
+        removed.append(entry.version)
+
+    if removed and get_solcx_store_folder():
+        gc_store()
+    return removed
+
+
+def _get_install_size(solc_path: Path) -> int:
+    if sys.platform == "win32":
+        return sum(i.stat().st_size for i in solc_path.parent.rglob("*") if i.is_file())
+    return solc_path.stat().st_size
+
+
+def sync_binary_mirror(
+    mirror_path: Union[Path, str],
+    versions: Optional[Sequence[Union[str, Version]]] = None,
+    os_names: Optional[Sequence[str]] = None,
+    show_progress: bool = False,
+) -> List[Version]:
+    """
+    Download precompiled ``solc`` binaries into a local mirror directory.
+
+    The directory follows the layout of https://binaries.soliditylang.org and
+    can be served over http(s) or used directly via :func:`set_binary_mirrors`.
+    Binaries that are already present are not downloaded again. The mirror's
+    ``list.json`` is written last, so an interrupted sync never lists a binary
+    that is missing.
+
+    Args:
+      mirror_path (Union[Path, str]): Directory to sync into.
+      versions (Optional[Sequence[Union[str, Version]]]): Versions to sync.
+        Defaults to every version supported by py-solc-x.
+      os_names (Optional[Sequence[str]]): Platforms to sync, any of ``"linux"``,
+        ``"macosx"`` and ``"windows"``. Defaults to the current platform.
+      show_progress (bool): If ``True``, display a progress bar while
+        downloading. Requires installing the ``tqdm`` package.
+
+    Returns:
+      List: Versions that were downloaded.
+    """
+    mirror_path = Path(mirror_path)
+    os_names = os_names or [_get_os_name()]
+    if versions is not None:
+        versions = [_convert_and_validate_version(i) for i in versions]
+
+    synced = []
+    for os_name in os_names:
+        upstream = _get_binary_list([BINARY_DOWNLOAD_BASE], os_name=os_name)
+        target = mirror_path.joinpath(f"{os_name}-amd64")
+        target.mkdir(parents=True, exist_ok=True)
+
+        releases = {}
+        for version_str, filename in upstream["releases"].items():
+            version = Version(version_str)
+            if version < MINIMAL_SOLC_VERSION or (versions and version not in versions):
+                continue
+            releases[version_str] = filename
+
+            path = target.joinpath(filename)
+            if path.exists():
+                continue
+            content = _download_solc(
+                BINARY_DOWNLOAD_BASE.format(os_name, filename),
+                show_progress,
+                sha256=_get_build_sha256(upstream, filename),
+            )
+            temp_path = target.joinpath(f".{filename}.tmp")
+            temp_path.write_bytes(content)
+            temp_path.replace(path)
+            synced.append(version)
+
+        filenames = set(releases.values())
+        upstream["releases"] = releases
+        upstream["builds"] = [i for i in upstream.get("builds", []) if i["path"] in filenames]
+        temp_path = target.joinpath(".list.json.tmp")
+        with temp_path.open("w") as fp:
+            json.dump(upstream, fp, indent=2)
+        temp_path.replace(target.joinpath("list.json"))
+
+    return sorted(set(synced), reverse=True)
+
+
 def _check_for_installed_version(
     version: Union[str, Version], solcx_binary_path: Optional[Union[Path, str]] = None
 ) -> bool:
@@ -609,17 +1099,124 @@ def _check_for_installed_version(
     return path.exists()
 
 
-def _get_temp_folder() -> Path:
-    path = Path(tempfile.gettempdir()).joinpath(f"solcx-tmp-{os.getpid()}")
-    if path.exists():
-        shutil.rmtree(str(path))
-    path.mkdir()
-    return path
+def _is_already_installed(
+    version: Version, solcx_binary_path: Optional[Union[Path, str]] = None
+) -> bool:
+    # checked more than once per install, so this is logged by the caller instead
+    return _check_for_installed_version(version.base_version, solcx_binary_path)
+
+
+def _log_already_installed(
+    version: Version, solcx_binary_path: Optional[Union[Path, str]] = None
+) -> None:
+    path = get_solcx_install_folder(solcx_binary_path).joinpath(f"solc-v{version.base_version}")
+    LOGGER.info(f"solc {version.base_version} already installed at: {path}")
+
+
+def _get_compiler_launcher(launcher: Optional[str]) -> str:
+    if launcher is None:
+        launcher = os.getenv(SOLCX_COMPILER_LAUNCHER_VARIABLE)
+    if launcher is None:
+        launcher = "ccache" if shutil.which("ccache") else ""
+    return launcher
+
+
+def _get_solc_source(version: Version, build_folder: Path, show_progress: bool) -> Path:
+    # return the extracted source of `version`, downloading it if required. The
+    # tarball is extracted while it downloads, and never held in memory.
+    import tarfile
+
+    name = f"solidity_{version.base_version}"
+    source_path = build_folder.joinpath(name)
+    if source_path.joinpath(SOURCE_MARKER).exists():
+        return source_path
+
+    build_folder.mkdir(parents=True, exist_ok=True)
+    exc: Exception = DownloadError("No mirrors are configured")
+    for template in get_source_mirrors():
+        temp_path = _get_partial_path(source_path)
+        try:
+            chunks = _iter_download(
+                template.format(version.base_version, f"{name}.tar.gz"), show_progress
+            )
+            with tarfile.open(fileobj=_ChunkReader(chunks), mode="r|gz") as tar:
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(temp_path, filter="data")
+                else:
+                    tar.extractall(temp_path)
+        except (OSError, DownloadError, tarfile.TarError) as e:
+            LOGGER.warning(f"{e}")
+            exc = e
+            shutil.rmtree(temp_path, ignore_errors=True)
+            continue
+
+        # a source folder without the marker is left over from an interrupted extraction
+        if source_path.exists():
+            shutil.rmtree(source_path)
+        os.rename(temp_path.joinpath(name), source_path)
+        shutil.rmtree(temp_path)
+        source_path.joinpath(SOURCE_MARKER).touch()
+        return source_path
+
+    raise exc
 
 
-def _download_solc(url: str, show_progress: bool, rate_limit_wait_time: float = 3.0) -> bytes:
+class _ChunkReader(io.RawIOBase):
+    """
+    Read-only file object over an iterator of byte chunks.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _download_solc(
+    url: str,
+    show_progress: bool,
+    rate_limit_wait_time: float = 3.0,
+    sha256: Optional[str] = None,
+) -> bytes:
+    return b"".join(_iter_download(url, show_progress, rate_limit_wait_time, sha256))
+
+
+def _iter_download(
+    url: str,
+    show_progress: bool,
+    rate_limit_wait_time: float = 3.0,
+    sha256: Optional[str] = None,
+) -> Iterator[bytes]:
+    # yield the content of `url` in chunks. When `sha256` is given, the digest is
+    # computed while the download streams, and the final chunk is only yielded
+    # once it has been verified.
+    chunks: Iterable[bytes]
+
+    if path := _local_path_from_url(url):
+        LOGGER.info(f"Copying from {path}")
+        if not path.is_file():
+            raise DownloadError(f"{path} does not exist - is the mirror up to date?")
+        with path.open("rb") as fp:
+            yield from _iter_verified(url, iter(partial(fp.read, DOWNLOAD_CHUNK_SIZE), b""), sha256)
+        return
+
+    import requests
+
     LOGGER.info(f"Downloading from {url}")
-    response = requests.get(url, stream=show_progress)
+    response = requests.get(url, stream=True)
     if response.status_code == 404:
         raise DownloadError(
             "404 error when attempting to download from {} - are you sure this"
@@ -630,69 +1227,197 @@ def _download_solc(url: str, show_progress: bool, rate_limit_wait_time: float =
         # Handle GitHub API rate limiting.
         time_to_wait = rate_limit_wait_time or 1  # Prevent accidents
         time.sleep(time_to_wait)
-        return _download_solc(url, show_progress, rate_limit_wait_time + (rate_limit_wait_time / 2))
+        yield from _iter_download(
+            url, show_progress, rate_limit_wait_time + (rate_limit_wait_time / 2), sha256=sha256
+        )
+        return
 
     elif response.status_code != 200:
         raise DownloadError(
             f"Received status code {response.status_code} when attempting to download from {url}"
         )
 
+    chunks = response.iter_content(DOWNLOAD_CHUNK_SIZE)
     if show_progress and not tqdm:
         LOGGER.warning("Must install `tqdm` to see download progress")
-        return response.content
+    elif show_progress:
+        total_size = int(response.headers.get("content-length", 0))
+        chunks = _iter_progress(chunks, tqdm(total=total_size, unit="iB", unit_scale=True))
+
+    yield from _iter_verified(url, chunks, sha256)
+
+
+def _iter_progress(chunks: Iterable[bytes], progress_bar: Any) -> Iterator[bytes]:
+    try:
+        for chunk in chunks:
+            progress_bar.update(len(chunk))
+            yield chunk
+    finally:
+        progress_bar.close()
+
+
+def _iter_verified(url: str, chunks: Iterable[bytes], sha256: Optional[str]) -> Iterator[bytes]:
+    import hashlib
+
+    digest = hashlib.sha256()
+    previous = None
+    for chunk in chunks:
+        digest.update(chunk)
+        if previous is not None:
+            yield previous
+        previous = chunk
+
+    # holding back the last chunk means a consumer never sees the complete
+    # content of a download with a mismatched digest
+    _verify_sha256(url, digest, sha256)
+    if previous is not None:
+        yield previous
+
+
+def _verify_sha256(url: str, digest: "hashlib._Hash", expected: Optional[str]) -> None:
+    if expected is None:
+        return
+    if digest.hexdigest() != _normalize_digest(expected):
+        raise ChecksumError(
+            f"sha256 of {url} is 0x{digest.hexdigest()}, expected 0x{_normalize_digest(expected)}"
+        )
+
+
+def _normalize_digest(digest: str) -> str:
+    # digests in `list.json` are prefixed with `0x`
+    return digest.lower()[2:] if digest.lower().startswith("0x") else digest.lower()
 
-    elif not show_progress:
-        return response.content
 
-    total_size = int(response.headers.get("content-length", 0))
-    progress_bar = tqdm(total=total_size, unit="iB", unit_scale=True)
-    content = bytes()
+def _get_build_sha256(binary_list: Dict, filename: str) -> Optional[str]:
+    build = next((i for i in binary_list.get("builds", []) if i.get("path") == filename), None)
+    if build is None or not build.get("sha256"):
+        LOGGER.warning(f"No sha256 digest available for {filename}, skipping verification")
+        return None
+    return _normalize_digest(build["sha256"])
 
-    for data in response.iter_content(1024, decode_unicode=True):
-        progress_bar.update(len(data))
-        content += data
-    progress_bar.close()
 
-    return content
+def _record_install(
+    version: Version,
+    source: str,
+    solcx_binary_path: Union[Path, str, None],
+    sha256: Optional[str] = None,
+    verified: Optional[bool] = None,
+) -> None:
+    # by default, `sha256` is only given when the binary was checked against a published
+    # digest, otherwise the digest is computed from the installed binary and left unverified
+    if verified is None:
+        verified = sha256 is not None
+    binary_path = get_executable(version, solcx_binary_path)
+    install_folder = get_solcx_install_folder(solcx_binary_path)
+    update_manifest(
+        install_folder,
+        str(version),
+        {
+            "path": binary_path.relative_to(install_folder).as_posix(),
+            "size": binary_path.stat().st_size,
+            "source": source,
+            "sha256": sha256 or sha256_file(binary_path),
+            "verified": verified,
+        },
+    )
 
 
 def _install_solc_unix(
-    version: Version, filename: str, show_progress: bool, solcx_binary_path: Union[Path, str, None]
+    version: Version,
+    filename: str,
+    show_progress: bool,
+    solcx_binary_path: Union[Path, str, None],
+    sha256: Optional[str] = None,
 ) -> None:
-    download = BINARY_DOWNLOAD_BASE.format(_get_os_name(), filename)
     install_path = get_solcx_install_folder(solcx_binary_path=solcx_binary_path).joinpath(
         f"solc-v{version}"
     )
+    temp_path = _get_partial_path(install_path)
+    try:
+        store = get_solcx_store_folder()
+        linked = bool(store and sha256 and link_from_store(store, sha256, temp_path))
+        if store and sha256:
+            instrument.record("cache.store", 0.0, hit=linked)
 
-    content = _download_solc(download, show_progress)
-    with open(install_path, "wb") as fp:
-        fp.write(content)
+        if linked:
+            LOGGER.info(f"Linked solc {version} from the binary store at {store}")
+        else:
+            content = _download_from_mirrors(
+                get_binary_mirrors(),
+                _get_os_name(),
+                filename,
+                show_progress=show_progress,
+                sha256=sha256,
+            )
+            _atomic_install_file(temp_path, content)
+            if store and sha256:
+                add_to_store(store, temp_path, sha256, link=True)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-    install_path.chmod(install_path.stat().st_mode | stat.S_IEXEC)
+    _commit_install(version, temp_path, install_path, filename, solcx_binary_path, sha256)
 
 
 def _install_solc_windows(
-    version: Version, filename: str, show_progress: bool, solcx_binary_path: Union[Path, str, None]
+    version: Version,
+    filename: str,
+    show_progress: bool,
+    solcx_binary_path: Union[Path, str, None],
+    sha256: Optional[str] = None,
 ) -> None:
-    download = BINARY_DOWNLOAD_BASE.format(_get_os_name(), filename)
     install_path = get_solcx_install_folder(solcx_binary_path).joinpath(f"solc-v{version}")
 
-    temp_path = _get_temp_folder()
-    content = _download_solc(download, show_progress)
+    content = _download_from_mirrors(
+        get_binary_mirrors(), _get_os_name(), filename, show_progress=show_progress, sha256=sha256
+    )
+
+    # the install folder is populated under a temporary name, then moved into place
+    temp_path = _get_partial_path(install_path)
+    temp_path.mkdir()
+    try:
+        if Path(filename).suffix == ".exe":
+            _atomic_install_file(temp_path.joinpath("solc.exe"), content)
+        else:
+            import zipfile
+            from io import BytesIO
 
-    if Path(filename).suffix == ".exe":
-        install_path.mkdir()
-        with open(install_path.joinpath("solc.exe"), "wb") as fp:
-            fp.write(content)
+            with zipfile.ZipFile(BytesIO(content)) as zf:
+                zf.extractall(str(temp_path))
+    except BaseException:
+        shutil.rmtree(temp_path, ignore_errors=True)
+        raise
+
+    _commit_install(version, temp_path, install_path, filename, solcx_binary_path, sha256)
 
-    else:
-        with zipfile.ZipFile(BytesIO(content)) as zf:
-            zf.extractall(str(temp_path))
-            shutil.move(temp_path, install_path)
+
+def _is_verified_install(binary_path: Path, entry: Optional[Dict]) -> bool:
+    # a binary whose digest matched `list.json` when it was installed does not need to
+    # be executed to confirm the version, unless it has been replaced since
+    if not entry or not entry.get("verified") or not entry.get("sha256"):
+        return False
+    try:
+        return binary_path.stat().st_size == entry["size"]
+    except (KeyError, OSError):
+        return False
 
 
 def _validate_installation(version: Version, solcx_binary_path: Union[Path, str, None]) -> None:
     binary_path = get_executable(version, solcx_binary_path)
+    entry = get_manifest_entry(get_solcx_install_folder(solcx_binary_path), str(version))
+    with instrument.span("install.validate", version=str(version)) as span:
+        verified = _is_verified_install(binary_path, entry)
+        if not verified:
+            _validate_solc_version(version, binary_path)
+        span.set(probed=not verified)
+
+    if not get_default_solc_binary():
+        set_solc_version(version)
+
+    LOGGER.info(f"solc {version} successfully installed at: {binary_path}")
+
+
+def _validate_solc_version(version: Version, binary_path: Path) -> None:
     try:
         installed_version = wrapper.get_version_str_from_solc_binary(binary_path)
     except Exception:
@@ -721,23 +1446,10 @@ def _validate_installation(version: Version, solcx_binary_path: Union[Path, str,
             UnexpectedVersionWarning,
         )
 
-    if not get_default_solc_binary():
-        set_solc_version(version)
-
-    LOGGER.info(f"solc {version} successfully installed at: {binary_path}")
-
-
-try:
-    # try to set the result of `which`/`where` as the default
-    if path := _get_which_solc():
-        _default_solc_binary = path
-except Exception:
-    # if not available, use the most recent solcx installed version
-    if get_installed_solc_versions():
-        set_solc_version(get_installed_solc_versions()[0], silent=True)
-
 
 if __name__ == "__main__":
+    import argparse
+
     argument_parser = argparse.ArgumentParser()
     argument_parser.add_argument("version")
     argument_parser.add_argument("--solcx-binary-path", default=None)
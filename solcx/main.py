@@ -1,12 +1,45 @@
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from packaging.version import Version
 
-from solcx import wrapper
+from solcx import artifacts, wrapper
 from solcx.exceptions import ContractsNotFound, SolcError
 from solcx.install import get_executable
+from solcx.utils import instrument
+from solcx.utils.spool import SpooledInput
+
+# where each `--combined-json` output is found in the standard JSON output of a contract
+COMBINED_JSON_OUTPUTS = {
+    "abi": ("abi",),
+    "asm": ("evm", "legacyAssembly"),
+    "bin": ("evm", "bytecode", "object"),
+    "bin-runtime": ("evm", "deployedBytecode", "object"),
+    "devdoc": ("devdoc",),
+    "function-debug": ("evm", "bytecode", "functionDebugData"),
+    "function-debug-runtime": ("evm", "deployedBytecode", "functionDebugData"),
+    "generated-sources": ("evm", "bytecode", "generatedSources"),
+    "generated-sources-runtime": ("evm", "deployedBytecode", "generatedSources"),
+    "hashes": ("evm", "methodIdentifiers"),
+    "metadata": ("metadata",),
+    "opcodes": ("evm", "bytecode", "opcodes"),
+    "srcmap": ("evm", "bytecode", "sourceMap"),
+    "srcmap-runtime": ("evm", "deployedBytecode", "sourceMap"),
+    "storage-layout": ("storageLayout",),
+    "transient-storage-layout": ("transientStorageLayout",),
+    "userdoc": ("userdoc",),
+}
+
+# `--combined-json` outputs that `solc` gives as JSON strings rather than objects before 0.8.0
+STRING_OUTPUTS = ("abi", "devdoc", "userdoc", "storage-layout")
+STRING_OUTPUTS_VERSION = Version("0.8.0")
+# from 0.8.8, source unit names of files given on the command line are relative to the base path
+SOURCE_UNIT_NAME_VERSION = Version("0.8.8")
+
+# allowance for the `solc` path and flags, when estimating the length of a command line
+COMMAND_LINE_OVERHEAD = 4096
 
 
 def get_solc_version(with_commit_hash: bool = False) -> Version:
@@ -32,6 +65,7 @@ def compile_source(
     allow_paths: Optional[Union[List, Path, str]] = None,
     output_dir: Optional[Union[Path, str]] = None,
     overwrite: bool = False,
+    artifacts_dir: Optional[Union[Path, str]] = None,
     evm_version: Optional[str] = None,
     revert_strings: Optional[Union[List, str]] = None,
     metadata_hash: Optional[str] = None,
@@ -68,6 +102,9 @@ def compile_source(
         contract/file at the specified directory.
       overwrite (bool): Overwrite existing files, used in combination with
         ``output_dir``.
+      artifacts_dir (Optional[Union[Path, str]]): Write each output of each
+        contract to its own file within this folder, see
+        :func:`~solcx.artifacts.write_artifacts`. Unchanged files are not modified.
       evm_version (Optional[str]): Select the desired EVM version. Valid
         options depend on the ``solc`` version.
       revert_strings (Optional[List[str]]): Strip revert (and require)
@@ -98,28 +135,30 @@ def compile_source(
     Returns:
       Dict: Compiler output. The source file name is given as ``<stdin>``.
     """
-    return _compile_combined_json(
-        solc_binary=solc_binary,
-        solc_version=solc_version,
-        stdin=source,
-        output_values=output_values,
-        import_remappings=import_remappings,
-        base_path=base_path,
-        allow_paths=allow_paths,
-        output_dir=output_dir,
-        overwrite=overwrite,
-        evm_version=evm_version,
-        revert_strings=revert_strings,
-        metadata_hash=metadata_hash,
-        metadata_literal=metadata_literal,
-        optimize=optimize,
-        optimize_runs=optimize_runs,
-        optimize_yul=optimize_yul,
-        no_optimize_yul=no_optimize_yul,
-        yul_optimizations=yul_optimizations,
-        allow_empty=allow_empty,
-        **kwargs,
-    )
+    with instrument.span("api", api="compile_source"), wrapper._release_on_error():
+        return _compile_combined_json(
+            solc_binary=solc_binary,
+            solc_version=solc_version,
+            stdin=source,
+            output_values=output_values,
+            import_remappings=import_remappings,
+            base_path=base_path,
+            allow_paths=allow_paths,
+            output_dir=output_dir,
+            overwrite=overwrite,
+            artifacts_dir=artifacts_dir,
+            evm_version=evm_version,
+            revert_strings=revert_strings,
+            metadata_hash=metadata_hash,
+            metadata_literal=metadata_literal,
+            optimize=optimize,
+            optimize_runs=optimize_runs,
+            optimize_yul=optimize_yul,
+            no_optimize_yul=no_optimize_yul,
+            yul_optimizations=yul_optimizations,
+            allow_empty=allow_empty,
+            **kwargs,
+        )
 
 
 def compile_files(
@@ -130,6 +169,7 @@ def compile_files(
     allow_paths: Optional[Union[List, Path, str]] = None,
     output_dir: Optional[Union[Path, str]] = None,
     overwrite: bool = False,
+    artifacts_dir: Optional[Union[Path, str]] = None,
     evm_version: Optional[str] = None,
     revert_strings: Optional[Union[List, str]] = None,
     metadata_hash: Optional[str] = None,
@@ -150,6 +190,11 @@ def compile_files(
     Compilation is handled via the ``--combined-json`` flag. Depending on the
     solc version used, some keyword arguments may not be available.
 
+    If the source files would not fit on the command line, they are given as
+    standard JSON input on stdin instead, and the output is converted to the
+    ``--combined-json`` format. This requires that every keyword argument has a
+    standard JSON equivalent, otherwise the command line is used regardless.
+
     Args:
       source_files (Union[List, Path, str]): Path, or list of paths, of Solidity
         source files to be compiled.
@@ -167,6 +212,9 @@ def compile_files(
         and contract/file at the specified directory.
       overwrite (bool): Overwrite existing files, used in combination with
         ``output_dir``.
+      artifacts_dir (Optional[Union[Path, str]]): Write each output of each
+        contract to its own file within this folder, see
+        :func:`~solcx.artifacts.write_artifacts`. Unchanged files are not modified.
       evm_version (Optional[str]): Select the desired EVM version. Valid
         options depend on the ``solc`` version.
       revert_strings (Optional[Union[List, str]]): Strip revert (and require)
@@ -196,51 +244,59 @@ def compile_files(
     Returns:
       Dict: Compiler output
     """
-    return _compile_combined_json(
-        solc_binary=solc_binary,
-        solc_version=solc_version,
-        source_files=source_files,
-        output_values=output_values,
-        import_remappings=import_remappings,
-        base_path=base_path,
-        allow_paths=allow_paths,
-        output_dir=output_dir,
-        overwrite=overwrite,
-        evm_version=evm_version,
-        revert_strings=revert_strings,
-        metadata_hash=metadata_hash,
-        metadata_literal=metadata_literal,
-        optimize=optimize,
-        optimize_runs=optimize_runs,
-        optimize_yul=optimize_yul,
-        no_optimize_yul=no_optimize_yul,
-        yul_optimizations=yul_optimizations,
-        allow_empty=allow_empty,
-        **kwargs,
-    )
+    with instrument.span("api", api="compile_files"), wrapper._release_on_error():
+        return _compile_combined_json(
+            solc_binary=solc_binary,
+            solc_version=solc_version,
+            source_files=source_files,
+            output_values=output_values,
+            import_remappings=import_remappings,
+            base_path=base_path,
+            allow_paths=allow_paths,
+            output_dir=output_dir,
+            overwrite=overwrite,
+            artifacts_dir=artifacts_dir,
+            evm_version=evm_version,
+            revert_strings=revert_strings,
+            metadata_hash=metadata_hash,
+            metadata_literal=metadata_literal,
+            optimize=optimize,
+            optimize_runs=optimize_runs,
+            optimize_yul=optimize_yul,
+            no_optimize_yul=no_optimize_yul,
+            yul_optimizations=yul_optimizations,
+            allow_empty=allow_empty,
+            **kwargs,
+        )
 
 
 def _get_combined_json_outputs(solc_binary: Optional[Union[Path, str]] = None) -> str:
     if solc_binary is None:
         solc_binary = get_executable()
 
-    help_str = wrapper.solc_wrapper(solc_binary=solc_binary, help=True)[0].split("\n")
+    with instrument.span("probe.help"):
+        help_str = wrapper.solc_wrapper(solc_binary=solc_binary, help=True)[0].split("\n")
     combined_json_args = next(i for i in help_str if i.startswith("  --combined-json"))
     return combined_json_args.split(" ")[-1]
 
 
 def _parse_compiler_output(stdoutdata: str) -> Dict:
-    output = json.loads(stdoutdata)
+    with instrument.span("decode.json", size=len(stdoutdata)):
+        output = json.loads(stdoutdata)
+    return _get_contracts(output)
 
+
+def _get_contracts(output: Dict) -> Dict:
     contracts = output.get("contracts", {})
     sources = output.get("sources", {})
 
-    for path_str, data in contracts.items():
-        if "abi" in data and isinstance(data["abi"], str):
-            data["abi"] = json.loads(data["abi"])
-        key = path_str.rsplit(":", maxsplit=1)[0]
-        if "AST" in sources.get(key, {}):
-            data["ast"] = sources[key]["AST"]
+    with instrument.span("decode.abi", contracts=len(contracts)):
+        for path_str, data in contracts.items():
+            if "abi" in data and isinstance(data["abi"], str):
+                data["abi"] = json.loads(data["abi"])
+            key = path_str.rsplit(":", maxsplit=1)[0]
+            if "AST" in sources.get(key, {}):
+                data["ast"] = sources[key]["AST"]
 
     return contracts
 
@@ -251,6 +307,7 @@ def _compile_combined_json(
     solc_version: Optional[Union[Version, str]] = None,
     output_dir: Union[str, Path, None] = None,
     overwrite: Optional[bool] = False,
+    artifacts_dir: Union[str, Path, None] = None,
     allow_empty: Optional[bool] = False,
     **kwargs: Any,
 ) -> Dict:
@@ -271,25 +328,46 @@ def _compile_combined_json(
                 f"Target output file {target_path} already exists - use overwrite=True to overwrite"
             )
 
-    stdoutdata, stderrdata, command, proc = wrapper.solc_wrapper(
-        solc_binary=solc_binary,
-        combined_json=combined_json,
-        output_dir=output_dir,
-        overwrite=overwrite,
-        **kwargs,
-    )
+    input_data = None
+    if kwargs.get("source_files") and _exceeds_command_line_limit(**kwargs):
+        version = wrapper.get_solc_version(solc_binary)
+        input_data = _get_standard_json_input(combined_json, version, **kwargs)
+
+    if input_data is not None:
+        # too many files for the command line, so they are given as standard JSON on stdin
+        output, stdoutdata, stderrdata, command, proc = _run_standard_json(
+            solc_binary,
+            input_data,
+            base_path=kwargs.get("base_path"),
+            allow_paths=_get_allowed_paths(kwargs["source_files"], kwargs.get("allow_paths")),
+        )
+        output = _to_combined_json_output(output, combined_json, version)
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with output_dir.joinpath("combined.json").open("w") as fp:
+                json.dump(output, fp)
+        contracts = _get_contracts(output)
 
-    if output_dir:
-        output_path = Path(output_dir).joinpath("combined.json")
-        if stdoutdata:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open("w") as fp:
-                fp.write(stdoutdata)
-        else:
-            with output_path.open() as fp:
-                stdoutdata = fp.read()
+    else:
+        stdoutdata, stderrdata, command, proc = wrapper.solc_wrapper(
+            solc_binary=solc_binary,
+            combined_json=combined_json,
+            output_dir=output_dir,
+            overwrite=overwrite,
+            **kwargs,
+        )
+
+        if output_dir:
+            output_path = Path(output_dir).joinpath("combined.json")
+            if stdoutdata:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with output_path.open("w") as fp:
+                    fp.write(stdoutdata)
+            else:
+                with output_path.open() as fp:
+                    stdoutdata = fp.read()
 
-    contracts = _parse_compiler_output(stdoutdata)
+        contracts = _parse_compiler_output(stdoutdata)
 
     if not contracts and not allow_empty:
         raise ContractsNotFound(
@@ -297,16 +375,220 @@ def _compile_combined_json(
             return_code=proc.returncode,
             stdout_data=stdoutdata,
             stderr_data=stderrdata,
+            rusage=proc.rusage,
         )
+    if artifacts_dir is not None:
+        # the raw output is not needed once parsed, and may be large
+        del stdoutdata
+        artifacts.write_artifacts(contracts, artifacts_dir)
     return contracts
 
 
+def _get_remappings(import_remappings: Union[Dict, List, str]) -> List[str]:
+    if isinstance(import_remappings, str):
+        return [import_remappings]
+    if isinstance(import_remappings, dict):
+        return [f"{k}={v}" for k, v in import_remappings.items()]
+    return [str(i) for i in import_remappings]
+
+
+def _as_list(value: Union[List, Path, str, None]) -> List:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _exceeds_command_line_limit(
+    source_files: Union[List, Path, str],
+    import_remappings: Union[Dict, List, str, None] = None,
+    allow_paths: Union[List, Path, str, None] = None,
+    **kwargs: Any,
+) -> bool:
+    # estimate the length of the command line from the arguments that grow with the
+    # project, each taking a null byte and a pointer along with its characters
+    args = [wrapper._to_string("source_files", i) for i in _as_list(source_files)]
+    if import_remappings:
+        args += _get_remappings(import_remappings)
+    args += [wrapper._to_string("allow_paths", i) for i in _as_list(allow_paths)]
+    length = sum(len(i.encode()) + 9 for i in args) + COMMAND_LINE_OVERHEAD
+    return length > wrapper.get_command_line_limit()
+
+
+def _get_standard_json_input(
+    combined_json: str,
+    solc_version: Version,
+    source_files: Union[List, Path, str],
+    import_remappings: Union[Dict, List, str, None] = None,
+    evm_version: Optional[str] = None,
+    revert_strings: Union[List, str, None] = None,
+    metadata_hash: Optional[str] = None,
+    metadata_literal: bool = False,
+    optimize: bool = False,
+    optimize_runs: Optional[int] = None,
+    optimize_yul: Optional[bool] = None,
+    no_optimize_yul: Optional[bool] = None,
+    yul_optimizations: Optional[int] = None,
+    base_path: Union[Path, str, None] = None,
+    allow_paths: Union[List, Path, str, None] = None,
+    **kwargs: Any,
+) -> Optional[Dict]:
+    # translate the arguments of a `--combined-json` compile into a standard JSON
+    # input, or return `None` if some arguments have no standard JSON equivalent
+    if any(value is not None and value is not False for value in kwargs.values()):
+        return None
+
+    values = combined_json.split(",")
+    selection = [".".join(COMBINED_JSON_OUTPUTS[i]) for i in values if i in COMBINED_JSON_OUTPUTS]
+    output_selection: Dict = {"*": {"*": selection}}
+    if "ast" in values:
+        output_selection["*"][""] = ["ast"]
+
+    settings: Dict = {"outputSelection": output_selection}
+    if import_remappings:
+        settings["remappings"] = _get_remappings(import_remappings)
+    if evm_version:
+        settings["evmVersion"] = evm_version
+    if revert_strings:
+        settings["debug"] = {"revertStrings": wrapper._to_string("revert_strings", revert_strings)}
+
+    metadata: Dict = {}
+    if metadata_hash:
+        metadata["bytecodeHash"] = metadata_hash
+    if metadata_literal:
+        metadata["useLiteralContent"] = True
+    if metadata:
+        settings["metadata"] = metadata
+
+    optimizer: Dict = {}
+    if optimize:
+        optimizer["enabled"] = True
+    if optimize_runs is not None:
+        optimizer["runs"] = int(optimize_runs)
+    if optimize_yul or no_optimize_yul:
+        optimizer["details"] = {"yul": bool(optimize_yul)}
+    if yul_optimizations:
+        optimizer.setdefault("details", {})["yulDetails"] = {
+            "optimizerSteps": str(yul_optimizations)
+        }
+    if optimizer:
+        settings["optimizer"] = optimizer
+
+    sources = {}
+    for path in _as_list(source_files):
+        # source unit names are the ones `solc` gives files on the command line, so that
+        # imports resolve to the same names and the output has the same keys
+        name = _get_source_unit_name(path, base_path, solc_version)
+        sources[name] = {"content": Path(path).read_text(encoding="utf-8")}
+
+    return {"language": "Solidity", "sources": sources, "settings": settings}
+
+
+def _get_source_unit_name(
+    path: Union[Path, str], base_path: Union[Path, str, None], solc_version: Version
+) -> str:
+    if solc_version < SOURCE_UNIT_NAME_VERSION:
+        return wrapper._to_string("source_files", path)
+
+    # paths are made absolute, and then relative to the base path if they are within
+    # it, or to the working directory if there is no base path
+    absolute = Path(os.path.abspath(path))
+    base = Path(os.path.abspath(base_path)) if base_path else Path.cwd().resolve()
+    try:
+        return absolute.relative_to(base).as_posix()
+    except ValueError:
+        return absolute.as_posix()
+
+
+def _get_allowed_paths(
+    source_files: Union[List, Path, str], allow_paths: Union[List, Path, str, None]
+) -> List[str]:
+    # `solc` allows imports from the folders of files given on the command line, so
+    # these are allowed explicitly when the files are given on stdin instead
+    folders: List[Path] = []
+    for folder in sorted({Path(i).resolve().parent for i in _as_list(source_files)}):
+        # subfolders are already allowed by their parent, which is sorted first
+        if not folders or folders[-1] not in folder.parents:
+            folders.append(folder)
+    if sum(len(str(i)) + 1 for i in folders) > wrapper.get_command_line_limit() // 2:
+        folders = [Path(os.path.commonpath(folders))]
+    return [wrapper._to_string("allow_paths", i) for i in _as_list(allow_paths) + folders]
+
+
+def _run_standard_json(
+    solc_binary: Union[Path, str], input_data: Dict, **kwargs: Any
+) -> Tuple[Dict, str, str, List, Any]:
+    # the input is serialized into a file that `solc` reads as stdin, rather than into
+    # a string, and errors are given a copy of it on disk
+    with SpooledInput() as stdin:
+        with instrument.span("encode.json") as span:
+            stdin.write_json(input_data)
+            span.set(size=stdin.size)
+
+        stdoutdata, stderrdata, command, proc = wrapper.solc_wrapper(
+            solc_binary=solc_binary, stdin=stdin, standard_json=True, **kwargs
+        )
+        with instrument.span("decode.json", size=len(stdoutdata)):
+            output = json.loads(stdoutdata)
+        _check_standard_json_errors(output, command, proc, stdin, stdoutdata, stderrdata)
+    return output, stdoutdata, stderrdata, command, proc
+
+
+def _to_combined_json_output(
+    output: Dict, combined_json: str, solc_version: Optional[Version] = None
+) -> Dict:
+    # convert a standard JSON output into the shape of a `--combined-json` output of
+    # the given version, or with every output as an object if no version is given
+    values = [i for i in combined_json.split(",") if i in COMBINED_JSON_OUTPUTS]
+    as_string = solc_version is not None and solc_version < STRING_OUTPUTS_VERSION
+    contracts = {}
+    for source, source_contracts in output.get("contracts", {}).items():
+        for name, data in source_contracts.items():
+            contract = {}
+            for value in values:
+                item = data
+                for key in COMBINED_JSON_OUTPUTS[value]:
+                    item = item.get(key) if isinstance(item, dict) else None
+                if item is None:
+                    continue
+                if as_string and value in STRING_OUTPUTS:
+                    # compact, as written by `solc`
+                    item = json.dumps(item, separators=(",", ":"))
+                contract[value] = item
+            contracts[f"{source}:{name}"] = contract
+
+    sources = {k: {"AST": v["ast"]} for k, v in output.get("sources", {}).items() if "ast" in v}
+    return {"contracts": contracts, "sources": sources}
+
+
+def _check_standard_json_errors(
+    compiler_output: Dict,
+    command: List,
+    proc: Any,
+    stdin: SpooledInput,
+    stdout_data: str,
+    stderr_data: str,
+) -> None:
+    errors = [i for i in compiler_output.get("errors", []) if i["severity"] == "error"]
+    if errors:
+        raise SolcError(
+            "\n".join(error["formattedMessage"] for error in errors),
+            command=command,
+            return_code=proc.returncode,
+            stdin_data=stdin.spill(),
+            stdout_data=stdout_data,
+            stderr_data=stderr_data,
+            error_dict=compiler_output["errors"],
+            rusage=proc.rusage,
+        )
+
+
 def compile_standard(
     input_data: Dict,
     base_path: Optional[Union[str, Path]] = None,
     allow_paths: Optional[Union[List, Path, str]] = None,
     output_dir: Optional[str] = None,
     overwrite: bool = False,
+    artifacts_dir: Optional[Union[Path, str]] = None,
     solc_binary: Optional[Union[str, Path]] = None,
     solc_version: Optional[Union[str, Version]] = None,
     allow_empty: bool = False,
@@ -327,6 +609,9 @@ def compile_standard(
         at the specified directory.
       overwrite (bool): Overwrite existing files, used in combination with
         ``output_dir``.
+      artifacts_dir (Optional[Union[Path, str]]): Write each output of each
+        contract to its own file within this folder, in the same layout as
+        :func:`compile_files`. Unchanged files are not modified.
       solc_binary (Optional[Union[str, Path]]): Path of the `solc` binary to use.
         If not given, the currently active version is used, as set by
         :meth:`solcx.set_solc_version`.
@@ -338,44 +623,26 @@ def compile_standard(
     Returns:
       Dict: Compiler JSON output.
     """
-    if not input_data.get("sources") and not allow_empty:
-        raise ContractsNotFound(
-            "Input JSON does not contain any sources",
-            stdin_data=json.dumps(input_data, sort_keys=True, indent=2),
-        )
-
-    solc_binary = get_executable(version=solc_version) if solc_binary is None else solc_binary
-    stdoutdata, stderrdata, command, proc = wrapper.solc_wrapper(
-        solc_binary=solc_binary,
-        stdin=json.dumps(input_data),
-        standard_json=True,
-        base_path=base_path,
-        allow_paths=allow_paths,
-        output_dir=output_dir,
-        overwrite=overwrite,
-    )
-
-    compiler_output = json.loads(stdoutdata)
-    if "errors" in compiler_output:
-        has_errors = any(error["severity"] == "error" for error in compiler_output["errors"])
-        if has_errors:
-            error_message = "\n".join(
-                tuple(
-                    error["formattedMessage"]
-                    for error in compiler_output["errors"]
-                    if error["severity"] == "error"
-                )
-            )
-            raise SolcError(
-                error_message,
-                command=command,
-                return_code=proc.returncode,
-                stdin_data=json.dumps(input_data),
-                stdout_data=stdoutdata,
-                stderr_data=stderrdata,
-                error_dict=compiler_output["errors"],
+    with instrument.span("api", api="compile_standard"), wrapper._release_on_error():
+        if not input_data.get("sources") and not allow_empty:
+            raise ContractsNotFound(
+                "Input JSON does not contain any sources",
+                stdin_data=json.dumps(input_data, sort_keys=True, indent=2),
             )
-    return compiler_output
+
+        solc_binary = get_executable(version=solc_version) if solc_binary is None else solc_binary
+        compiler_output = _run_standard_json(
+            solc_binary,
+            input_data,
+            base_path=base_path,
+            allow_paths=allow_paths,
+            output_dir=output_dir,
+            overwrite=overwrite,
+        )[0]
+        if artifacts_dir is not None:
+            output = _to_combined_json_output(compiler_output, ",".join(COMBINED_JSON_OUTPUTS))
+            artifacts.write_artifacts(_get_contracts(output), artifacts_dir)
+        return compiler_output
 
 
 def link_code(
@@ -402,11 +669,12 @@ def link_code(
     Returns:
       str: Linked bytecode
     """
-    solc_binary = get_executable(version=solc_version) if solc_binary is None else solc_binary
-    library_list = [f"{name}:{address}" for name, address in libraries.items()]
+    with instrument.span("api", api="link_code"), wrapper._release_on_error():
+        solc_binary = get_executable(version=solc_version) if solc_binary is None else solc_binary
+        library_list = [f"{name}:{address}" for name, address in libraries.items()]
 
-    stdoutdata = wrapper.solc_wrapper(
-        solc_binary=solc_binary, stdin=unlinked_bytecode, link=True, libraries=library_list
-    )[0]
+        stdoutdata = wrapper.solc_wrapper(
+            solc_binary=solc_binary, stdin=unlinked_bytecode, link=True, libraries=library_list
+        )[0]
 
-    return stdoutdata.replace("Linking completed.", "").strip()
+        return stdoutdata.replace("Linking completed.", "").strip()
@@ -0,0 +1,123 @@
+"""
+Batch resolution of ``pragma solidity`` statements to ``solc`` versions.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Union
+
+from packaging.version import Version
+
+from solcx import install
+
+
+class PragmaResolution(NamedTuple):
+    pragma: str
+    installed: Optional[Version]
+    installable: Optional[Version]
+
+
+class PragmaResolver:
+    """
+    Resolve many pragma statements against the same lists of versions.
+
+    Gives the same result as :func:`~solcx.install.select_pragma_version`, but
+    the version lists are indexed once, and the set of versions matching each
+    comparator and each pragma is cached. Version sets are stored as bitmasks over
+    the sorted index, so the best match for a pragma is its highest set bit.
+    """
+
+    def __init__(
+        self,
+        installed: Optional[Iterable[Version]] = None,
+        installable: Optional[Iterable[Version]] = None,
+        solcx_binary_path: Optional[Union[Path, str]] = None,
+    ) -> None:
+        """
+        Args:
+          installed (Optional[Iterable[Version]]): Installed versions. Defaults to
+            the versions in the installation folder.
+          installable (Optional[Iterable[Version]]): Installable versions. Defaults
+            to the versions available from the binary mirrors. Give an empty list
+            to resolve against installed versions only.
+          solcx_binary_path (Optional[Union[Path, str]]): User-defined path, used to
+            override the default installation directory.
+        """
+        if installed is None:
+            installed = install.get_installed_solc_versions(solcx_binary_path=solcx_binary_path)
+        if installable is None:
+            installable = install.get_installable_solc_versions()
+        installed_set = set(installed)
+        installable_set = set(installable)
+
+        self._index: List[Version] = sorted(installed_set | installable_set)
+        self._installed_mask = self._mask(installed_set)
+        self._installable_mask = self._mask(installable_set)
+        self._spec_masks: Dict[str, int] = {}
+        self._pragma_masks: Dict[str, int] = {}
+
+    def _mask(self, versions: Set[Version]) -> int:
+        mask = 0
+        for position, version in enumerate(self._index):
+            if version in versions:
+                mask |= 1 << position
+        return mask
+
+    def _get_spec_mask(self, spec: str) -> int:
+        if spec not in self._spec_masks:
+            from packaging.specifiers import Specifier
+
+            specifier = Specifier(spec)
+            self._spec_masks[spec] = self._mask(set(specifier.filter(self._index)))
+        return self._spec_masks[spec]
+
+    def _get_pragma_mask(self, pragma_string: str) -> int:
+        key = pragma_string.replace(" ", "")
+        if key not in self._pragma_masks:
+            all_versions = (1 << len(self._index)) - 1
+            mask = 0
+            for comparator_set in key.split("||"):
+                # versions within a branch must match every comparator
+                branch = all_versions
+                for spec in install._get_pragma_specs(comparator_set):
+                    branch &= self._get_spec_mask(spec)
+                mask |= branch
+            self._pragma_masks[key] = mask
+        return self._pragma_masks[key]
+
+    def _highest(self, mask: int) -> Optional[Version]:
+        return self._index[mask.bit_length() - 1] if mask else None
+
+    def versions(self, pragma_string: str) -> List[Version]:
+        """
+        Return all indexed versions that match a pragma, newest first.
+        """
+        mask = self._get_pragma_mask(pragma_string)
+        return [v for i, v in enumerate(self._index) if mask >> i & 1][::-1]
+
+    def resolve(self, pragma_string: str) -> PragmaResolution:
+        """
+        Return the newest installed and installable versions matching a pragma.
+
+        Args:
+          pragma_string (str): Pragma statement, e.g. ``"pragma solidity ^0.4.22;"``
+
+        Returns:
+          PragmaResolution: Matching versions, ``None`` where nothing matches.
+        """
+        mask = self._get_pragma_mask(pragma_string)
+        return PragmaResolution(
+            pragma_string,
+            self._highest(mask & self._installed_mask),
+            self._highest(mask & self._installable_mask),
+        )
+
+    def resolve_many(self, pragmas: Iterable[str]) -> List[PragmaResolution]:
+        """
+        Resolve many pragma statements.
+
+        Args:
+          pragmas (Iterable[str]): Pragma statements.
+
+        Returns:
+          List: A :class:`PragmaResolution` for each pragma, in the given order.
+        """
+        return [self.resolve(pragma_string) for pragma_string in pragmas]
@@ -0,0 +1,182 @@
+"""
+Background installation of the ``solc`` versions a caller is about to need.
+
+:func:`prefetch` returns immediately, and installs versions on a thread pool
+while the caller continues with other setup. Until a prefetched version is
+installed, :func:`~solcx.install.get_executable` and
+:func:`~solcx.install.install_solc` wait for it instead of failing or
+downloading it a second time.
+"""
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Union
+
+from packaging.version import InvalidVersion, Version
+
+from solcx import install, project
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+LOGGER = logging.getLogger("solcx")
+
+_active: List["Prefetcher"] = []
+_active_lock = threading.Lock()
+_worker = threading.local()
+
+
+class Prefetcher:
+    """
+    Versions being installed in the background, as returned by :func:`prefetch`.
+    """
+
+    def __init__(
+        self,
+        versions: Optional[Sequence[Union[str, Version]]],
+        root: Optional[Union[Path, str]],
+        show_progress: bool,
+        solcx_binary_path: Optional[Union[Path, str]],
+        max_workers: Optional[int],
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.install_folder = install.get_solcx_install_folder(solcx_binary_path).resolve()
+        self._solcx_binary_path = solcx_binary_path
+        self._show_progress = show_progress
+        self._futures: Dict[Version, "Future"] = {}
+        # without a project to scan, the versions that may be prefetched are known upfront
+        self._candidates: Optional[Set[Version]] = None
+        if root is None:
+            try:
+                self._candidates = {Version(str(i).lstrip("v")) for i in versions or []}
+            except InvalidVersion:
+                # raised from `wait`, by the planning step
+                pass
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="solcx-prefetch")
+        # scanning the project and fetching `list.json` also happen in the background
+        self._planned = self._executor.submit(self._plan, versions, root)
+
+    def _plan(
+        self, versions: Optional[Sequence[Union[str, Version]]], root: Optional[Union[Path, str]]
+    ) -> None:
+        # scanning the project may call `get_executable`, which must not wait for this step
+        _worker.active = True
+        try:
+            required = {install._convert_and_validate_version(i) for i in versions or []}
+            if root is not None:
+                groups, _, _ = project._plan(root, True, self._solcx_binary_path)
+                required.update(groups)
+
+            installed = install.get_installed_solc_versions(self._solcx_binary_path)
+            missing = sorted(required.difference(installed), reverse=True)
+            if not missing:
+                return
+            binary_list = install._get_binary_list()
+            for version in missing:
+                self._futures[version] = self._executor.submit(self._install, version, binary_list)
+        finally:
+            _worker.active = False
+            self._executor.shutdown(wait=False)
+
+    def _install(self, version: Version, binary_list: Dict) -> Version:
+        # installing calls `get_executable`, which must not wait for the install itself
+        _worker.active = True
+        try:
+            return install._install_solc(
+                version, self._show_progress, self._solcx_binary_path, binary_list
+            )
+        finally:
+            _worker.active = False
+
+    @property
+    def versions(self) -> List[Version]:
+        """
+        Versions being prefetched, newest first. Empty until the project is scanned.
+        """
+        return sorted(self._futures, reverse=True)
+
+    def done(self) -> bool:
+        return self._planned.done() and all(i.done() for i in self._futures.values())
+
+    def wait(self, timeout: Optional[float] = None) -> List[Version]:
+        """
+        Wait for every prefetched version to be installed.
+
+        Args:
+          timeout (Optional[float]): Maximum number of seconds to wait for each
+            step. Waits indefinitely if ``None``.
+
+        Returns:
+          List: Installed versions, newest first.
+        """
+        self._planned.result(timeout)
+        return [self._futures[i].result(timeout) for i in self.versions]
+
+    def _wait_for(self, version: Version) -> bool:
+        # wait for a version if it is being prefetched, and return `True` once it is installed
+        if self._candidates is not None and version not in self._candidates:
+            return False
+        try:
+            self._planned.result()
+        except Exception:
+            return False
+        if (future := self._futures.get(version)) is None:
+            return False
+        try:
+            future.result()
+        except Exception as exc:
+            LOGGER.warning(f"Prefetching solc {version} failed: {exc}")
+            return False
+        return True
+
+
+def prefetch(
+    versions: Optional[Sequence[Union[str, Version]]] = None,
+    root: Optional[Union[Path, str]] = None,
+    show_progress: bool = False,
+    solcx_binary_path: Optional[Union[Path, str]] = None,
+    max_workers: Optional[int] = None,
+) -> Prefetcher:
+    """
+    Start installing ``solc`` versions in background threads.
+
+    Versions may be given explicitly, or found by scanning a project for the
+    versions :func:`~solcx.project.compile_project` would use. Versions that are
+    already installed are skipped. Errors are raised by :meth:`Prefetcher.wait`,
+    and otherwise only logged when a prefetched version is used.
+
+    Args:
+      versions (Optional[Sequence[Union[str, Version]]]): Versions to install.
+      root (Optional[Union[Path, str]]): Project folder to scan for ``pragma
+        solidity`` statements.
+      show_progress (bool): If ``True``, display a progress bar while
+        downloading. Requires installing the ``tqdm`` package.
+      solcx_binary_path (Optional[Union[Path, str]]): User-defined path,
+        used to override the default installation directory.
+      max_workers (Optional[int]): Maximum number of concurrent installs.
+
+    Returns:
+      Prefetcher: Handle to wait for the installs.
+    """
+    prefetcher = Prefetcher(versions, root, show_progress, solcx_binary_path, max_workers)
+    with _active_lock:
+        _active[:] = [i for i in _active if not i.done()]
+        _active.append(prefetcher)
+    return prefetcher
+
+
+def wait_for_prefetch(install_folder: Path, version: Version) -> bool:
+    """
+    Wait until a version is installed, if it is being prefetched into a folder.
+
+    Returns:
+      bool: ``True`` if the version was prefetched and is now installed.
+    """
+    if getattr(_worker, "active", False):
+        return False
+    install_folder = install_folder.resolve()
+    with _active_lock:
+        _active[:] = [i for i in _active if not i.done()]
+        prefetchers = [i for i in _active if i.install_folder == install_folder]
+    return any(i._wait_for(version) for i in prefetchers)
@@ -0,0 +1,182 @@
+"""
+Compile every Solidity source file in a project, using the ``solc`` versions
+required by their ``pragma solidity`` statements.
+"""
+import re
+from collections import Counter
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+from packaging.version import Version
+
+from solcx import install
+from solcx.exceptions import UnsupportedVersionError
+from solcx.main import compile_files
+from solcx.pragma import PragmaResolver
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+COMMENT_REGEX = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+PRAGMA_REGEX = re.compile(r"pragma\s+solidity\s+([^;]+);")
+IMPORT_REGEX = re.compile(r"""import\s+(?:[^;"']*?\s+from\s+)?["']([^"']+)["']""")
+# first version of `solc` with the `--base-path` flag
+BASE_PATH_VERSION = Version("0.6.9")
+
+
+def _parse_source(path: Path, root: Path) -> Tuple[List[str], List[Path]]:
+    # return the pragmas of a source file, and the files it imports that exist
+    source = COMMENT_REGEX.sub("", path.read_text(encoding="utf-8", errors="replace"))
+    imports = []
+    for name in IMPORT_REGEX.findall(source):
+        base = path.parent if name.startswith(".") else root
+        import_path = base.joinpath(name).resolve()
+        if import_path.is_file():
+            imports.append(import_path)
+    return PRAGMA_REGEX.findall(source), imports
+
+
+def _group_sources(
+    source_files: List[Path],
+    root: Path,
+    resolver: PragmaResolver,
+    all_versions: Set[Version],
+    installed: Set[Version],
+) -> Dict[Version, List[Path]]:
+    # versions allowed by the pragmas of each file, and of the files it imports
+    parsed: Dict[Path, Tuple[List[str], List[Path]]] = {}
+    allowed: Dict[Path, Set[Version]] = {}
+
+    def _get_parsed(path: Path) -> Tuple[List[str], List[Path]]:
+        if path not in parsed:
+            parsed[path] = _parse_source(path, root)
+        return parsed[path]
+
+    for path in source_files:
+        versions = set(all_versions)
+        seen = {path}
+        queue = [path]
+        while queue:
+            pragmas, imports = _get_parsed(queue.pop())
+            for pragma_string in pragmas:
+                versions.intersection_update(resolver.versions(pragma_string))
+            queue.extend(i for i in imports if i not in seen)
+            seen.update(imports)
+
+        if not versions:
+            raise UnsupportedVersionError(
+                f"No solc version matches the pragmas of '{path}' and the files it imports"
+            )
+        allowed[path] = versions
+
+    # greedily pick the version that covers the most remaining files, preferring
+    # installed versions and then newer versions, until every file is covered
+    groups = {}
+    remaining = set(source_files)
+    while remaining:
+        counts = Counter(v for path in remaining for v in allowed[path])
+        version = max(counts, key=lambda v: (counts[v], v in installed, v))
+        covered = {path for path in remaining if version in allowed[path]}
+        groups[version] = sorted(covered)
+        remaining -= covered
+
+    return groups
+
+
+def _plan(
+    root: Union[Path, str], install_missing: bool, solcx_binary_path: Optional[Union[Path, str]]
+) -> Tuple[Dict[Version, List[Path]], Set[Version], Dict]:
+    # return the version groups of a project, the installed versions and `list.json`
+    root = Path(root).resolve()
+    source_files = sorted(root.rglob("*.sol"))
+    if not source_files:
+        return {}, set(), {"releases": {}}
+
+    installed = set(install.get_installed_solc_versions(solcx_binary_path=solcx_binary_path))
+    binary_list = install._get_binary_list() if install_missing else {"releases": {}}
+    installable = set(install._get_installable_versions(binary_list))
+
+    resolver = PragmaResolver(installed, installable)
+    groups = _group_sources(source_files, root, resolver, installed | installable, installed)
+    return groups, installed, binary_list
+
+
+def compile_project(
+    root: Union[Path, str],
+    install_missing: bool = True,
+    show_progress: bool = False,
+    solcx_binary_path: Optional[Union[Path, str]] = None,
+    max_workers: Optional[int] = None,
+    max_memory: Optional[int] = None,
+    **kwargs: Any,
+) -> Dict[Version, Dict]:
+    """
+    Compile every Solidity source file within a folder.
+
+    Sources are grouped by the smallest set of ``solc`` versions that satisfies
+    the ``pragma solidity`` statements of every file, including the files it
+    imports. Missing versions are installed concurrently, and each group is
+    compiled as soon as its version is available.
+
+    Compilations run in parallel within CPU and memory budgets, using the peak
+    memory and duration of past compilations of the same files, so that large
+    compilations are neither run together beyond the available memory nor
+    started last. See :class:`~solcx.scheduler.Scheduler`.
+
+    Args:
+      root (Union[Path, str]): Project folder, searched recursively for ``.sol``
+        files. Imports that do not start with ``.`` are resolved relative to it,
+        so ``base_path`` and ``allow_paths`` default to it. Versions of ``solc``
+        older than 0.6.9 have no ``--base-path`` flag, and resolve such imports
+        relative to the working directory instead.
+      install_missing (bool): If ``True``, versions may be chosen from the
+        installable versions and installed as needed. Otherwise only installed
+        versions are used.
+      show_progress (bool): If ``True``, display a progress bar while
+        downloading. Requires installing the ``tqdm`` package.
+      solcx_binary_path (Optional[Union[Path, str]]): User-defined path, used to
+        override the default installation directory.
+      max_workers (Optional[int]): Maximum number of concurrent installs and
+        compilations. Defaults to the number of CPUs for compilations.
+      max_memory (Optional[int]): Memory budget in bytes for concurrent
+        compilations. Defaults to most of the memory available on Linux, and to
+        no budget elsewhere.
+      **kwargs (Any): Additional keyword arguments for
+        :func:`~solcx.main.compile_files`.
+
+    Returns:
+      Dict: Compiler output of each version group, keyed by ``solc`` version.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from solcx.scheduler import HISTORY_FILENAME, Scheduler, get_job_key
+
+    groups, installed, binary_list = _plan(root, install_missing, solcx_binary_path)
+    history_path = install.get_solcx_install_folder(solcx_binary_path).joinpath(HISTORY_FILENAME)
+
+    # `solc` must resolve imports against `root`, as the pragma analysis did
+    default_base_path = "base_path" not in kwargs
+    kwargs.setdefault("base_path", Path(root))
+    kwargs.setdefault("allow_paths", Path(root))
+
+    def _submit(version: Version, files: List[Path]) -> "Future":
+        # installs are not scheduled, only the compilations that follow them
+        if version not in installed:
+            install._install_solc(version, show_progress, solcx_binary_path, binary_list)
+        solc_binary = install.get_executable(version, solcx_binary_path)
+        compile_kwargs = kwargs
+        if default_base_path and version < BASE_PATH_VERSION:
+            compile_kwargs = {k: v for k, v in kwargs.items() if k != "base_path"}
+        return scheduler.submit(
+            get_job_key(version, files),
+            partial(compile_files, files, solc_binary=solc_binary, **compile_kwargs),
+            size=sum(i.stat().st_size for i in files),
+        )
+
+    with ThreadPoolExecutor(max_workers) as executor, Scheduler(
+        max_workers, max_memory, history_path
+    ) as scheduler:
+        submitted = {v: executor.submit(_submit, v, files) for v, files in groups.items()}
+        futures = {version: future.result() for version, future in submitted.items()}
+        return {version: future.result() for version, future in futures.items()}
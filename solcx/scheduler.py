@@ -0,0 +1,255 @@
+"""
+Scheduling of concurrent ``solc`` jobs within CPU and memory budgets.
+
+A :class:`Scheduler` runs at most one job per CPU, and only starts a job if its
+estimated peak memory fits in the memory budget, and in the memory currently
+available. Jobs that do not fit wait in a queue until running jobs finish,
+rather than being started and risking the OOM killer.
+
+Estimates are learned from past runs: the duration and peak RSS of each job are
+kept in a history file in the installation folder, keyed by ``solc`` version and
+input files. Queued jobs are started longest first, so that the longest job does
+not start last and delay the whole batch.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Union
+
+from solcx.utils import rusage
+from solcx.utils.lock import get_process_lock
+
+HISTORY_FILENAME = ".solcx-jobs.json"
+# jobs are forgotten, least recently run first, beyond this many
+MAX_HISTORY = 4096
+
+# memory reserved for a job that has not been run before
+DEFAULT_JOB_MEMORY = 512 << 20
+# reserve more than the largest peak RSS seen, as it varies between runs
+MEMORY_MARGIN = 1.25
+# fraction of the available memory used as the budget, if none is given
+MEMORY_FRACTION = 0.8
+
+
+def get_available_memory() -> Optional[int]:
+    """
+    Return the memory available for new processes in bytes, or ``None`` where the
+    platform does not report it. Only Linux is supported.
+    """
+    try:
+        with open("/proc/meminfo") as fp:
+            for line in fp:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def get_job_key(version: Any, source_files: Sequence[Union[Path, str]]) -> str:
+    """
+    Return the key that the history of compiling a set of files is kept under.
+    """
+    import hashlib
+
+    input_key = rusage.get_input_key(list(source_files), None)
+    return hashlib.blake2b(f"{version}\0{input_key}".encode(), digest_size=16).hexdigest()
+
+
+def read_history(path: Path) -> Dict[str, Dict[str, float]]:
+    """
+    Return the recorded ``wall_time``, ``max_rss`` and ``last_run`` of each job.
+
+    A missing or unreadable history is treated as empty.
+    """
+    try:
+        with path.open() as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def update_history(path: Path, entries: Dict[str, Dict[str, float]]) -> None:
+    """
+    Merge entries into a history file, which is rewritten atomically.
+    """
+    with get_process_lock("job-history"):
+        history = read_history(path)
+        history.update(entries)
+        if len(history) > MAX_HISTORY:
+            by_age = sorted(history, key=lambda k: history[k].get("last_run", 0), reverse=True)
+            history = {k: history[k] for k in by_age[:MAX_HISTORY]}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp_path.open("w") as fp:
+            json.dump(history, fp, sort_keys=True)
+        os.replace(temp_path, path)
+
+
+class _Job:
+    __slots__ = ("key", "fn", "future", "memory", "duration", "size")
+
+    def __init__(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        memory: int,
+        duration: Optional[float],
+        size: int,
+    ) -> None:
+        self.key = key
+        self.fn = fn
+        self.future: Future = Future()
+        self.memory = memory
+        self.duration = duration
+        self.size = size
+
+    def order(self) -> tuple:
+        # jobs that have not run before come first, as they may be the longest
+        return (self.duration is not None, -(self.duration or 0.0), -self.size)
+
+
+class Scheduler:
+    """
+    Run jobs concurrently, admitting each one only when there is a CPU and enough
+    memory for it.
+
+    Use as a context manager: on exit, it waits for all submitted jobs and saves
+    what was learned about them to the history file.
+
+    Args:
+      max_workers (Optional[int]): Maximum number of concurrent jobs. Defaults to
+        the number of CPUs.
+      max_memory (Optional[int]): Memory budget in bytes, shared by running jobs.
+        Defaults to a fraction of the memory available when the scheduler is
+        created, or no budget where that is unknown.
+      history_path (Optional[Path]): History file of past runs. If ``None``,
+        nothing is learned or remembered between runs.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        history_path: Optional[Path] = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if max_memory is None and (available := get_available_memory()) is not None:
+            max_memory = int(available * MEMORY_FRACTION)
+        self.max_memory = max_memory
+        self.history_path = history_path
+        self._history = read_history(history_path) if history_path else {}
+        self._updates: Dict[str, Dict[str, float]] = {}
+
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="solcx-compile")
+        self._lock = threading.Lock()
+        self._queue: List[_Job] = []
+        self._futures: Set[Future] = set()
+        self._running = 0
+        self._reserved = 0
+
+    def __enter__(self) -> "Scheduler":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def submit(self, key: str, fn: Callable[[], Any], size: int = 0) -> Future:
+        """
+        Queue a job.
+
+        Args:
+          key (str): Key of the job in the history, see :func:`get_job_key`.
+          fn (Callable): Function to call, without arguments.
+          size (int): Size of the input, used to order jobs without history.
+
+        Returns:
+          Future: Result of the job.
+        """
+        past = self._history.get(key, {})
+        memory = DEFAULT_JOB_MEMORY
+        if past.get("max_rss"):
+            memory = int(past["max_rss"] * MEMORY_MARGIN)
+
+        job = _Job(key, fn, memory, past.get("wall_time"), size)
+        with self._lock:
+            self._queue.append(job)
+            self._futures.add(job.future)
+            self._dispatch()
+        return job.future
+
+    def _dispatch(self) -> None:
+        # start queued jobs, longest first, while they fit - called with the lock held
+        self._queue.sort(key=_Job.order)
+        while self._queue and self._running < self.max_workers:
+            job = self._queue[0]
+            # a job is always started if nothing else is running, even if it does not
+            # fit, or it would never start. Otherwise smaller jobs are not started
+            # ahead of it, so that a large job cannot be held back indefinitely.
+            if self._running and not self._fits(job):
+                break
+            self._queue.pop(0)
+            self._running += 1
+            self._reserved += job.memory
+            self._executor.submit(self._run, job)
+
+    def _fits(self, job: _Job) -> bool:
+        if self.max_memory is not None and self._reserved + job.memory > self.max_memory:
+            return False
+        available = get_available_memory()
+        return available is None or job.memory <= available
+
+    def _run(self, job: _Job) -> None:
+        try:
+            if not job.future.set_running_or_notify_cancel():
+                return
+            previous_usage = rusage.get_last_usage()
+            start = time.perf_counter()
+            try:
+                result = job.fn()
+            except BaseException as exc:
+                job.future.set_exception(exc)
+                return
+
+            usage = rusage.get_last_usage()
+            self._learn(job.key, time.perf_counter() - start, usage, previous_usage)
+            job.future.set_result(result)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._reserved -= job.memory
+                self._dispatch()
+
+    def _learn(
+        self,
+        key: str,
+        wall_time: float,
+        usage: Optional[rusage.ResourceUsage],
+        previous_usage: Optional[rusage.ResourceUsage],
+    ) -> None:
+        entry: Dict[str, float] = {"wall_time": wall_time, "last_run": time.time()}
+        # the usage is that of the last solc process in this thread, if the job ran one
+        if usage is not None and usage is not previous_usage and usage.max_rss is not None:
+            entry["max_rss"] = usage.max_rss
+        elif max_rss := self._history.get(key, {}).get("max_rss"):
+            entry["max_rss"] = max_rss
+        with self._lock:
+            self._updates[key] = entry
+
+    def shutdown(self) -> None:
+        """
+        Wait for all submitted jobs, and save what was learned to the history file.
+        """
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+        self._executor.shutdown()
+        if self.history_path is not None and self._updates:
+            update_history(self.history_path, self._updates)
+            self._history.update(self._updates)
+            self._updates = {}
@@ -0,0 +1,177 @@
+"""
+Synthetic Solidity projects, for benchmarking and scaling tests.
+
+Projects are generated reproducibly from a seed. Contracts are split into one
+group per pragma, and only import contracts of their own group, so each group
+compiles with any version that satisfies its pragma.
+"""
+import random
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+DEFAULT_OUTPUT_VALUES = ("abi", "evm.bytecode.object")
+
+
+class Corpus(NamedTuple):
+    """
+    A generated project. Contracts are named ``C<n>``, and libraries ``Lib<n>``,
+    each in a source file of the same name.
+    """
+
+    root: Path
+    contracts: List[Path]
+    libraries: List[Path]
+    pragmas: Dict[Path, str]
+
+    @property
+    def paths(self) -> List[Path]:
+        """
+        All source files, with each one following the files that it imports.
+        """
+        return self.libraries + self.contracts
+
+    def get_standard_json(
+        self, pragma: Optional[str] = None, output_values: Sequence[str] = DEFAULT_OUTPUT_VALUES
+    ) -> Dict:
+        """
+        Return a standard JSON input for ``compile_standard``, with the content of
+        each source file.
+
+        Args:
+          pragma (Optional[str]): Only include contracts with this pragma. Libraries
+            are always included. Required if the corpus has more than one pragma.
+          output_values (Sequence[str]): Outputs to select for every contract.
+
+        Returns:
+          Dict: Standard JSON input, with sources keyed by their path relative to
+          the corpus root.
+        """
+        if pragma is None and len(set(self.pragmas[i] for i in self.contracts)) > 1:
+            raise ValueError("Corpus has contracts with different pragmas, one must be given")
+        paths = self.libraries + [
+            i for i in self.contracts if pragma is None or self.pragmas[i] == pragma
+        ]
+        return {
+            "language": "Solidity",
+            "sources": {
+                i.relative_to(self.root).as_posix(): {"content": i.read_text()} for i in paths
+            },
+            "settings": {"outputSelection": {"*": {"*": list(output_values)}}},
+        }
+
+
+def _library_source(index: int, pragma: str) -> str:
+    return (
+        "// SPDX-License-Identifier: MIT\n"
+        f"pragma solidity {pragma};\n\n"
+        f"library Lib{index} {{\n"
+        "    function scale(uint256 x) public pure returns (uint256) {\n"
+        f"        return x * {index + 3} + 1;\n"
+        "    }\n"
+        "}\n"
+    )
+
+
+def _contract_source(
+    index: int, pragma: str, imports: List[int], library: Optional[int], statements: int
+) -> str:
+    lines = ["// SPDX-License-Identifier: MIT", f"pragma solidity {pragma};", ""]
+    lines += [f'import "./C{i}.sol";' for i in imports]
+    if library is not None:
+        lines.append(f'import "./Lib{library}.sol";')
+
+    lines += ["", f"contract C{index} {{", "    uint256 public value;"]
+    lines += [f"    C{i} internal dep{i};" for i in imports]
+    lines += ["", "    function set(uint256 x) public {"]
+    lines.append(
+        f"        value = Lib{library}.scale(x);" if library is not None else "        value = x;"
+    )
+    lines += [f"        dep{i}.set(value);" for i in imports]
+    lines.append("    }")
+
+    if statements:
+        # alternate arithmetic and branches, to grow the AST without growing the bytecode much
+        lines += [
+            "",
+            "    function compute(uint256 x) public pure returns (uint256 y) {",
+            "        y = x;",
+        ]
+        for i in range(statements):
+            if i % 2:
+                lines.append(
+                    f"        if (y % {i + 2} == 0) {{ y = y / 2; }} else {{ y = y + {i}; }}"
+                )
+            else:
+                lines.append(f"        y = y * {i % 7 + 2} + {i};")
+        lines.append("    }")
+
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(
+    root: Union[Path, str],
+    contracts: int = 10,
+    fanout: int = 1,
+    depth: int = 1,
+    libraries: int = 0,
+    pragmas: Sequence[str] = (">=0.5.0",),
+    statements: int = 0,
+    seed: int = 0,
+) -> Corpus:
+    """
+    Write a synthetic Solidity project.
+
+    Contracts are assigned to pragma groups in turn. Within a group they form
+    ``depth`` levels, and each contract below the top level imports up to
+    ``fanout`` contracts from the level above, so the longest import chain has
+    ``depth`` files.
+
+    Args:
+      root (Union[Path, str]): Folder to write the source files in.
+      contracts (int): Number of contracts.
+      fanout (int): Number of contracts imported by each contract below the top level.
+      depth (int): Number of levels of imports.
+      libraries (int): Number of libraries. Contracts call a public library
+        function in turn, so their bytecode must be linked.
+      pragmas (Sequence[str]): Version pragmas, e.g. ``["^0.6.0", "^0.8.0"]``.
+      statements (int): Number of statements in an additional function of each
+        contract, to produce large ASTs.
+      seed (int): Seed for the choice of imports.
+
+    Returns:
+      Corpus: The generated project.
+    """
+    if contracts < 1 or fanout < 1 or depth < 1 or not pragmas:
+        raise ValueError("contracts, fanout and depth must be positive, and pragmas not empty")
+
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    corpus = Corpus(root, [], [], {})
+
+    # libraries are used from every group, so they must compile with every pragma
+    library_pragma = " || ".join(pragmas)
+    for index in range(libraries):
+        path = root.joinpath(f"Lib{index}.sol")
+        path.write_text(_library_source(index, library_pragma))
+        corpus.libraries.append(path)
+        corpus.pragmas[path] = library_pragma
+
+    # contracts of each level, per group
+    levels: List[List[List[int]]] = [[[] for _ in range(depth)] for _ in pragmas]
+    for index in range(contracts):
+        group = index % len(pragmas)
+        position = index // len(pragmas)
+        level = position % depth
+        candidates = levels[group][level - 1] if level else []
+        imports = sorted(rng.sample(candidates, min(fanout, len(candidates))))
+        levels[group][level].append(index)
+
+        library = index % libraries if libraries else None
+        path = root.joinpath(f"C{index}.sol")
+        path.write_text(_contract_source(index, pragmas[group], imports, library, statements))
+        corpus.contracts.append(path)
+        corpus.pragmas[path] = pragmas[group]
+
+    return corpus
@@ -0,0 +1,220 @@
+"""
+Timing instrumentation of the phases of compiling and installing.
+
+Instrumented code wraps each phase in :func:`span`. While no hooks are
+registered, :func:`span` returns a shared no-op object, so instrumentation costs
+a single list check per phase. Each hook is called with a :class:`Timing` when a
+phase ends, from the thread that ran it.
+
+Phases may nest, e.g. ``probe.help`` includes the ``spawn`` and
+``communicate`` phases of the ``solc --help`` process. The phases are:
+
+* ``probe.version``: running ``solc --version``
+* ``probe.help``: running ``solc --help`` to find the ``--combined-json`` outputs
+* ``lock.wait``: waiting for a contended lock, e.g. while another process installs
+* ``spawn``: starting the ``solc`` process
+* ``communicate``: ``solc`` running, and transferring its input and output. The
+  ``*_size`` attributes are lengths of the decoded text
+* ``encode.json``: serializing a standard JSON input
+* ``decode.json``: decoding the compiler output
+* ``decode.abi``: decoding the ABIs within ``--combined-json`` output
+* ``write.artifacts``: writing per-contract artifact files, with the number of
+  ``files`` and of those ``written`` because they changed
+* ``install.download``: downloading a binary
+* ``install.validate``: checking an installed binary
+* ``api``: a call to ``compile_source``, ``compile_files``, ``compile_standard``
+  or ``link_code``, given as the ``api`` attribute
+
+Lookups in caches are reported as zero-length ``cache.registry`` (installed
+versions), ``cache.releases`` (GitHub release metadata) and ``cache.store``
+(shared binary store) phases, with a boolean ``hit`` attribute.
+
+Code within a span can add attributes to every enclosing span with
+:func:`annotate`, e.g. the ``solc`` version once it is known.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+LOGGER = logging.getLogger("solcx")
+
+
+class Timing(NamedTuple):
+    phase: str
+    duration: float
+    attrs: Dict[str, Any]
+    failed: bool
+
+
+Hook = Callable[[Timing], None]
+
+_hooks: List[Hook] = []
+_hooks_lock = threading.Lock()
+_open_spans = threading.local()
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register a callable to receive a :class:`Timing` at the end of each phase.
+    """
+    global _hooks
+    with _hooks_lock:
+        # replaced rather than modified in place, so `record` can iterate without a lock
+        _hooks = [*_hooks, hook]
+
+
+def remove_hook(hook: Hook) -> None:
+    global _hooks
+    with _hooks_lock:
+        _hooks = [i for i in _hooks if i is not hook]
+
+
+def is_enabled() -> bool:
+    return bool(_hooks)
+
+
+def record(phase: str, duration: float, failed: bool = False, **attrs: Any) -> None:
+    """
+    Pass the timing of a phase to every hook.
+
+    Args:
+      phase (str): Phase name.
+      duration (float): Duration in seconds.
+      failed (bool): If ``True``, the phase raised an exception.
+      **attrs (Any): Details of the phase, such as byte counts.
+    """
+    hooks = _hooks
+    if not hooks:
+        return
+    timing = Timing(phase, duration, attrs, failed)
+    for hook in hooks:
+        try:
+            hook(timing)
+        except Exception as exc:
+            LOGGER.warning(f"Instrumentation hook {hook!r} failed: {exc}")
+
+
+class _Span:
+    __slots__ = ("phase", "attrs", "start")
+
+    def __init__(self, phase: str, attrs: Dict[str, Any]) -> None:
+        self.phase = phase
+        self.attrs = attrs
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        _get_open_spans().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        _get_open_spans().remove(self)
+        record(
+            self.phase, time.perf_counter() - self.start, failed=exc_type is not None, **self.attrs
+        )
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _get_open_spans() -> List[_Span]:
+    if not hasattr(_open_spans, "stack"):
+        _open_spans.stack = []
+    return _open_spans.stack
+
+
+def annotate(**attrs: Any) -> None:
+    """
+    Add attributes to every span that is open in this thread, without replacing
+    attributes they already have.
+    """
+    if not _hooks:
+        return
+    for open_span in _get_open_spans():
+        for key, value in attrs.items():
+            open_span.attrs.setdefault(key, value)
+
+
+def span(phase: str, **attrs: Any) -> Union[_Span, _NoSpan]:
+    """
+    Time a phase, as ``with span("phase", key=value) as s: ...``.
+
+    Attributes that are only known at the end of the phase can be added with
+    ``s.set(key=value)``.
+    """
+    if not _hooks:
+        return _NO_SPAN
+    return _Span(phase, attrs)
+
+
+class LoggingHook:
+    """
+    Log the timing of each phase.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger or LOGGER
+        self.level = level
+
+    def __call__(self, timing: Timing) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        attrs = "".join(f" {k}={v}" for k, v in timing.attrs.items())
+        status = " failed" if timing.failed else ""
+        self.logger.log(
+            self.level, f"{timing.phase}: {timing.duration * 1000:.3f}ms{status}{attrs}"
+        )
+
+
+class MetricsSink:
+    """
+    Aggregate the timings of each phase in memory.
+
+    Numeric attributes, such as byte counts, are summed per phase.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._phases: Dict[str, Dict[str, float]] = {}
+
+    def __call__(self, timing: Timing) -> None:
+        with self._lock:
+            stats = self._phases.setdefault(
+                timing.phase, {"count": 0, "failed": 0, "total": 0.0, "max": 0.0}
+            )
+            stats["count"] += 1
+            stats["failed"] += timing.failed
+            stats["total"] += timing.duration
+            stats["max"] = max(stats["max"], timing.duration)
+            for key, value in timing.attrs.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    stats[key] = stats.get(key, 0) + value
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the statistics of each phase: ``count``, ``failed``, the ``total``
+        and ``max`` durations in seconds, and the sum of each numeric attribute.
+        """
+        with self._lock:
+            return {phase: dict(stats) for phase, stats in self._phases.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._phases.clear()
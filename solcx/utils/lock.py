@@ -1,9 +1,15 @@
+import abc
 import os
 import sys
 import tempfile
 import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from solcx.exceptions import LockTimeoutError
+from solcx.utils import instrument
 
 if sys.platform == "win32":
     import msvcrt
@@ -14,13 +20,31 @@ else:
 
     NON_BLOCKING = fcntl.LOCK_EX | fcntl.LOCK_NB
     BLOCKING = fcntl.LOCK_EX
+    SHARED_NON_BLOCKING = fcntl.LOCK_SH | fcntl.LOCK_NB
+    SHARED_BLOCKING = fcntl.LOCK_SH
+
+SOLCX_LOCK_TIMEOUT_VARIABLE = "SOLCX_LOCK_TIMEOUT"
+LOCK_PREFIX = ".solcx-lock-"
+STALE_LOCK_AGE = 86400
+
+# polling interval bounds when waiting for a lock with a timeout, or asynchronously
+MIN_POLL_INTERVAL = 0.001
+MAX_POLL_INTERVAL = 0.05
 
 _locks: Dict[str, Union["UnixLock", "WindowsLock"]] = {}
 _base_lock = threading.Lock()
+_lock_timeout: Optional[float] = None
+_cleaned_up = False
 
 
 def get_process_lock(lock_id: str) -> Union["UnixLock", "WindowsLock"]:
+    global _cleaned_up
     with _base_lock:
+        if not _cleaned_up:
+            # lock files are never removed by the processes that use them, so the first
+            # lock in each process removes any that have not been used in a long time
+            _cleaned_up = True
+            cleanup_stale_locks()
         if lock_id not in _locks:
             if sys.platform == "win32":
                 _locks[lock_id] = WindowsLock(lock_id)
@@ -29,62 +53,377 @@ def get_process_lock(lock_id: str) -> Union["UnixLock", "WindowsLock"]:
         return _locks[lock_id]
 
 
-class _ProcessLock:
+def set_lock_timeout(timeout: Optional[float]) -> None:
+    """
+    Set the default number of seconds to wait for a lock before raising
+    :class:`~solcx.exceptions.LockTimeoutError`.
+
+    Args:
+      timeout (Optional[float]): Timeout in seconds. If ``None``, the
+        ``SOLCX_LOCK_TIMEOUT`` environment variable is used, and when that is
+        not set locks are waited on indefinitely.
+    """
+    global _lock_timeout
+    _lock_timeout = timeout
+
+
+def get_lock_timeout() -> Optional[float]:
+    if _lock_timeout is not None:
+        return _lock_timeout
+    if value := os.getenv(SOLCX_LOCK_TIMEOUT_VARIABLE):
+        return float(value)
+    return None
+
+
+def get_lock_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Return contention statistics for every lock used by this process.
+
+    Returns:
+      Dict: Statistics keyed by lock id. ``acquired`` counts successful
+      acquisitions, of which ``contended`` had to wait. ``timeouts`` counts
+      acquisitions that gave up, and ``wait_time``/``max_wait`` are the total and
+      longest times spent waiting, in seconds.
+    """
+    with _base_lock:
+        locks = list(_locks.items())
+    return {lock_id: lock.stats() for lock_id, lock in locks}
+
+
+def cleanup_stale_locks(max_age: float = STALE_LOCK_AGE) -> List[Path]:
+    """
+    Remove lock files in the temporary directory that are not held, and have not
+    been used for ``max_age`` seconds.
+
+    Returns:
+      List: Removed lock files.
+    """
+    in_use = {i._lock_path for i in _locks.values()}
+    removed = []
+    for path in Path(tempfile.gettempdir()).glob(f"{LOCK_PREFIX}*"):
+        try:
+            if path in in_use or time.time() - path.stat().st_mtime < max_age:
+                continue
+            if sys.platform == "win32":
+                # a held lock file cannot be removed on windows
+                path.unlink()
+            else:
+                with path.open("a") as fp:
+                    try:
+                        fcntl.flock(fp, NON_BLOCKING)
+                    except BlockingIOError:
+                        continue
+                    # processes that opened the file before it was removed notice that
+                    # it has been replaced when acquiring, see `UnixLock`
+                    path.unlink()
+            removed.append(path)
+        except OSError:
+            continue
+    return removed
+
+
+class _ReadWriteLock:
+    """
+    Thread-level lock that is either held exclusively by one thread, or shared
+    by any number of threads. The exclusive holder may also take the shared lock.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+
+    def owned(self) -> bool:
+        return self._writer == threading.get_ident()
+
+    def acquire_shared(self, deadline: Optional[float], reentrant: bool = True) -> bool:
+        with self._cond:
+            while self._writer is not None and not (reentrant and self.owned()):
+                if not _wait(self._cond, deadline):
+                    return False
+            self._readers += 1
+            return True
+
+    def release_shared(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_exclusive(self, deadline: Optional[float]) -> bool:
+        with self._cond:
+            while self._writer is not None or self._readers:
+                if not _wait(self._cond, deadline):
+                    return False
+            self._writer = threading.get_ident()
+            return True
+
+    def release_exclusive(self) -> None:
+        with self._cond:
+            self._writer = None
+            self._cond.notify_all()
+
+
+def _wait(cond: threading.Condition, deadline: Optional[float]) -> bool:
+    # wait on `cond` until notified, returning `False` if `deadline` has passed
+    if deadline is None:
+        cond.wait()
+        return True
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return False
+    cond.wait(remaining)
+    return True
+
+
+class _ProcessLock(abc.ABC):
     """
     Ensure an action is both thread-safe and process-safe.
+
+    The lock is exclusive by default. Use ``acquire(blocking, shared=True)`` or
+    ``with lock.shared():`` to hold it alongside other shared holders, e.g. while
+    running a binary that must not be replaced in the meantime.
+
+    Used as a context manager, the lock waits for the timeout given by
+    :func:`get_lock_timeout` and raises :class:`~solcx.exceptions.LockTimeoutError`
+    when it expires.
     """
 
     def __init__(self, lock_id: str) -> None:
-        self._lock = threading.Lock()
-        self._lock_path = Path(tempfile.gettempdir()).joinpath(f".solcx-lock-{lock_id}")
+        self._lock_id = lock_id
+        self._lock = _ReadWriteLock()
+        self._lock_path = Path(tempfile.gettempdir()).joinpath(f"{LOCK_PREFIX}{lock_id}")
         self._lock_file = self._lock_path.open("w")
+        # guards the file lock while it is shared between threads of this process
+        self._shared_guard = threading.Lock()
+        self._shared_count = 0
+        self._stats_lock = threading.Lock()
+        self._stats = {"acquired": 0, "contended": 0, "timeouts": 0, "wait_time": 0.0}
+        self._max_wait = 0.0
 
-
-class UnixLock(_ProcessLock):
     def __enter__(self) -> None:
-        self.acquire(True)
+        self._acquire_or_raise(shared=False)
 
     def __exit__(self, *args: Any) -> None:
         self.release()
 
-    def acquire(self, blocking: bool) -> bool:
-        if not self._lock.acquire(blocking):
-            return False
+    async def __aenter__(self) -> None:
+        if not await self.acquire_async(timeout=get_lock_timeout()):
+            raise LockTimeoutError(f"Timed out waiting for lock '{self._lock_id}'")
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.release()
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        self._acquire_or_raise(shared=True)
         try:
-            fcntl.flock(self._lock_file, BLOCKING if blocking else NON_BLOCKING)
-        except BlockingIOError:
-            self._lock.release()
+            yield
+        finally:
+            self.release(shared=True)
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            return {**self._stats, "max_wait": self._max_wait}
+
+    def acquire(
+        self, blocking: bool = True, shared: bool = False, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Acquire the lock.
+
+        Args:
+          blocking (bool): If ``False``, return immediately when the lock is held.
+          shared (bool): If ``True``, acquire the lock in shared mode.
+          timeout (Optional[float]): Maximum number of seconds to wait when
+            ``blocking`` is ``True``. Waits indefinitely if ``None``.
+
+        Returns:
+          bool: ``True`` if the lock was acquired.
+        """
+        # the uncontended case is attempted first, so that it is never timed
+        if self._acquire(shared, time.monotonic()):
+            self._record(0.0, True)
+            return True
+        if not blocking:
             return False
+
+        start = time.monotonic()
+        acquired = self._acquire(shared, None if timeout is None else start + timeout)
+        self._record(time.monotonic() - start, acquired, timed_out=not acquired)
+        return acquired
+
+    async def acquire_async(self, shared: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the lock without blocking the event loop.
+
+        The lock is polled, sleeping between attempts. Unlike :meth:`acquire`, the
+        shared lock is never granted to the holder of the exclusive lock, as
+        coroutines on one event loop share a thread.
+
+        Args:
+          shared (bool): If ``True``, acquire the lock in shared mode.
+          timeout (Optional[float]): Maximum number of seconds to wait. Waits
+            indefinitely if ``None``.
+
+        Returns:
+          bool: ``True`` if the lock was acquired.
+        """
+        import asyncio
+
+        start = time.monotonic()
+        delay = MIN_POLL_INTERVAL
+        while not self._acquire(shared, time.monotonic(), reentrant=False):
+            waited = time.monotonic() - start
+            if timeout is not None and waited >= timeout:
+                self._record(waited, False, timed_out=True)
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_POLL_INTERVAL)
+
+        waited = time.monotonic() - start
+        self._record(waited, True, contended=delay > MIN_POLL_INTERVAL)
         return True
 
-    def release(self) -> None:
-        fcntl.flock(self._lock_file, fcntl.LOCK_UN)
-        self._lock.release()
+    def release(self, shared: bool = False) -> None:
+        if shared:
+            self._release_shared()
+        else:
+            self._lock_file_release()
+            self._lock.release_exclusive()
 
+    def _acquire_or_raise(self, shared: bool) -> None:
+        if not self.acquire(True, shared=shared, timeout=get_lock_timeout()):
+            raise LockTimeoutError(f"Timed out waiting for lock '{self._lock_id}'")
 
-class WindowsLock(_ProcessLock):
-    def __enter__(self) -> None:
-        self.acquire(True)
+    def _record(
+        self, wait: float, acquired: bool, timed_out: bool = False, contended: bool = True
+    ) -> None:
+        with self._stats_lock:
+            if acquired:
+                self._stats["acquired"] += 1
+            if timed_out:
+                self._stats["timeouts"] += 1
+            if wait and contended:
+                self._stats["contended"] += acquired
+                self._stats["wait_time"] += wait
+                self._max_wait = max(self._max_wait, wait)
+        if wait and contended:
+            instrument.record("lock.wait", wait, failed=not acquired, lock=self._lock_id)
 
-    def __exit__(self, *args: Any) -> None:
-        self.release()
+    def _acquire(self, shared: bool, deadline: Optional[float], reentrant: bool = True) -> bool:
+        if shared:
+            return self._acquire_shared(deadline, reentrant)
 
-    def acquire(self, blocking: bool) -> bool:
-        if not self._lock.acquire(blocking):
+        if not self._lock.acquire_exclusive(deadline):
+            return False
+        if not self._lock_file_wait(deadline, shared=False):
+            self._lock.release_exclusive()
             return False
+        return True
+
+    def _acquire_shared(self, deadline: Optional[float], reentrant: bool) -> bool:
+        if not self._lock.acquire_shared(deadline, reentrant):
+            return False
+        if self._lock.owned():
+            # the file is already locked exclusively by this thread
+            return True
+
+        with self._shared_guard:
+            if not self._shared_count and not self._lock_file_wait(deadline, shared=True):
+                self._lock.release_shared()
+                return False
+            self._shared_count += 1
+        return True
+
+    def _release_shared(self) -> None:
+        if not self._lock.owned():
+            with self._shared_guard:
+                self._shared_count -= 1
+                if not self._shared_count:
+                    self._lock_file_release()
+        self._lock.release_shared()
+
+    def _lock_file_wait(self, deadline: Optional[float], shared: bool) -> bool:
+        if deadline is None:
+            return self._lock_file_acquire(True, shared)
+
+        delay = MIN_POLL_INTERVAL
+        while not self._lock_file_acquire(False, shared):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, MAX_POLL_INTERVAL)
+        return True
+
+    @abc.abstractmethod
+    def _lock_file_acquire(self, blocking: bool, shared: bool) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def _lock_file_release(self) -> None:
+        pass
+
+
+class UnixLock(_ProcessLock):
+    def _lock_file_acquire(self, blocking: bool, shared: bool) -> bool:
+        if shared:
+            flags = SHARED_BLOCKING if blocking else SHARED_NON_BLOCKING
+        else:
+            flags = BLOCKING if blocking else NON_BLOCKING
+
         while True:
             try:
-                fd = os.open(self._lock_path, OPEN_MODE)  # type: ignore
+                fcntl.flock(self._lock_file, flags)
+            except BlockingIOError:
+                return False
+
+            # if the lock file was removed by `cleanup_stale_locks` after it was opened,
+            # the lock must be taken on the file that now exists at the same path
+            try:
+                if os.stat(self._lock_path).st_ino == os.fstat(self._lock_file.fileno()).st_ino:
+                    os.utime(self._lock_file.fileno())
+                    return True
+            except FileNotFoundError:
+                pass
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = self._lock_path.open("a")
+
+    def _lock_file_release(self) -> None:
+        fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+
+class WindowsLock(_ProcessLock):
+    # `msvcrt.locking` has no shared mode. Holding the file lock for shared holders would
+    # serialize them across processes, e.g. pytest-xdist workers compiling with the same
+    # version, so a shared lock only waits until no exclusive holder, e.g. an install of
+    # that version, has the file locked, and is then shared between threads of this process
+    _fd: Optional[int] = None
+
+    def _lock_file_acquire(self, blocking: bool, shared: bool) -> bool:
+        while True:
+            fd = os.open(self._lock_path, OPEN_MODE)  # type: ignore
+            try:
                 msvcrt.locking(  # type: ignore
                     fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1  # type: ignore
                 )
-                self._fd = fd
-                return True
             except OSError:
+                os.close(fd)
                 if not blocking:
-                    self._lock.release()
                     return False
+                continue
+
+            if shared:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # type: ignore
+                os.close(fd)
+            else:
+                self._fd = fd
+            return True
 
-    def release(self) -> None:
-        msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)  # type: ignore
-        self._lock.release()
+    def _lock_file_release(self) -> None:
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # type: ignore
+            os.close(fd)
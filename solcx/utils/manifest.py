@@ -0,0 +1,56 @@
+"""
+Install manifest, recording what is known about each ``solc`` binary in an
+installation folder.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from solcx.utils.lock import get_process_lock
+
+MANIFEST_FILENAME = ".solcx-manifest.json"
+
+
+def get_manifest_path(install_folder: Path) -> Path:
+    return install_folder.joinpath(MANIFEST_FILENAME)
+
+
+def read_manifest(install_folder: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the manifest for an installation folder, keyed by version string.
+
+    A missing or unreadable manifest is treated as empty.
+    """
+    try:
+        with get_manifest_path(install_folder).open() as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def get_manifest_entry(install_folder: Path, version: str) -> Optional[Dict[str, Any]]:
+    return read_manifest(install_folder).get(version)
+
+
+def update_manifest(install_folder: Path, version: str, entry: Optional[Dict[str, Any]]) -> None:
+    """
+    Add, replace or (when ``entry`` is ``None``) remove the manifest entry for a version.
+
+    The manifest is rewritten atomically, so readers never see a partial file.
+    """
+    with get_process_lock("manifest"):
+        manifest = read_manifest(install_folder)
+        if entry is None:
+            if manifest.pop(version, None) is None:
+                return
+        else:
+            manifest[version] = entry
+
+        install_folder.mkdir(parents=True, exist_ok=True)
+        path = get_manifest_path(install_folder)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp_path.open("w") as fp:
+            json.dump(manifest, fp, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
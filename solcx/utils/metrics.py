@@ -0,0 +1,262 @@
+"""
+Prometheus metrics for compile and install activity.
+
+Metrics are collected from the phases reported by :mod:`solcx.utils.instrument`
+once :func:`enable_metrics` is called, and rendered in the Prometheus text
+exposition format by :func:`render_metrics`, or served over HTTP by
+:func:`start_metrics_server`. No client library is required.
+"""
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from solcx.utils import instrument
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+BYTES_BUCKETS = tuple(float(1 << i) for i in range(10, 31, 2))
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = SECONDS_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # per label set: a count for each bucket, then the sum of observed values
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        if labels not in self._values:
+            self._values[labels] = [0.0] * (len(self.buckets) + 1)
+        counts = self._values[labels]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        counts[-1] += value
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        bucket_labels = self.labels + ("le",)
+        for labels, counts in sorted(self._values.items()):
+            total = 0.0
+            for bound, count in zip(self.buckets, counts):
+                total += count
+                label_str = _format_labels(bucket_labels, labels + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{label_str} {_format_value(total)}")
+            label_str = _format_labels(self.labels, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{label_str} {_format_value(total)}")
+        return lines
+
+
+class PrometheusMetrics:
+    """
+    Instrumentation hook that aggregates phases into Prometheus metrics.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.api_seconds = Histogram(
+            "solcx_api_duration_seconds",
+            "Duration of compile_source, compile_files, compile_standard and link_code calls.",
+            ("api", "version", "status"),
+        )
+        self.solc_seconds = Histogram(
+            "solcx_solc_duration_seconds",
+            "Duration of solc processes, including input and output transfer.",
+            ("version",),
+        )
+        self.input_bytes = Histogram(
+            "solcx_solc_input_bytes",
+            "Size of the input given to solc on stdin.",
+            ("version",),
+            BYTES_BUCKETS,
+        )
+        self.output_bytes = Histogram(
+            "solcx_solc_output_bytes",
+            "Size of the output of solc.",
+            ("version",),
+            BYTES_BUCKETS,
+        )
+        self.cache_requests = Counter(
+            "solcx_cache_requests_total",
+            "Cache lookups, by cache and result.",
+            ("cache", "result"),
+        )
+        self.download_bytes = Counter(
+            "solcx_download_bytes_total", "Bytes of solc binaries downloaded."
+        )
+        self.download_seconds = Counter(
+            "solcx_download_seconds_total", "Time spent downloading solc binaries."
+        )
+        self.lock_wait_seconds = Histogram(
+            "solcx_lock_wait_seconds", "Time spent waiting for contended locks.", ("status",)
+        )
+        self.phase_seconds = Histogram(
+            "solcx_phase_duration_seconds",
+            "Duration of each instrumented phase.",
+            ("phase",),
+        )
+        self._metrics: List[_Metric] = [
+            self.api_seconds,
+            self.solc_seconds,
+            self.input_bytes,
+            self.output_bytes,
+            self.cache_requests,
+            self.download_bytes,
+            self.download_seconds,
+            self.lock_wait_seconds,
+            self.phase_seconds,
+        ]
+
+    def __call__(self, timing: instrument.Timing) -> None:
+        phase, attrs = timing.phase, timing.attrs
+        status = "error" if timing.failed else "ok"
+        with self._lock:
+            if phase.startswith("cache."):
+                result = "hit" if attrs.get("hit") else "miss"
+                self.cache_requests.inc((phase[6:], result))
+                return
+
+            self.phase_seconds.observe((phase,), timing.duration)
+            version = str(attrs.get("version", ""))
+            if phase == "api":
+                self.api_seconds.observe((attrs["api"], version, status), timing.duration)
+            elif phase == "communicate":
+                self.solc_seconds.observe((version,), timing.duration)
+                if "stdin_size" in attrs:
+                    self.input_bytes.observe((version,), attrs["stdin_size"])
+                    self.output_bytes.observe((version,), attrs["stdout_size"])
+            elif phase == "install.download" and not timing.failed:
+                self.download_bytes.inc(amount=attrs.get("bytes", 0))
+                self.download_seconds.inc(amount=timing.duration)
+            elif phase == "lock.wait":
+                status = "timeout" if timing.failed else "acquired"
+                self.lock_wait_seconds.observe((status,), timing.duration)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [line for metric in self._metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+_metrics: Optional[PrometheusMetrics] = None
+_metrics_lock = threading.Lock()
+
+
+def enable_metrics() -> PrometheusMetrics:
+    """
+    Start collecting metrics. Calling this again returns the same collector.
+    """
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = PrometheusMetrics()
+            instrument.add_hook(_metrics)
+        return _metrics
+
+
+def disable_metrics() -> None:
+    """
+    Stop collecting metrics, and discard those collected so far.
+    """
+    global _metrics
+    with _metrics_lock:
+        if _metrics is not None:
+            instrument.remove_hook(_metrics)
+            _metrics = None
+
+
+def render_metrics() -> str:
+    """
+    Return the collected metrics in the Prometheus text exposition format.
+    """
+    return enable_metrics().render()
+
+
+def start_metrics_server(port: int = 0, addr: str = "127.0.0.1") -> Tuple[str, int]:
+    """
+    Serve the collected metrics over HTTP from a daemon thread, for Prometheus to scrape.
+
+    Args:
+      port (int): Port to listen on. If ``0``, a free port is chosen.
+      addr (str): Address to listen on. Defaults to the loopback interface.
+
+    Returns:
+      Tuple: Address and port the server listens on.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    metrics = enable_metrics()
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name="solcx-metrics").start()
+    host, bound_port = server.server_address[:2]
+    return str(host), int(bound_port)
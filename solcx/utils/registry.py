@@ -0,0 +1,100 @@
+"""
+In-process registry of the ``solc`` versions installed in each installation folder.
+
+The registry combines the ``solc-v*`` entries of a folder with its install manifest,
+and is cached per folder. The cache is keyed by the modification time of the
+folder, which changes whenever a version is added, removed or renamed into place,
+so a lookup costs a single ``stat`` call rather than a directory scan.
+"""
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from packaging.version import InvalidVersion, Version
+
+from solcx.utils import instrument
+from solcx.utils.manifest import read_manifest
+
+# filesystem timestamps are coarse (a few ms on Linux, 2s on FAT), so a folder
+# modified within this many ns of being scanned may change again without its
+# mtime changing. Such scans are not reused, like git's "racy clean" entries.
+RACY_INTERVAL_NS = 2_000_000_000
+
+
+class InstalledSolc(NamedTuple):
+    version: Version
+    path: Path
+    sha256: Optional[str]
+    verified: bool
+
+
+_registry: Dict[Path, Tuple[int, Dict[Version, InstalledSolc]]] = {}
+_registry_lock = threading.Lock()
+
+
+def _scan(install_folder: Path) -> Dict[Version, InstalledSolc]:
+    manifest = read_manifest(install_folder)
+    installed = {}
+    for path in install_folder.glob("solc-v*"):
+        try:
+            version = Version(path.name[6:])
+        except InvalidVersion:
+            continue
+        if sys.platform == "win32":
+            path = path.joinpath("solc.exe")
+
+        entry = manifest.get(str(version), {})
+        installed[version] = InstalledSolc(
+            version, path, entry.get("sha256"), entry.get("verified", False)
+        )
+    return installed
+
+
+def get_installed(install_folder: Path) -> Dict[Version, InstalledSolc]:
+    """
+    Return the ``solc`` versions installed in a folder.
+
+    Args:
+      install_folder (Path): Installation folder.
+
+    Returns:
+      Dict: Installed versions, mapped to their registry entries.
+    """
+    try:
+        mtime = os.stat(install_folder).st_mtime_ns
+    except FileNotFoundError:
+        invalidate(install_folder)
+        return {}
+
+    with _registry_lock:
+        cached = _registry.get(install_folder)
+    if cached is not None and cached[0] == mtime:
+        instrument.record("cache.registry", 0.0, hit=True)
+        return cached[1]
+
+    instrument.record("cache.registry", 0.0, hit=False)
+    installed = _scan(install_folder)
+    with _registry_lock:
+        if time.time_ns() - mtime > RACY_INTERVAL_NS:
+            _registry[install_folder] = (mtime, installed)
+        else:
+            _registry.pop(install_folder, None)
+    return installed
+
+
+def get_installed_entry(install_folder: Path, version: Version) -> Optional[InstalledSolc]:
+    return get_installed(install_folder).get(version)
+
+
+def invalidate(install_folder: Optional[Path] = None) -> None:
+    """
+    Drop cached registry data for a folder, or for all folders.
+    """
+    with _registry_lock:
+        if install_folder is None:
+            _registry.clear()
+        else:
+            _registry.pop(install_folder, None)
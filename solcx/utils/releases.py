@@ -0,0 +1,184 @@
+"""
+Cached index of the ``solc`` releases published on GitHub.
+
+Releases are fetched page by page and cached on disk together with the ETag of
+the first page. Within the cache TTL no request is made at all; after it, the
+first page is requested conditionally, and the cache is reused if GitHub
+replies ``304 Not Modified``. Such requests do not count against the API rate
+limit.
+"""
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from solcx.utils import instrument
+
+LOGGER = logging.getLogger("solcx")
+
+SOLCX_RELEASE_CACHE_TTL_VARIABLE = "SOLCX_RELEASE_CACHE_TTL"
+DEFAULT_CACHE_TTL = 3600.0
+MAX_PAGES = 20
+MAX_RETRIES = 3
+# rate limits that reset further in the future fail immediately instead of waiting
+MAX_RATE_LIMIT_WAIT = 60.0
+
+
+def get_cache_ttl() -> float:
+    """
+    Return the number of seconds that cached release metadata is used for,
+    without checking GitHub for changes.
+
+    Set with the ``SOLCX_RELEASE_CACHE_TTL`` environment variable.
+    """
+    return float(os.getenv(SOLCX_RELEASE_CACHE_TTL_VARIABLE, DEFAULT_CACHE_TTL))
+
+
+def _read_cache(cache_path: Path, url: str) -> Optional[Dict[str, Any]]:
+    try:
+        with cache_path.open() as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("url") != url:
+        return None
+    return cache
+
+
+def _write_cache(cache_path: Path, cache: Dict[str, Any]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    with temp_path.open("w") as fp:
+        json.dump(cache, fp)
+    os.replace(temp_path, cache_path)
+
+
+def _get_error_message(response: Any) -> str:
+    try:
+        message = response.json()["message"]
+    except (ValueError, KeyError, TypeError):
+        message = response.reason
+    msg = f"Status {response.status_code} when getting solc versions from Github: '{message}'"
+    if response.status_code in (403, 429):
+        msg += (
+            "\n\nIf this issue persists, generate a Github API token and store"
+            " it as the environment variable `GITHUB_TOKEN`:\n"
+            "https://github.blog/2013-05-16-personal-api-tokens/"
+        )
+    return msg
+
+
+def _get_rate_limit_wait(response: Any, default: float) -> float:
+    if retry_after := response.headers.get("Retry-After"):
+        return float(retry_after)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        if reset := response.headers.get("X-RateLimit-Reset"):
+            return max(float(reset) - time.time(), 0.0) + 1
+    return default
+
+
+def _request(url: str, headers: Dict[str, str], rate_limit_wait_time: float) -> Any:
+    # GET with bounded retries on rate limiting, waiting as long as GitHub asks
+    import requests
+
+    for attempt in range(MAX_RETRIES + 1):
+        response = requests.get(url, headers=headers)
+        if response.status_code in (200, 304):
+            return response
+
+        msg = _get_error_message(response)
+        if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+            break
+        wait = _get_rate_limit_wait(response, rate_limit_wait_time)
+        if wait > MAX_RATE_LIMIT_WAIT:
+            msg += f"\n\nThe rate limit resets in {wait:.0f} seconds."
+            break
+
+        LOGGER.warning(msg)
+        time.sleep(wait)
+        rate_limit_wait_time += rate_limit_wait_time / 2
+
+    raise ConnectionError(msg)
+
+
+def _fetch_releases(
+    url: str, headers: Dict[str, str], rate_limit_wait_time: float, etag: Optional[str]
+) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    # fetch every page of releases, or return `None` if the first page is unchanged
+    request_headers = dict(headers, **{"If-None-Match": etag}) if etag else headers
+    response = _request(url, request_headers, rate_limit_wait_time)
+    if response.status_code == 304:
+        return None
+
+    first_etag = response.headers.get("ETag")
+    releases = []
+    for _ in range(MAX_PAGES):
+        for release in response.json():
+            releases.append(
+                {
+                    "tag_name": release["tag_name"],
+                    "assets": [i["name"] for i in release.get("assets", [])],
+                }
+            )
+        if not (next_url := response.links.get("next", {}).get("url")):
+            break
+        response = _request(next_url, headers, rate_limit_wait_time)
+
+    return releases, first_etag
+
+
+def get_github_releases(
+    url: str,
+    cache_path: Optional[Path] = None,
+    headers: Optional[Dict[str, str]] = None,
+    ttl: Optional[float] = None,
+    rate_limit_wait_time: float = 3.0,
+) -> List[Dict[str, Any]]:
+    """
+    Return the releases of a GitHub repository, using the on-disk cache if possible.
+
+    When GitHub cannot be reached, an expired cache is used rather than failing.
+
+    Args:
+      url (str): Releases endpoint of the GitHub API.
+      cache_path (Optional[Path]): Cache file. If not given, nothing is cached.
+      headers (Optional[Dict[str, str]]): Headers to include in each request.
+      ttl (Optional[float]): Seconds to use the cache for without revalidating it.
+        Defaults to :func:`get_cache_ttl`.
+      rate_limit_wait_time (float): Seconds to wait when rate limited, if GitHub
+        does not say how long to wait. Grows by half on each retry.
+
+    Returns:
+      List: Releases as ``{"tag_name": str, "assets": [asset names]}``, newest first.
+    """
+    cache = _read_cache(cache_path, url) if cache_path else None
+    ttl = get_cache_ttl() if ttl is None else ttl
+    if cache is not None and time.time() - cache["fetched_at"] < ttl:
+        instrument.record("cache.releases", 0.0, hit=True)
+        return cache["releases"]
+
+    try:
+        result = _fetch_releases(
+            url, headers or {}, rate_limit_wait_time, cache["etag"] if cache else None
+        )
+    except OSError as exc:
+        if cache is None:
+            raise
+        LOGGER.warning(f"Using cached solc releases, as Github could not be reached: {exc}")
+        return cache["releases"]
+
+    # a cache revalidated with `304 Not Modified` counts as a hit
+    instrument.record("cache.releases", 0.0, hit=result is None)
+    if result is None:
+        assert cache is not None
+        releases, etag = cache["releases"], cache["etag"]
+    else:
+        releases, etag = result
+
+    if cache_path:
+        _write_cache(
+            cache_path, {"url": url, "etag": etag, "fetched_at": time.time(), "releases": releases}
+        )
+    return releases
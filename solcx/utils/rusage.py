@@ -0,0 +1,162 @@
+"""
+Resource usage of ``solc`` processes.
+
+On POSIX systems, processes started with :class:`AccountedPopen` are reaped with
+``os.wait4``, which returns the CPU time and peak memory of the child along with
+its exit status. Usage is also aggregated in memory per ``solc`` version and per
+compiler input, see :func:`get_resource_stats`.
+"""
+import os
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+from solcx.utils.spool import SpooledInput
+
+# inputs are tracked individually up to this many, least recently used first out
+MAX_TRACKED_INPUTS = 1024
+
+
+class ResourceUsage(NamedTuple):
+    """
+    Resources used by one ``solc`` process. CPU times and peak memory are
+    ``None`` where the platform does not report them.
+    """
+
+    wall_time: float
+    user_time: Optional[float]
+    system_time: Optional[float]
+    max_rss: Optional[int]
+
+
+class AccountedPopen(subprocess.Popen):
+    """
+    ``Popen`` that records the resource usage of the child when it is reaped.
+    """
+
+    # set by `solc_wrapper` once the process has finished
+    rusage: Optional[ResourceUsage] = None
+    _rusage: Optional[Any] = None
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        # `communicate` waits for the child once its output is read, so the child is
+        # reaped here with `wait4`, which also returns its resource usage. Where that
+        # is not possible, e.g. if the child was already reaped, `Popen.wait` is used
+        # and no usage is reported.
+        if self.returncode is None and timeout is None and hasattr(os, "wait4"):
+            try:
+                pid, status, rusage = os.wait4(self.pid, 0)
+            except ChildProcessError:
+                pass
+            else:
+                self._rusage = rusage
+                self.returncode = _get_return_code(status)
+        return super().wait(timeout)
+
+    def release_buffers(self) -> None:
+        """
+        Drop the copies of the input and output that ``communicate`` leaves on the
+        process object once it has returned. These are details of ``subprocess``, so
+        only the attributes that exist in this version of Python are cleared.
+        """
+        state = vars(self)
+        for name in ("_input", "_fileobj2output", "_stdout_buff", "_stderr_buff"):
+            if name in state:
+                state[name] = None
+
+    def get_usage(self, wall_time: float) -> ResourceUsage:
+        rusage = self._rusage
+        if rusage is None:
+            return ResourceUsage(wall_time, None, None, None)
+        # `ru_maxrss` is in bytes on macOS, and in kilobytes elsewhere
+        max_rss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+        return ResourceUsage(wall_time, rusage.ru_utime, rusage.ru_stime, max_rss)
+
+
+def _get_return_code(status: int) -> int:
+    # same as `os.waitstatus_to_exitcode`, which is not available before Python 3.9
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+_versions: Dict[str, Dict[str, float]] = {}
+_inputs: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+_stats_lock = threading.Lock()
+_last_usage = threading.local()
+
+
+def _add(stats: Dict[str, float], usage: ResourceUsage) -> None:
+    stats["count"] = stats.get("count", 0) + 1
+    stats["wall_time"] = stats.get("wall_time", 0.0) + usage.wall_time
+    if usage.user_time is not None and usage.system_time is not None:
+        stats["user_time"] = stats.get("user_time", 0.0) + usage.user_time
+        stats["system_time"] = stats.get("system_time", 0.0) + usage.system_time
+    if usage.max_rss is not None:
+        stats["max_rss"] = max(stats.get("max_rss", 0), usage.max_rss)
+
+
+def record_usage(version: str, input_key: str, usage: ResourceUsage) -> None:
+    _last_usage.usage = usage
+    with _stats_lock:
+        _add(_versions.setdefault(version, {}), usage)
+        if input_key in _inputs:
+            _inputs.move_to_end(input_key)
+        else:
+            _inputs[input_key] = {}
+            if len(_inputs) > MAX_TRACKED_INPUTS:
+                _inputs.popitem(last=False)
+        _add(_inputs[input_key], usage)
+
+
+def get_last_usage() -> Optional[ResourceUsage]:
+    """
+    Return the resources used by the last ``solc`` process run from this thread.
+    """
+    return getattr(_last_usage, "usage", None)
+
+
+def get_input_key(
+    source_files: Optional[Any], stdin: Union[str, SpooledInput, None], standard_json: bool = False
+) -> str:
+    """
+    Return the key that usage of an input is aggregated under: the source files
+    for file-based compiles, otherwise a digest of the input given on stdin.
+    """
+    if source_files:
+        if isinstance(source_files, (list, tuple)):
+            return ",".join(str(i) for i in source_files)
+        return str(source_files)
+
+    if isinstance(stdin, SpooledInput):
+        digest = stdin.digest
+    else:
+        import hashlib
+
+        digest = hashlib.blake2b((stdin or "").encode(), digest_size=8).hexdigest()
+    return f"{'standard-json' if standard_json else 'stdin'}:{digest}"
+
+
+def get_resource_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Return the resources used by ``solc`` processes in this process.
+
+    Returns:
+      Dict: ``{"versions": {...}, "inputs": {...}}``, keyed by ``solc`` version
+      and by input (see :func:`get_input_key`). Each entry holds the ``count``
+      of invocations, total ``wall_time``, ``user_time`` and ``system_time`` in
+      seconds, and the peak ``max_rss`` in bytes.
+    """
+    with _stats_lock:
+        return {
+            "versions": {k: dict(v) for k, v in _versions.items()},
+            "inputs": {k: dict(v) for k, v in _inputs.items()},
+        }
+
+
+def reset_resource_stats() -> None:
+    with _stats_lock:
+        _versions.clear()
+        _inputs.clear()
@@ -0,0 +1,144 @@
+"""
+Compiler input spooled to an anonymous file, and given to ``solc`` as its stdin.
+
+Large standard JSON inputs are serialized straight into the file, one source at a
+time, so no serialized copy of the whole input is held in memory. The file is
+an in-memory ``memfd`` on Linux, and a temporary file elsewhere.
+
+:class:`SpilledText` keeps text in a temporary file on disk instead, for large
+payloads that are rarely read, such as those of errors in lean mode.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import IO, Any, Dict, Union
+
+# serialized sources are written in chunks of at least this size
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _create_file() -> IO[bytes]:
+    if hasattr(os, "memfd_create"):
+        try:
+            return open(os.memfd_create("solcx-input"), "w+b")
+        except OSError:
+            # e.g. disallowed by a seccomp filter
+            pass
+    return tempfile.TemporaryFile()
+
+
+class SpooledInput:
+    """
+    Input for ``solc``, written to an anonymous file.
+
+    The file is closed with :meth:`close`, or when the object is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        import hashlib
+
+        self.file = _create_file()
+        self.size = 0
+        self._digest = hashlib.blake2b(digest_size=8)
+        self._buffer: list = []
+        self._buffered = 0
+
+    def write(self, data: str) -> int:
+        encoded = data.encode()
+        self._buffer.append(encoded)
+        self._buffered += len(encoded)
+        if self._buffered >= WRITE_BUFFER_SIZE:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        data = b"".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._digest.update(data)
+        self.file.write(data)
+        self.size += len(data)
+        self.file.flush()
+
+    def write_json(self, input_data: Dict[str, Any]) -> None:
+        """
+        Serialize a standard JSON input, as ``json.dumps`` would.
+
+        The top level is written one key at a time, and ``sources`` one source at a
+        time, so memory is only needed for the serialized form of a single source.
+        """
+        self.write("{")
+        for i, (key, value) in enumerate(input_data.items()):
+            self.write(f"{', ' if i else ''}{json.dumps(key)}: ")
+            if key == "sources" and isinstance(value, dict):
+                self.write("{")
+                for j, (name, source) in enumerate(value.items()):
+                    self.write(f"{', ' if j else ''}{json.dumps(name)}: ")
+                    self.write(json.dumps(source))
+                self.write("}")
+            else:
+                self.write(json.dumps(value))
+        self.write("}")
+        self.flush()
+        self.file.seek(0)
+
+    @property
+    def digest(self) -> str:
+        """
+        Digest of the input, in the same form as for inputs given as strings.
+        """
+        return self._digest.hexdigest()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def read_text(self) -> str:
+        """
+        Return the whole input. Used to provide the input lazily when ``solc`` fails.
+        """
+        self.flush()
+        # the file offset is shared with `solc`, which has read up to the end
+        self.file.seek(0)
+        return self.file.read().decode()
+
+    def spill(self) -> "SpilledText":
+        """
+        Return a copy of the input on disk, which remains readable once this
+        object is closed.
+        """
+        return SpilledText(self)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "SpooledInput":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class SpilledText:
+    """
+    Text written to a temporary file on disk, and read back each time it is called.
+    """
+
+    def __init__(self, text: Union[str, SpooledInput]) -> None:
+        self.file = tempfile.TemporaryFile()
+        if isinstance(text, SpooledInput):
+            # copied between the files, without reading the whole input into memory
+            text.flush()
+            text.file.seek(0)
+            shutil.copyfileobj(text.file, self.file)
+        else:
+            self.file.write(text.encode())
+        self.file.flush()
+        self.size = self.file.tell()
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            self.file.seek(0)
+            return self.file.read().decode()
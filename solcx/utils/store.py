@@ -0,0 +1,165 @@
+"""
+Content-addressed store of ``solc`` binaries, shared between installation folders.
+
+Binaries are stored by sha256 digest. Installation folders hold hardlinks into the
+store, so the link count of a store entry doubles as its reference count: an entry
+with no other links is no longer used by any folder and is removed by
+:func:`gc_store`.
+"""
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+SOLCX_STORE_PATH_VARIABLE = "SOLCX_STORE_PATH"
+
+# ioctl request to clone a file on copy-on-write filesystems (btrfs, xfs)
+FICLONE = 0x40049409
+
+
+def get_solcx_store_folder() -> Optional[Path]:
+    """
+    Return the location of the shared binary store, or ``None`` if it is disabled.
+
+    The store is enabled by setting the ``SOLCX_STORE_PATH`` environment variable.
+    It should be on the same filesystem as the installation folders that use it,
+    otherwise binaries are copied rather than linked.
+    """
+    if path := os.getenv(SOLCX_STORE_PATH_VARIABLE):
+        return Path(path)
+    return None
+
+
+def sha256_file(path: Path) -> str:
+    import hashlib
+
+    digest = hashlib.sha256()
+    with path.open("rb") as fp:
+        while chunk := fp.read(1 << 16):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_store_entry(store: Path, sha256: str) -> Path:
+    return store.joinpath("sha256", sha256[:2], sha256)
+
+
+def _reflink(source: Path, dest: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError("Reflinks are only supported on Linux")
+
+    import fcntl
+
+    with source.open("rb") as src, dest.open("wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            dest.unlink()
+            raise
+
+
+def copy_file(source: Path, dest: Path) -> None:
+    # reflink where possible, so that copies share storage until modified
+    try:
+        _reflink(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
+def link_or_copy(source: Path, dest: Path) -> None:
+    """
+    Hardlink ``source`` to ``dest`` where possible, then reflink, and only copy
+    as a last resort. A reflinked or copied ``dest`` is made executable.
+    """
+    try:
+        os.link(source, dest)
+        return
+    except OSError:
+        pass
+    copy_file(source, dest)
+    dest.chmod(dest.stat().st_mode | stat.S_IEXEC)
+
+
+def add_to_store(store: Path, source: Path, sha256: str, link: bool = False) -> Path:
+    """
+    Add a binary to the store, if it is not already present.
+
+    Args:
+      store (Path): Store folder.
+      source (Path): Binary to add. Its digest must already have been verified.
+      sha256 (str): Hex digest of ``source``.
+      link (bool): If ``True``, ``source`` is hardlinked into the store instead of
+        being copied. Only use this for files owned by py-solc-x, as the entry is
+        made read-only.
+
+    Returns:
+      Path: Store entry.
+    """
+    entry = get_store_entry(store, sha256)
+    if entry.exists():
+        return entry
+
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+    if link:
+        link_or_copy(source, temp_path)
+    else:
+        copy_file(source, temp_path)
+
+    # entries are shared between folders, and must never be modified in place
+    temp_path.chmod(0o555)
+    os.replace(temp_path, entry)
+    return entry
+
+
+def link_from_store(store: Path, sha256: str, dest: Path) -> bool:
+    """
+    Link a binary from the store into an installation folder.
+
+    Args:
+      store (Path): Store folder.
+      sha256 (str): Hex digest of the required binary.
+      dest (Path): Location of the installed binary.
+
+    Returns:
+      bool: ``False`` if the store does not contain the binary.
+    """
+    entry = get_store_entry(store, sha256)
+    if not entry.exists():
+        return False
+
+    temp_path = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    try:
+        link_or_copy(entry, temp_path)
+    except FileNotFoundError:
+        # the entry was removed by `gc_store` in the meantime
+        return False
+    os.replace(temp_path, dest)
+    return True
+
+
+def gc_store(store: Optional[Path] = None) -> List[Path]:
+    """
+    Remove store entries that are not linked from any installation folder.
+
+    Args:
+      store (Optional[Path]): Store folder. Defaults to the configured store.
+
+    Returns:
+      List: Removed entries.
+    """
+    store = store or get_solcx_store_folder()
+    if store is None or not store.exists():
+        return []
+
+    removed = []
+    for entry in store.glob("sha256/*/*"):
+        if entry.name.startswith("."):
+            continue
+        if entry.stat().st_nlink <= 1:
+            entry.unlink()
+            removed.append(entry)
+    return removed
@@ -0,0 +1,65 @@
+"""
+Last-use timestamps of installed ``solc`` versions.
+
+Each version has an empty marker file in ``.solcx-usage`` within the installation
+folder, and its modification time is the last time the version was used. Marking
+a version as used is a single ``utime`` call, so it needs no lock and is cheap
+enough for the compile hot path. Repeated uses within ``USAGE_RESOLUTION``
+seconds are only recorded once per process.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+USAGE_FOLDER = ".solcx-usage"
+USAGE_RESOLUTION = 60.0
+
+_last_recorded: Dict[Tuple[Path, str], float] = {}
+_lock = threading.Lock()
+
+
+def get_usage_path(install_folder: Path, version: str) -> Path:
+    return install_folder.joinpath(USAGE_FOLDER, version)
+
+
+def record_usage(install_folder: Path, version: str) -> None:
+    """
+    Mark a version as used now.
+    """
+    now = time.monotonic()
+    key = (install_folder, version)
+    with _lock:
+        if now - _last_recorded.get(key, -USAGE_RESOLUTION) < USAGE_RESOLUTION:
+            return
+        _last_recorded[key] = now
+
+    path = get_usage_path(install_folder, version)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        try:
+            path.parent.mkdir(exist_ok=True)
+            path.touch()
+        except OSError:
+            pass
+    except OSError:
+        # usage tracking is best-effort, e.g. for read-only installation folders
+        pass
+
+
+def get_last_used(install_folder: Path, version: str) -> float:
+    """
+    Return when a version was last used, as a unix timestamp, or ``0.0`` if unknown.
+    """
+    try:
+        return get_usage_path(install_folder, version).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def remove_usage(install_folder: Path, version: str) -> None:
+    with _lock:
+        _last_recorded.pop((install_folder, version), None)
+    get_usage_path(install_folder, version).unlink(missing_ok=True)
@@ -1,19 +1,37 @@
+import os
 import re
 import subprocess
+import sys
+import time
+import traceback
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from packaging.version import Version
 
 from solcx import install
 from solcx.exceptions import SolcError, UnknownOption, UnknownValue
+from solcx.utils import instrument, rusage
+from solcx.utils.lock import get_process_lock
+from solcx.utils.spool import SpooledInput
 
 # (major.minor.patch)(nightly)(commit)
 VERSION_REGEX = r"(\d+\.\d+\.\d+)(?:-nightly.\d+.\d+.\d+|)(\+commit.\w+)"
 
+# maximum length of a command line on Windows, in characters
+WINDOWS_COMMAND_LINE_LIMIT = 32767
+
+SOLCX_LEAN_MODE_VARIABLE = "SOLCX_LEAN_MODE"
+# in lean mode, error payloads longer than this many characters are spilled to disk
+SPILL_THRESHOLD = 64 << 10
+
+_lean_mode: Optional[bool] = None
+
 
 def get_version_str_from_solc_binary(solc_binary: Union[Path, str]) -> str:
-    stdout_data = subprocess.check_output([str(solc_binary), "--version"], encoding="utf8")
+    with instrument.span("probe.version"):
+        stdout_data = subprocess.check_output([str(solc_binary), "--version"], encoding="utf8")
     if not (match := next(re.finditer(VERSION_REGEX, stdout_data), None)):
         raise SolcError("Could not determine the solc binary version")
 
@@ -27,6 +45,60 @@ def get_solc_version(solc_binary: Union[Path, str], with_commit_hash: bool = Fal
     return version if with_commit_hash else Version(version.base_version)
 
 
+def get_command_line_limit() -> int:
+    """
+    Return the approximate number of bytes available for the arguments of a new
+    process, after the environment that it inherits.
+    """
+    if sys.platform == "win32":
+        return WINDOWS_COMMAND_LINE_LIMIT
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (ValueError, OSError):
+        arg_max = 1 << 17
+    # each string is followed by a null byte, and has a pointer to it
+    env_size = sum(len(k) + len(v) + 10 for k, v in os.environ.items())
+    return arg_max - env_size
+
+
+def set_lean_mode(enabled: Optional[bool] = True) -> None:
+    """
+    Enable or disable lean mode.
+
+    In lean mode, the stdin, stdout and stderr of a ``solc`` call that raises
+    :class:`~solcx.exceptions.SolcError` are spilled to temporary files and read back
+    on demand, and the local variables of the failed call are released from the
+    traceback. Errors that are kept, e.g. by a test suite, then hold onto very
+    little memory, at the cost of less detailed tracebacks.
+
+    Args:
+      enabled (Optional[bool]): Whether to use lean mode. If ``None``, lean mode
+        is used if the ``SOLCX_LEAN_MODE`` environment variable is set to ``1``.
+    """
+    global _lean_mode
+    _lean_mode = enabled
+
+
+def is_lean_mode() -> bool:
+    if _lean_mode is not None:
+        return _lean_mode
+    return os.environ.get(SOLCX_LEAN_MODE_VARIABLE, "").lower() in ("1", "true", "yes")
+
+
+@contextmanager
+def _release_on_error() -> Iterator[None]:
+    # in lean mode, ensure a `SolcError` raised within the context does not keep the
+    # compiler input or output in memory, via its payloads or its traceback
+    try:
+        yield
+    except SolcError as exc:
+        if is_lean_mode():
+            exc.spill(SPILL_THRESHOLD)
+            # frames that are still executing, including the caller, are skipped
+            traceback.clear_frames(exc.__traceback__)
+        raise
+
+
 def _to_string(key: str, value: Any) -> str:
     # convert data into a string prior to calling `solc`
     if isinstance(value, (int, str)):
@@ -41,19 +113,21 @@ def _to_string(key: str, value: Any) -> str:
 
 def solc_wrapper(
     solc_binary: Optional[Union[Path, str]] = None,
-    stdin: Optional[str] = None,
+    stdin: Optional[Union[str, SpooledInput]] = None,
     source_files: Optional[Union[List, Path, str]] = None,
     import_remappings: Optional[Union[Dict, List, str]] = None,
     success_return_code: Optional[int] = None,
     **kwargs: Any,
-) -> Tuple[str, str, List, subprocess.Popen]:
+) -> Tuple[str, str, List, rusage.AccountedPopen]:
     """
     Wrapper function for calling to ``solc``.
 
     Args:
       solc_binary (Optional[Union[Path, str]]): Location of the
         ``solc`` binary. If not given, the current default binary is used.
-      stdin (Optional[str]): Input to pass to ``solc`` via stdin.
+      stdin (Optional[Union[str, SpooledInput]]): Input to pass to ``solc`` via
+        stdin. A :class:`~solcx.utils.spool.SpooledInput` is passed as a file,
+        without being read into memory.
       source_files (Optional[Union[List, Path, str]]): Path, or list of
         paths, of sources to compile
       import_remappings (Optional[Union[Dict, List, str]]): Path remappings.
@@ -78,10 +152,12 @@ def solc_wrapper(
       str: Process ``stdout`` output.
       str: Process ``stderr`` output.
       List: Full command executed by the function.
-      Popen: Subprocess object used to call ``solc``.
+      AccountedPopen: Subprocess object used to call ``solc``. Its ``rusage``
+      attribute holds the :class:`~solcx.utils.rusage.ResourceUsage` of the process.
     """
     solc_binary = Path(solc_binary) if solc_binary else install.get_executable()
     solc_version = get_solc_version(solc_binary)
+    instrument.annotate(version=str(solc_version))
     command: List = [str(solc_binary)]
 
     if (
@@ -121,18 +197,40 @@ def solc_wrapper(
         # indicates that solc should read from stdin
         command.append("-")
 
-    if stdin is not None:
+    stdin_file = None
+    if isinstance(stdin, SpooledInput):
+        stdin_file, stdin = stdin, None
+        stdin_file.file.seek(0)
+    elif stdin is not None:
         stdin = str(stdin)
 
-    proc = subprocess.Popen(
-        command,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        encoding="utf8",
-    )
+    # the shared lock allows any number of concurrent compiles, while ensuring a binary
+    # installed by py-solc-x is not replaced or removed until they have finished. Other
+    # binaries are not managed by py-solc-x, so compiles with them never wait.
+    lock = get_process_lock(str(solc_version)) if install._get_install_entry(solc_binary) else None
+    with lock.shared() if lock else nullcontext():
+        start = time.perf_counter()
+        with instrument.span("spawn", version=str(solc_version)):
+            proc = rusage.AccountedPopen(
+                command,
+                stdin=subprocess.PIPE if stdin_file is None else stdin_file.file,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding="utf8",
+            )
+
+        with instrument.span("communicate", version=str(solc_version)) as span:
+            stdoutdata, stderrdata = proc.communicate(stdin)
+            proc.release_buffers()
+            span.set(
+                stdin_size=len(stdin or "") if stdin_file is None else stdin_file.size,
+                stdout_size=len(stdoutdata),
+                stderr_size=len(stderrdata),
+            )
 
-    stdoutdata, stderrdata = proc.communicate(stdin)
+    proc.rusage = proc.get_usage(time.perf_counter() - start)
+    input_key = rusage.get_input_key(source_files, stdin_file or stdin, "standard_json" in kwargs)
+    rusage.record_usage(str(solc_version), input_key, proc.rusage)
 
     stderrdata = (
         stderrdata.replace("Error: ", "") if stderrdata.startswith("Error: ") else stderrdata
@@ -154,12 +252,18 @@ def solc_wrapper(
                 f"'{option}' as an option for the '{flag}' flag"
             )
 
-        raise SolcError(
+        error = SolcError(
             command=command,
             return_code=proc.returncode,
-            stdin_data=stdin,
+            stdin_data=stdin if stdin_file is None else stdin_file.spill(),
             stdout_data=stdoutdata,
             stderr_data=stderrdata,
+            rusage=proc.rusage,
         )
+        if is_lean_mode():
+            error.spill(SPILL_THRESHOLD)
+            # the traceback keeps this frame alive, along with its local variables
+            del stdin, stdin_file, stdoutdata, stderrdata
+        raise error
 
     return stdoutdata, stderrdata, command, proc
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+import sys
+
 import pytest
 from packaging.version import Version
 from requests import ConnectionError
@@ -132,3 +134,33 @@ def baz_path(tmp_path_factory, baz_source):
     with source.open("w") as fp:
         fp.write(baz_source)
     return source
+
+
+FAKE_SOLC = """#!{executable}
+import json
+import sys
+
+if "--version" in sys.argv:
+    print("solc, the solidity compiler commandline interface")
+    print("Version: 0.8.20+commit.a1b79de6.Linux.g++")
+    sys.exit(0)
+if "--help" in sys.argv:
+    print("  --combined-json abi,bin")
+    sys.exit(0)
+sys.stdin.read()
+print(json.dumps({{"contracts": {{"<stdin>:Foo": {{"abi": "[]", "bin": "00"}}}}}}))
+"""
+
+
+@pytest.fixture
+def fake_solc(tmp_path_factory):
+    """
+    Yields the path to a script that behaves like solc 0.8.20, for tests that only
+    need the process interface of `solc`.
+    """
+    if sys.platform == "win32":
+        pytest.skip("fake solc is a script with a shebang")
+    path = tmp_path_factory.mktemp("fake-solc").joinpath("solc")
+    path.write_text(FAKE_SOLC.format(executable=sys.executable))
+    path.chmod(0o755)
+    yield path
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import shutil
 import subprocess
@@ -8,7 +10,7 @@ import pytest
 from packaging.version import Version
 
 import solcx
-from solcx.install import _download_solc
+from solcx.install import _get_os_name, _iter_download
 
 
 @pytest.fixture(scope="session")
@@ -33,6 +35,13 @@ def nosolc(tmp_path, mocker):
     bin_patch = mocker.patch("solcx.install.get_default_solc_binary")
     bin_patch.return_value = None
 
+    # ensure a binary installed during the test does not remain the active version
+    mocker.patch("solcx.install._default_solc_binary", solcx.install._default_solc_binary)
+    mocker.patch(
+        "solcx.install._default_solc_binary_resolved",
+        solcx.install._default_solc_binary_resolved,
+    )
+
     yield tmp_path
 
 
@@ -73,23 +82,23 @@ class CompileMock:
         self.solc_binary = solc_binary
         self.raise_cmd = None
 
-    def __call__(self, cmd, **kwargs):
+    def __call__(self, cmd, cwd=None, **kwargs):
         if cmd[0] == self.raise_cmd:
             raise subprocess.CalledProcessError(1, cmd)
-        if cmd == ["make"]:
-            install_folder = Path(os.getcwd()).joinpath("solc")
-            install_folder.mkdir()
+        if cmd[0] == "make":
+            install_folder = Path(cwd).joinpath("solc")
+            install_folder.mkdir(exist_ok=True)
             shutil.copy(self.solc_binary, install_folder.joinpath("solc"))
 
     def raise_on(self, cmd):
         self.raise_cmd = cmd
 
     @classmethod
-    def download(cls, url, show_progress):
+    def download(cls, url, show_progress, *args, **kwargs):
         if not cls.tarfile:
-            cls.tarfile = _download_solc(url, show_progress)
+            cls.tarfile = b"".join(_iter_download(url, show_progress))
 
-        return cls.tarfile
+        yield cls.tarfile
 
 
 @pytest.fixture
@@ -98,12 +107,12 @@ def compile_mock(monkeypatch, nosolc, solc_binary):
     Monkeypatches `compile_solc`.
 
     * The first use downloads a tarfile, which is then returned for all subsequent uses
-    * The call to `make` copies `solc_binary` to the expected location
+    * The call to `make` copies `solc_binary` to the build directory
     * `compile_make.raise_on` tells the mock to raise `CalledProcessError` on a specific command
     """
     mock = CompileMock(solc_binary)
     monkeypatch.setattr("subprocess.check_call", mock)
-    monkeypatch.setattr("solcx.install._download_solc", mock.download)
+    monkeypatch.setattr("solcx.install._iter_download", mock.download)
     yield mock
 
 
@@ -146,3 +155,32 @@ def pragmapatch(monkeypatch):
         ],
     )
     monkeypatch.setattr("solcx.install.set_solc_version", lambda *args: None)
+
+
+@pytest.fixture
+def make_mirror():
+    """
+    Yields a function that creates a local binary mirror, given a dict of
+    `{version: binary content}`. Digests in `list.json` may be overridden with the
+    optional `sha256` dict.
+
+    The configured binary mirrors are reset during teardown.
+    """
+
+    def _make_mirror(path, releases, sha256=None):
+        target = path.joinpath(f"{_get_os_name()}-amd64")
+        target.mkdir(parents=True)
+        list_json: dict = {"builds": [], "releases": {}}
+        for version, content in releases.items():
+            filename = f"solc-v{version}+commit.a1b79de6"
+            target.joinpath(filename).write_bytes(content)
+            digest = (sha256 or {}).get(version, hashlib.sha256(content).hexdigest())
+            list_json["releases"][version] = filename
+            list_json["builds"].append(
+                {"path": filename, "version": version, "sha256": f"0x{digest}"}
+            )
+        target.joinpath("list.json").write_text(json.dumps(list_json))
+        return path
+
+    yield _make_mirror
+    solcx.set_binary_mirrors(None)
@@ -0,0 +1,77 @@
+import hashlib
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.exceptions import ChecksumError, SolcInstallationError
+from solcx.install import _unlink_solc
+from solcx.utils.manifest import get_manifest_entry
+
+pytestmark = pytest.mark.skipif("sys.platform == 'win32'")
+
+
+@pytest.fixture
+def version_probe(mocker):
+    # the mirrored binaries are not executable, verified installs must not run them
+    patch = mocker.patch("solcx.wrapper.get_version_str_from_solc_binary")
+    patch.side_effect = Exception
+    yield patch
+
+
+def test_verified_install(nosolc, tmp_path, make_mirror, version_probe):
+    solcx.set_binary_mirrors([make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"})])
+    solcx.install_solc("0.8.20")
+
+    assert nosolc.joinpath("solc-v0.8.20").read_bytes() == b"solc"
+    assert not version_probe.called
+
+    entry = get_manifest_entry(nosolc, "0.8.20")
+    assert entry is not None
+    assert entry["sha256"] == hashlib.sha256(b"solc").hexdigest()
+    assert entry["verified"] is True
+    assert entry["path"] == "solc-v0.8.20"
+
+
+def test_checksum_mismatch(nosolc, tmp_path, make_mirror, version_probe):
+    mirror = make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"}, sha256={"0.8.20": "00"})
+    solcx.set_binary_mirrors([mirror])
+    with pytest.raises(ChecksumError):
+        solcx.install_solc("0.8.20")
+
+    assert not nosolc.joinpath("solc-v0.8.20").exists()
+    assert get_manifest_entry(nosolc, "0.8.20") is None
+
+
+def test_checksum_mismatch_fallback(nosolc, tmp_path, make_mirror, version_probe):
+    digest = hashlib.sha256(b"solc").hexdigest()
+    corrupt = make_mirror(
+        tmp_path.joinpath("corrupt"), {"0.8.20": b"s0lc"}, sha256={"0.8.20": digest}
+    )
+    mirror = make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"})
+    solcx.set_binary_mirrors([corrupt, mirror])
+    solcx.install_solc("0.8.20")
+
+    assert nosolc.joinpath("solc-v0.8.20").read_bytes() == b"solc"
+
+
+def test_unverified_install_is_executed(nosolc, tmp_path, make_mirror, version_probe):
+    solcx.set_binary_mirrors([make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"})])
+    solcx.install_solc("0.8.20")
+
+    # replacing the binary invalidates the verified digest
+    nosolc.joinpath("solc-v0.8.20").write_bytes(b"something else")
+    with pytest.raises(SolcInstallationError):
+        solcx.install._validate_installation(Version("0.8.20"), None)
+
+    assert version_probe.called
+    assert not nosolc.joinpath("solc-v0.8.20").exists()
+    assert get_manifest_entry(nosolc, "0.8.20") is None
+
+
+def test_unlink_removes_manifest_entry(nosolc, tmp_path, make_mirror, version_probe):
+    solcx.set_binary_mirrors([make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"})])
+    solcx.install_solc("0.8.20")
+    _unlink_solc(nosolc.joinpath("solc-v0.8.20"))
+
+    assert get_manifest_entry(nosolc, "0.8.20") is None
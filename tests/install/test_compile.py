@@ -1,9 +1,17 @@
+import io
 import os
+import shutil
+import subprocess
+import tarfile
+import threading
+from pathlib import Path
 
 import pytest
 
 import solcx
 from solcx.exceptions import SolcInstallationError
+from solcx.install import _ChunkReader
+from solcx.utils.lock import get_process_lock
 
 
 @pytest.mark.skipif("sys.platform != 'win32'")
@@ -53,3 +61,102 @@ def test_compile_install_make_fails(compile_mock, solc_binary, cwd):
         solcx.compile_solc("latest")
 
     assert os.getcwd() == cwd
+
+
+@pytest.fixture
+def source_mirror(tmp_path):
+    source = tmp_path.joinpath("solidity_0.8.20")
+    source.joinpath("scripts").mkdir(parents=True)
+    source.joinpath("CMakeLists.txt").touch()
+    source.joinpath("scripts", "install_deps.sh").touch()
+
+    mirror = tmp_path.joinpath("mirror")
+    mirror.joinpath("v0.8.20").mkdir(parents=True)
+    with tarfile.open(mirror.joinpath("v0.8.20", "solidity_0.8.20.tar.gz"), "w:gz") as tar:
+        tar.add(source, source.name)
+
+    solcx.set_source_mirrors([mirror])
+    yield mirror
+    solcx.set_source_mirrors(None)
+
+
+@pytest.fixture
+def build_mock(monkeypatch):
+    calls = []
+
+    def check_call(cmd, cwd=None, **kwargs):
+        calls.append((cmd, cwd))
+        if cmd[0] == "cmake":
+            Path(cwd).joinpath("CMakeCache.txt").touch()
+        if cmd[0] == "make":
+            Path(cwd).joinpath("solc").mkdir(exist_ok=True)
+            Path(cwd).joinpath("solc", "solc").write_bytes(b"solc")
+
+    monkeypatch.setattr("subprocess.check_call", check_call)
+    monkeypatch.setattr("solcx.install._validate_installation", lambda *args: None)
+    yield calls
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_compile_parallel_cached_build(nosolc, source_mirror, build_mock, cwd):
+    solcx.compile_solc("0.8.20", jobs=3, compiler_launcher="ccache", keep_build=True)
+
+    source = nosolc.joinpath(".build", "solidity_0.8.20")
+    assert build_mock == [
+        (["sh", source.joinpath("scripts", "install_deps.sh")], None),
+        (
+            [
+                "cmake",
+                "..",
+                "-DCMAKE_C_COMPILER_LAUNCHER=ccache",
+                "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache",
+            ],
+            source.joinpath("build"),
+        ),
+        (["make", "-j3"], source.joinpath("build")),
+    ]
+    assert os.getcwd() == cwd
+    assert nosolc.joinpath("solc-v0.8.20").read_bytes() == b"solc"
+
+    # rebuilding reuses the extracted source and build directory
+    nosolc.joinpath("solc-v0.8.20").unlink()
+    shutil.rmtree(source_mirror)
+    build_mock.clear()
+    solcx.compile_solc("0.8.20", compiler_launcher="")
+
+    assert [i[0][0] for i in build_mock] == ["cmake", "make"]
+    assert build_mock[0][0] == ["cmake", ".."]
+    assert nosolc.joinpath("solc-v0.8.20").exists()
+    assert not source.exists()
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_compile_builds_without_lock(nosolc, source_mirror, build_mock, cwd, monkeypatch):
+    check_call = subprocess.check_call
+    locked = []
+
+    def _check_call(cmd, cwd=None, **kwargs):
+        # the lock of the version is tried from another thread, as its holder may take it
+        def _try():
+            lock = get_process_lock("0.8.20")
+            locked.append(not lock.acquire(False))
+            if not locked[-1]:
+                lock.release()
+
+        thread = threading.Thread(target=_try)
+        thread.start()
+        thread.join()
+        return check_call(cmd, cwd=cwd, **kwargs)
+
+    monkeypatch.setattr("subprocess.check_call", _check_call)
+    solcx.compile_solc("0.8.20", compiler_launcher="")
+
+    assert locked == [False, False, False]
+    assert nosolc.joinpath("solc-v0.8.20").read_bytes() == b"solc"
+
+
+def test_chunk_reader():
+    reader = io.BufferedReader(_ChunkReader([b"ab", b"", b"cde", b"f"]))
+
+    assert reader.read(4) == b"abcd"
+    assert reader.read() == b"ef"
@@ -0,0 +1,157 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.utils.releases import get_github_releases
+
+RELEASES: list = [
+    {"tag_name": f"v0.{minor}.{patch}", "assets": [{"name": f"solidity_0.{minor}.{patch}.tar.gz"}]}
+    for minor, patch in [(8, 2), (8, 1), (8, 0), (7, 6), (5, 17)]
+] + [{"tag_name": "v0.4.11", "assets": [{"name": "solidity_0.4.11.tar.gz"}]}]
+
+
+class GithubStandIn(BaseHTTPRequestHandler):
+    """
+    Serves `RELEASES` like the Github releases API, two per page.
+    """
+
+    server: "Server"
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.server.rate_limited:
+            self.server.rate_limited -= 1
+            self.send_response(403)
+            self.send_header("X-RateLimit-Remaining", "0")
+            self.send_header("X-RateLimit-Reset", str(int(time.time() + self.server.reset_in)))
+            self.end_headers()
+            self.wfile.write(b'{"message": "API rate limit exceeded"}')
+            return
+
+        page = int(self.path.rsplit("page=", 1)[-1]) if "page=" in self.path else 1
+        etag = f'"{self.server.version}"'
+        if page == 1 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        if page * 2 < len(RELEASES):
+            next_url = f"{self.server.url}?page={page + 1}"
+            self.send_header("Link", f'<{next_url}>; rel="next"')
+        self.end_headers()
+        start = (page - 1) * 2
+        self.wfile.write(json.dumps(RELEASES[start : start + 2]).encode())  # noqa: E203
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    requests: list
+    url: str
+    rate_limited = 0
+    reset_in = 0
+    version = 1
+
+
+@pytest.fixture
+def github(monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    server = Server(("127.0.0.1", 0), GithubStandIn)
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/releases"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, server.url
+    server.shutdown()
+    server.server_close()
+
+
+def test_pagination(github, tmp_path):
+    server, url = github
+    releases = get_github_releases(url, tmp_path.joinpath("cache.json"))
+
+    assert [i["tag_name"] for i in releases] == [i["tag_name"] for i in RELEASES]
+    assert releases[0]["assets"] == ["solidity_0.8.2.tar.gz"]
+    assert len(server.requests) == 3
+
+
+def test_cache_ttl(github, tmp_path):
+    server, url = github
+    cache = tmp_path.joinpath("cache.json")
+    first = get_github_releases(url, cache)
+
+    assert get_github_releases(url, cache) == first
+    assert len(server.requests) == 3
+
+
+def test_etag_revalidation(github, tmp_path):
+    server, url = github
+    cache = tmp_path.joinpath("cache.json")
+    first = get_github_releases(url, cache)
+
+    # an unchanged first page is revalidated with one conditional request
+    assert get_github_releases(url, cache, ttl=0) == first
+    assert len(server.requests) == 4
+
+    server.version = 2
+    get_github_releases(url, cache, ttl=0)
+    assert len(server.requests) == 7
+
+
+def test_rate_limit_retry(github, tmp_path, monkeypatch):
+    server, url = github
+    sleeps: list = []
+    monkeypatch.setattr("solcx.utils.releases.time.sleep", sleeps.append)
+    server.rate_limited = 2
+    server.reset_in = 5
+
+    assert len(get_github_releases(url)) == len(RELEASES)
+    assert len(sleeps) == 2
+    assert all(4 <= i <= 7 for i in sleeps)
+
+
+def test_rate_limit_bounded(github, tmp_path, monkeypatch):
+    server, url = github
+    monkeypatch.setattr("solcx.utils.releases.time.sleep", lambda seconds: None)
+
+    server.rate_limited = 10
+    with pytest.raises(ConnectionError):
+        get_github_releases(url)
+    assert len(server.requests) == 4
+
+    # a reset too far in the future fails without waiting
+    server.requests.clear()
+    server.reset_in = 3600
+    with pytest.raises(ConnectionError, match="resets in"):
+        get_github_releases(url)
+    assert len(server.requests) == 1
+
+
+def test_stale_cache_fallback(github, tmp_path):
+    server, url = github
+    cache = tmp_path.joinpath("cache.json")
+    first = get_github_releases(url, cache)
+
+    server.rate_limited = 1
+    server.reset_in = 3600
+    assert get_github_releases(url, cache, ttl=0) == first
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_get_compilable_solc_versions(github, nosolc, monkeypatch):
+    server, url = github
+    monkeypatch.setattr("solcx.install.GITHUB_RELEASES", url)
+
+    expected = [Version(i["tag_name"][1:]) for i in RELEASES]
+    assert solcx.get_compilable_solc_versions() == expected
+    assert solcx.get_compilable_solc_versions() == expected
+    assert len(server.requests) == 3
+    assert nosolc.joinpath(".solcx-releases.json").exists()
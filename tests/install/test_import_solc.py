@@ -1,3 +1,8 @@
+import sys
+
+import pytest
+from packaging.version import Version
+
 import solcx
 
 
@@ -23,8 +28,52 @@ def test_import_solc_fails_after_importing(monkeypatch, solc_binary, nosolc):
             return version
         raise Exception
 
+    def corrupt_copy(source, dest):
+        # the copy no longer matches the probed binary, so it is executed again
+        dest.write_bytes(b"corrupt")
+
     monkeypatch.setattr("solcx.install._get_which_solc", lambda: solc_binary)
     monkeypatch.setattr("solcx.wrapper.get_solc_version", version_mock)
+    monkeypatch.setattr("solcx.install.link_or_copy", corrupt_copy)
 
     assert solcx.import_installed_solc() == []
     assert not nosolc.joinpath(solc_binary.name).exists()
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_import_solc_probes_once(monkeypatch, tmp_path, nosolc):
+    for name, content in (("a", b"0.8.20"), ("b", b"0.8.20"), ("c", b"0.8.21")):
+        tmp_path.joinpath(name).write_bytes(content)
+    candidates = [tmp_path.joinpath(i) for i in ("a", "b", "c")]
+    probed = []
+
+    def version_mock(path):
+        probed.append(path)
+        return Version(path.read_text())
+
+    monkeypatch.setattr("solcx.install._get_import_candidates", lambda: candidates)
+    monkeypatch.setattr("solcx.wrapper.get_solc_version", version_mock)
+
+    assert sorted(solcx.import_installed_solc()) == [Version("0.8.20"), Version("0.8.21")]
+    # identical binaries are probed once, and verified copies are not executed
+    assert sorted(probed) == [candidates[0], candidates[2]]
+
+    imported = nosolc.joinpath("solc-v0.8.20")
+    assert imported.read_bytes() == b"0.8.20"
+    if sys.platform.startswith("linux"):
+        assert imported.stat().st_ino == candidates[0].stat().st_ino
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_import_solc_store_entry_removed(monkeypatch, tmp_path, nosolc):
+    candidate = tmp_path.joinpath("solc")
+    candidate.write_bytes(b"0.8.20")
+
+    monkeypatch.setattr("solcx.install._get_import_candidates", lambda: [candidate])
+    monkeypatch.setattr("solcx.wrapper.get_solc_version", lambda path: Version("0.8.20"))
+    monkeypatch.setattr("solcx.install.get_solcx_store_folder", lambda: tmp_path.joinpath("store"))
+    # the entry is removed by `gc_store` in another process before it is linked
+    monkeypatch.setattr("solcx.install.link_from_store", lambda *args: False)
+
+    assert solcx.import_installed_solc() == [Version("0.8.20")]
+    assert nosolc.joinpath("solc-v0.8.20").read_bytes() == b"0.8.20"
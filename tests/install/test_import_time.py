@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+
+import solcx
+
+DEFERRED_MODULES = {
+    "asyncio",
+    "concurrent.futures",
+    "hashlib",
+    "packaging.specifiers",
+    "requests",
+    "tarfile",
+    "urllib.request",
+    "zipfile",
+}
+
+
+def _run_python(tmp_path, *args):
+    env = dict(os.environ, HOME=str(tmp_path), USERPROFILE=str(tmp_path), PATH="")
+    env.pop("SOLCX_BINARY_PATH", None)
+    cwd = os.path.dirname(os.path.dirname(solcx.__file__))
+    return subprocess.run(
+        [sys.executable, *args], env=env, cwd=cwd, capture_output=True, text=True, check=True
+    )
+
+
+def _solcx_import_tree(importtime_output):
+    # `-X importtime` prints "import time: self | cumulative | name" once each import
+    # completes, with nested imports indented and listed before their parent
+    subtree = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        subtree[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" "):
+            if name.strip() == "solcx":
+                return subtree
+            subtree = {}
+    raise AssertionError("solcx was not imported")
+
+
+def test_import_time(tmp_path):
+    result = _run_python(tmp_path, "-X", "importtime", "-c", "import solcx")
+    imported = _solcx_import_tree(result.stderr)
+
+    assert not DEFERRED_MODULES & imported.keys(), f"import solcx took {imported['solcx']}us"
+
+
+def test_import_has_no_side_effects(tmp_path):
+    _run_python(tmp_path, "-c", "import solcx")
+
+    assert not tmp_path.joinpath(".solcx").exists()
+
+
+def test_default_binary_resolved_lazily(tmp_path, monkeypatch, mocker):
+    monkeypatch.setattr("solcx.install._default_solc_binary", None)
+    monkeypatch.setattr("solcx.install._default_solc_binary_resolved", False)
+    monkeypatch.setattr("solcx.install.get_solcx_install_folder", lambda *args, **kwargs: tmp_path)
+    which = mocker.patch("solcx.install._get_which_solc", return_value=None)
+
+    binary = tmp_path.joinpath("solc-v0.8.20")
+    if sys.platform == "win32":
+        binary.mkdir()
+        binary = binary.joinpath("solc.exe")
+    binary.touch()
+
+    assert solcx.install.get_executable() == binary
+    assert solcx.install.get_executable() == binary
+    assert which.call_count == 1
@@ -1,9 +1,12 @@
+import os
 import warnings
 
 import pytest
+from packaging.version import Version
 
 import solcx
 from solcx.exceptions import SolcInstallationError
+from solcx.install import _atomic_install_file
 
 
 @pytest.mark.skipif("'--no-install' in sys.argv")
@@ -57,3 +60,34 @@ def test_environment_var_install(monkeypatch, tmp_path):
 
     solcx.install_solc("0.6.9")
     assert tmp_path.joinpath("solc-v0.6.9").exists()
+
+
+def test_atomic_install(monkeypatch, tmp_path):
+    install_path = tmp_path.joinpath("solc-v0.8.20")
+    _atomic_install_file(install_path, b"solc")
+
+    assert install_path.read_bytes() == b"solc"
+    assert os.access(install_path, os.X_OK)
+    assert [i.name for i in tmp_path.iterdir()] == ["solc-v0.8.20"]
+
+
+def test_atomic_install_fails(monkeypatch, tmp_path):
+    def _replace(*args):
+        raise OSError
+
+    monkeypatch.setattr("os.replace", _replace)
+    with pytest.raises(OSError):
+        _atomic_install_file(tmp_path.joinpath("solc-v0.8.20"), b"solc")
+
+    # nothing is left behind, partially written or otherwise
+    assert not list(tmp_path.iterdir())
+
+
+def test_already_installed_logged_once(tmp_path, caplog):
+    tmp_path.joinpath("solc-v0.8.20").write_bytes(b"solc")
+
+    with caplog.at_level("INFO", logger="solcx"):
+        assert solcx.install_solc("0.8.20", solcx_binary_path=tmp_path) == Version("0.8.20")
+    assert [i.message for i in caplog.records if "already installed" in i.message] == [
+        f"solc 0.8.20 already installed at: {tmp_path.joinpath('solc-v0.8.20')}"
+    ]
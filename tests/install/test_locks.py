@@ -1,9 +1,23 @@
+import asyncio
 import multiprocessing as mp
+import os
+import shutil
 import threading
 
 import pytest
+from packaging.version import Version
 
 import solcx
+from solcx.exceptions import LockTimeoutError
+from solcx.utils import lock as lock_module
+from solcx.utils.lock import (
+    UnixLock,
+    WindowsLock,
+    cleanup_stale_locks,
+    get_lock_stats,
+    get_process_lock,
+    set_lock_timeout,
+)
 
 
 class ThreadWrap:
@@ -42,3 +56,284 @@ def test_processlock(nosolc):
     for t in threads:
         t.join()
         assert t.exitcode == 0
+
+
+def _try_exclusive(lock_id):
+    # exits with 0 if the lock could be acquired by another process
+    lock = get_process_lock(lock_id)
+    if not lock.acquire(False):
+        raise SystemExit(1)
+    lock.release()
+
+
+def test_shared_lock_threads():
+    lock = get_process_lock("test-shared-threads")
+    acquired = []
+
+    def _shared():
+        acquired.append(lock.acquire(False, shared=True))
+
+    with lock.shared():
+        threads = [threading.Thread(target=_shared) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert acquired == [True] * 4
+        assert not lock.acquire(False)
+
+    for i in range(4):
+        lock.release(shared=True)
+    assert lock.acquire(False)
+    lock.release()
+
+
+def test_exclusive_lock_blocks_shared():
+    lock = get_process_lock("test-exclusive-threads")
+    acquired = []
+
+    def _shared():
+        acquired.append(lock.acquire(False, shared=True))
+
+    with lock:
+        # the holder of the exclusive lock may also take the shared lock
+        with lock.shared():
+            t = threading.Thread(target=_shared)
+            t.start()
+            t.join()
+
+    assert acquired == [False]
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_shared_lock_processes():
+    ctx = mp.get_context("spawn")
+    lock = get_process_lock("test-shared-processes")
+
+    with lock.shared():
+        proc = ctx.Process(target=_try_exclusive, args=("test-shared-processes",))
+        proc.start()
+        proc.join()
+        assert proc.exitcode == 1
+
+    proc = ctx.Process(target=_try_exclusive, args=("test-shared-processes",))
+    proc.start()
+    proc.join()
+    assert proc.exitcode == 0
+
+
+def test_incomplete_lock_class():
+    class IncompleteLock(lock_module._ProcessLock):
+        def _lock_file_release(self):
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteLock("test-incomplete")  # type: ignore[abstract]
+
+
+class FakeMsvcrt:
+    LK_LOCK, LK_NBLCK, LK_UNLCK = range(3)
+
+    def __init__(self):
+        self.locked = set()
+
+    def locking(self, fd, mode, nbytes):
+        if mode == self.LK_UNLCK:
+            self.locked.remove(fd)
+        elif self.locked:
+            raise OSError
+        else:
+            self.locked.add(fd)
+
+
+def test_windows_shared_lock_not_held(monkeypatch):
+    fake = FakeMsvcrt()
+    monkeypatch.setattr(lock_module, "msvcrt", fake, raising=False)
+    monkeypatch.setattr(lock_module, "OPEN_MODE", os.O_RDWR | os.O_CREAT, raising=False)
+    lock = WindowsLock("test-windows-shared")
+
+    with lock.shared():
+        # other processes compiling with the same version are not blocked
+        assert not fake.locked
+        assert not lock.acquire(False)
+
+    with lock:
+        assert len(fake.locked) == 1
+        # shared holders in other processes wait until the exclusive holder is done
+        assert not WindowsLock("test-windows-shared").acquire(False, shared=True)
+    assert not fake.locked
+
+
+def _hold_in_thread(lock, event, shared=False):
+    def _hold():
+        lock.acquire(shared=shared)
+        event.wait()
+        lock.release(shared=shared)
+
+    t = threading.Thread(target=_hold)
+    t.start()
+    return t
+
+
+def test_lock_timeout():
+    lock = get_process_lock("test-timeout")
+    release = threading.Event()
+    t = _hold_in_thread(lock, release)
+    try:
+        while lock.acquire(False):
+            lock.release()
+        assert not lock.acquire(timeout=0.05)
+        set_lock_timeout(0.05)
+        with pytest.raises(LockTimeoutError):
+            with lock:
+                pass
+    finally:
+        set_lock_timeout(None)
+        release.set()
+        t.join()
+
+    stats = get_lock_stats()["test-timeout"]
+    assert stats["timeouts"] == 2
+    assert stats["wait_time"] >= 0.1
+
+
+def test_lock_contention_stats():
+    lock = get_process_lock("test-contention")
+    release = threading.Event()
+    t = _hold_in_thread(lock, release)
+    while lock.acquire(False):
+        lock.release()
+
+    threading.Timer(0.05, release.set).start()
+    with lock:
+        pass
+    t.join()
+
+    stats = get_lock_stats()["test-contention"]
+    assert stats["contended"] == 1
+    assert stats["max_wait"] > 0
+
+
+def test_acquire_async():
+    lock = get_process_lock("test-async")
+    release = threading.Event()
+    t = _hold_in_thread(lock, release, shared=True)
+    while lock.acquire(False):
+        lock.release()
+
+    async def _acquire():
+        assert await lock.acquire_async(shared=True)
+        lock.release(shared=True)
+        assert not await lock.acquire_async(timeout=0.05)
+        threading.Timer(0.05, release.set).start()
+        async with lock:
+            pass
+
+    asyncio.run(_acquire())
+    t.join()
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_cleanup_stale_locks(tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.gettempdir", lambda: tmp_path.as_posix())
+    stale = tmp_path.joinpath(".solcx-lock-stale")
+    stale.touch()
+    os.utime(stale, (0, 0))
+
+    held = UnixLock("held")
+    held.acquire()
+    os.utime(held._lock_path, (0, 0))
+
+    assert cleanup_stale_locks() == [stale]
+    held.release()
+
+    # a lock whose file was removed after being opened recreates it
+    assert cleanup_stale_locks() == [held._lock_path]
+    held.acquire()
+    assert held._lock_path.exists()
+    held.release()
+
+
+def test_install_skips_lock(nosolc, mocker):
+    nosolc.joinpath("solc-v0.8.20").touch()
+    patch = mocker.patch("solcx.install.get_process_lock")
+
+    assert solcx.install_solc("0.8.20") == Version("0.8.20")
+    assert not patch.called
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_compile_locks_installed_binaries_only(fake_solc, tmp_path):
+    installed = tmp_path.joinpath("solc-v0.8.20")
+    shutil.copy(fake_solc, installed)
+
+    lock = get_process_lock("0.8.20")
+    release = threading.Event()
+    t = _hold_in_thread(lock, release)
+    try:
+        while lock.acquire(False):
+            lock.release()
+        set_lock_timeout(0.05)
+        # a binary that py-solc-x did not install is never replaced by it
+        solcx.wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}")
+        with pytest.raises(LockTimeoutError):
+            solcx.wrapper.solc_wrapper(solc_binary=installed, stdin="contract Foo {}")
+    finally:
+        set_lock_timeout(None)
+        release.set()
+        t.join()
+
+
+@pytest.fixture
+def mirror_install(nosolc, make_mirror, tmp_path, mocker):
+    mocker.patch("solcx.install._validate_installation")
+    solcx.set_binary_mirrors([make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"})])
+    yield nosolc
+
+
+def _is_locked(lock_id):
+    # the lock is tried from another thread, as its holder may also take it
+    result = []
+
+    def _try():
+        lock = get_process_lock(lock_id)
+        result.append(not lock.acquire(False))
+        if not result[0]:
+            lock.release()
+
+    t = threading.Thread(target=_try)
+    t.start()
+    t.join()
+    return result[0]
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_install_downloads_without_lock(mirror_install, monkeypatch):
+    download = solcx.install._download_from_mirrors
+    locked = []
+
+    def _download(*args, **kwargs):
+        locked.append(_is_locked("0.8.20"))
+        return download(*args, **kwargs)
+
+    monkeypatch.setattr("solcx.install._download_from_mirrors", _download)
+    solcx.install_solc("0.8.20")
+
+    assert locked == [False]
+    assert mirror_install.joinpath("solc-v0.8.20").read_bytes() == b"solc"
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_install_keeps_concurrent_install(mirror_install, monkeypatch):
+    download = solcx.install._download_from_mirrors
+
+    def _download(*args, **kwargs):
+        # another process installs the version while this one downloads it
+        mirror_install.joinpath("solc-v0.8.20").write_bytes(b"other")
+        return download(*args, **kwargs)
+
+    monkeypatch.setattr("solcx.install._download_from_mirrors", _download)
+    solcx.install_solc("0.8.20")
+
+    assert mirror_install.joinpath("solc-v0.8.20").read_bytes() == b"other"
+    assert not [i for i in mirror_install.iterdir() if i.name.endswith(".partial")]
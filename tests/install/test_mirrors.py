@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.exceptions import DownloadError
+from solcx.install import _download_from_mirrors, _get_os_name, get_binary_mirrors
+
+FILENAME = "solc-v0.8.20+commit.a1b79de6"
+
+
+@pytest.fixture
+def mirror(tmp_path, make_mirror):
+    return make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"0.8.20", "0.7.6": b"0.7.6"})
+
+
+def test_default_mirror(monkeypatch):
+    monkeypatch.delenv("SOLCX_BINARY_MIRRORS", raising=False)
+    assert get_binary_mirrors() == [solcx.install.BINARY_DOWNLOAD_BASE]
+
+
+def test_environment_var_mirrors(monkeypatch, mirror):
+    monkeypatch.setenv("SOLCX_BINARY_MIRRORS", f"{mirror.as_uri()}, https://example.com/solc/")
+    assert get_binary_mirrors() == [
+        f"{mirror.as_uri()}/{{}}-amd64/{{}}",
+        "https://example.com/solc/{}-amd64/{}",
+    ]
+
+
+def test_installable_versions_from_directory(mirror):
+    solcx.set_binary_mirrors([mirror])
+    assert solcx.get_installable_solc_versions() == [Version("0.8.20"), Version("0.7.6")]
+
+
+def test_mirror_fallback(tmp_path, mirror):
+    solcx.set_binary_mirrors([tmp_path.joinpath("missing"), mirror.as_uri()])
+    assert solcx.get_installable_solc_versions()[0] == Version("0.8.20")
+
+    content = _download_from_mirrors(
+        get_binary_mirrors(), _get_os_name(), FILENAME, show_progress=False
+    )
+    assert content == b"0.8.20"
+
+
+def test_mirror_missing_binary(tmp_path, mirror):
+    solcx.set_binary_mirrors([mirror])
+    with pytest.raises(DownloadError):
+        _download_from_mirrors(
+            get_binary_mirrors(), _get_os_name(), "solc-v0.0.0", show_progress=False
+        )
+
+
+@pytest.mark.skipif("sys.platform == 'win32'")
+def test_install_from_mirror(mocker, nosolc, mirror):
+    mocker.patch("solcx.install._validate_installation")
+    solcx.set_binary_mirrors([mirror])
+
+    assert solcx.install_solc("0.8.20") == Version("0.8.20")
+    assert nosolc.joinpath("solc-v0.8.20").read_bytes() == b"0.8.20"
+
+
+def test_sync_mirror(monkeypatch, tmp_path, mirror):
+    monkeypatch.setattr("solcx.install.BINARY_DOWNLOAD_BASE", f"{mirror.as_uri()}/{{}}-amd64/{{}}")
+    target = tmp_path.joinpath("synced")
+
+    assert solcx.sync_binary_mirror(target, versions=["0.8.20"]) == [Version("0.8.20")]
+    assert solcx.sync_binary_mirror(target, versions=["0.8.20"]) == []
+
+    solcx.set_binary_mirrors([target])
+    assert solcx.get_installable_solc_versions() == [Version("0.8.20")]
+    list_json = json.loads(target.joinpath(f"{_get_os_name()}-amd64", "list.json").read_text())
+    assert [i["path"] for i in list_json["builds"]] == [FILENAME]
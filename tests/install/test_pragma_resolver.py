@@ -0,0 +1,65 @@
+import pytest
+from packaging.version import Version
+
+from solcx import PragmaResolver
+from solcx.install import select_pragma_version
+
+INSTALLED = [Version(i) for i in ("0.4.2", "0.4.11", "0.4.25", "0.5.0", "0.5.4", "0.5.7", "1.2.3")]
+INSTALLABLE = [Version(i) for i in ("0.4.11", "0.4.24", "0.4.26", "0.5.3", "0.6.0")]
+
+PRAGMAS = [
+    "pragma solidity 0.4.11;",
+    "pragma solidity =0.4.11;",
+    "pragma solidity ^0.4.11;",
+    "pragma solidity >=0.4.0<0.4.25;",
+    "pragma solidity >=0.4.2;",
+    "pragma solidity >=0.4.2 <0.5.5;",
+    "pragma solidity ^0.4.2 || 0.5.5;",
+    "pragma solidity ^0.4.2 || >=0.5.4<0.7.0;",
+    "pragma solidity ^0.5.00;",
+    "pragma solidity =0.4.11 >=0.4.0 <0.5.0 >=0.4.2 <0.5.0;",
+    "pragma solidity ^0.7.1;",
+    "pragma solidity >0.5.0 <=0.6.0;",
+]
+
+
+@pytest.fixture
+def resolver():
+    yield PragmaResolver(INSTALLED, INSTALLABLE)
+
+
+@pytest.mark.parametrize("pragma", PRAGMAS)
+def test_matches_select_pragma_version(resolver, pragma):
+    result = resolver.resolve(pragma)
+
+    assert result.pragma == pragma
+    assert result.installed == select_pragma_version(pragma, INSTALLED)
+    assert result.installable == select_pragma_version(pragma, INSTALLABLE)
+
+
+def test_resolve_many(resolver):
+    results = resolver.resolve_many(PRAGMAS * 3)
+
+    assert [i.pragma for i in results] == PRAGMAS * 3
+    assert results[:3] == [resolver.resolve(i) for i in PRAGMAS[:3]]
+    # each distinct pragma is only parsed once
+    assert len(resolver._pragma_masks) == len(PRAGMAS)
+
+
+def test_versions(resolver):
+    assert resolver.versions("pragma solidity ^0.4.11;") == [
+        Version("0.4.26"),
+        Version("0.4.25"),
+        Version("0.4.24"),
+        Version("0.4.11"),
+    ]
+    assert resolver.versions("pragma solidity ^0.7.1;") == []
+
+
+def test_default_versions(monkeypatch):
+    monkeypatch.setattr("solcx.install.get_installed_solc_versions", lambda **kwargs: INSTALLED)
+    monkeypatch.setattr("solcx.install.get_installable_solc_versions", lambda: INSTALLABLE)
+
+    result = PragmaResolver().resolve("pragma solidity ^0.4.2 || >=0.5.4<0.7.0;")
+    assert result.installed == Version("0.5.7")
+    assert result.installable == Version("0.6.0")
@@ -0,0 +1,134 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.exceptions import SolcInstallationError, SolcNotInstalled
+
+INSTALLABLE = ["0.7.6", "0.8.19", "0.8.20"]
+
+
+@pytest.fixture
+def slow_install(nosolc, monkeypatch):
+    """
+    Patch installs to write an empty binary once `release` is set.
+    """
+    release = threading.Event()
+    installs = []
+
+    def _install(version, filename, show_progress, solcx_binary_path, sha256=None):
+        release.wait(5)
+        installs.append(version)
+        if filename == "broken":
+            raise SolcInstallationError("broken download")
+        nosolc.joinpath(f"solc-v{version}").touch()
+
+    binary_list = {"releases": {i: f"solc-v{i}" for i in INSTALLABLE}}
+    monkeypatch.setattr("solcx.install._get_binary_list", lambda: binary_list)
+    monkeypatch.setattr("solcx.install._install_solc_unix", _install)
+    monkeypatch.setattr("solcx.install._install_solc_windows", _install)
+    monkeypatch.setattr("solcx.install._validate_installation", lambda *args, **kwargs: None)
+    yield release, installs, binary_list
+
+
+def test_prefetch_returns_immediately(slow_install):
+    release, installs, _ = slow_install
+    prefetcher = solcx.prefetch(["0.8.20", "0.7.6"])
+    assert not prefetcher.done()
+
+    release.set()
+    assert prefetcher.wait() == [Version("0.8.20"), Version("0.7.6")]
+    assert sorted(installs) == [Version("0.7.6"), Version("0.8.20")]
+
+
+def test_get_executable_waits(slow_install, nosolc):
+    release, installs, _ = slow_install
+    solcx.prefetch(["0.8.20"])
+    threading.Timer(0.1, release.set).start()
+
+    start = time.monotonic()
+    assert solcx.install.get_executable("0.8.20").name == "solc-v0.8.20"
+    assert time.monotonic() - start >= 0.05
+
+    # versions that are not prefetched still fail immediately
+    with pytest.raises(SolcNotInstalled):
+        solcx.install.get_executable("0.8.19")
+
+
+def test_install_solc_waits(slow_install):
+    release, installs, _ = slow_install
+    solcx.prefetch(["0.8.20"])
+    threading.Timer(0.1, release.set).start()
+
+    assert solcx.install_solc("0.8.20") == Version("0.8.20")
+    assert installs == [Version("0.8.20")]
+
+
+def test_prefetch_project(slow_install, tmp_path_factory):
+    release, installs, _ = slow_install
+    root = tmp_path_factory.mktemp("project")
+    root.joinpath("A.sol").write_text("pragma solidity ^0.8.0;")
+    root.joinpath("B.sol").write_text("pragma solidity ^0.7.0;")
+
+    release.set()
+    prefetcher = solcx.prefetch(root=root)
+    assert prefetcher.wait() == [Version("0.8.20"), Version("0.7.6")]
+
+
+def test_prefetch_skips_installed(slow_install, nosolc):
+    nosolc.joinpath("solc-v0.8.20").touch()
+    prefetcher = solcx.prefetch(["0.8.20"])
+
+    assert prefetcher.wait() == []
+    assert slow_install[1] == []
+
+
+def test_prefetch_failure(slow_install):
+    release, installs, binary_list = slow_install
+    binary_list["releases"]["0.8.20"] = "broken"
+    release.set()
+    prefetcher = solcx.prefetch(["0.8.20"])
+
+    with pytest.raises(SolcNotInstalled):
+        solcx.install.get_executable("0.8.20")
+    with pytest.raises(SolcInstallationError):
+        prefetcher.wait()
+
+
+def test_other_folders_not_waited_for(slow_install, nosolc, tmp_path_factory, monkeypatch):
+    release, _, _ = slow_install
+    monkeypatch.setattr(
+        "solcx.install.get_solcx_install_folder",
+        lambda solcx_binary_path=None: Path(solcx_binary_path or nosolc),
+    )
+    prefetcher = solcx.prefetch(["0.8.20"], solcx_binary_path=tmp_path_factory.mktemp("other"))
+
+    start = time.monotonic()
+    with pytest.raises(SolcNotInstalled):
+        solcx.install.get_executable("0.8.20")
+    assert time.monotonic() - start < 1
+
+    release.set()
+    prefetcher.wait()
+
+
+def test_planning_not_waited_for_other_versions(slow_install, monkeypatch):
+    release, _, binary_list = slow_install
+
+    def _get_binary_list():
+        release.wait(5)
+        return binary_list
+
+    monkeypatch.setattr("solcx.install._get_binary_list", _get_binary_list)
+    prefetcher = solcx.prefetch(["0.8.20"])
+
+    start = time.monotonic()
+    with pytest.raises(SolcNotInstalled):
+        solcx.install.get_executable("0.8.19")
+    assert time.monotonic() - start < 1
+
+    release.set()
+    assert prefetcher.wait() == [Version("0.8.20")]
@@ -0,0 +1,107 @@
+import os
+import sys
+import threading
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.__main__ import main
+from solcx.utils import registry, usage
+from solcx.utils.lock import get_process_lock
+
+VERSIONS = ["0.6.12", "0.7.6", "0.8.19", "0.8.20"]
+
+
+def _install(folder, version, size=1000):
+    path = folder.joinpath(f"solc-v{version}")
+    if sys.platform == "win32":
+        path.mkdir()
+        path = path.joinpath("solc.exe")
+    path.write_bytes(b"\0" * size)
+    return path
+
+
+@pytest.fixture
+def folder(nosolc, monkeypatch):
+    monkeypatch.setattr(usage, "_last_recorded", {})
+    registry.invalidate()
+    for i, version in enumerate(VERSIONS):
+        path = _install(nosolc, version)
+        # install times, used for versions that have never been used
+        os.utime(path, (1000 + i, 1000 + i))
+    yield nosolc
+    registry.invalidate()
+
+
+def _use(folder, version, timestamp):
+    solcx.install.get_executable(version)
+    os.utime(usage.get_usage_path(folder, version), (timestamp, timestamp))
+
+
+def test_records_usage(folder):
+    assert usage.get_last_used(folder, "0.7.6") == 0.0
+    solcx.install.get_executable("0.7.6")
+    assert usage.get_last_used(folder, "0.7.6") > 0
+
+
+def test_usage_throttled(folder):
+    solcx.install.get_executable("0.7.6")
+    os.utime(usage.get_usage_path(folder, "0.7.6"), (5, 5))
+    solcx.install.get_executable("0.7.6")
+    assert usage.get_last_used(folder, "0.7.6") == 5
+
+
+def test_prune_lru(folder):
+    _use(folder, "0.6.12", 3000)
+    _use(folder, "0.8.20", 2000)
+
+    # unused versions are ordered by install time, and go before used versions
+    assert solcx.prune(2000) == [Version("0.7.6"), Version("0.8.19")]
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20"), Version("0.6.12")]
+    assert not usage.get_usage_path(folder, "0.8.19").exists()
+
+    assert solcx.prune(1000) == [Version("0.8.20")]
+    assert solcx.prune(0, keep=["0.6.12"]) == []
+
+
+def test_prune_within_quota(folder):
+    assert solcx.prune(4000) == []
+    assert len(solcx.get_installed_solc_versions()) == 4
+
+
+def test_prune_skips_active(folder, mocker):
+    mocker.patch(
+        "solcx.install.get_default_solc_binary",
+        return_value=solcx.install.get_executable("0.6.12"),
+    )
+    assert solcx.prune(0) == [Version(i) for i in VERSIONS[1:]]
+
+
+def test_prune_skips_in_use(folder):
+    lock = get_process_lock("0.6.12")
+    acquired = threading.Event()
+    done = threading.Event()
+
+    def _compile():
+        with lock.shared():
+            acquired.set()
+            done.wait()
+
+    thread = threading.Thread(target=_compile)
+    thread.start()
+    acquired.wait()
+    try:
+        assert Version("0.6.12") not in solcx.prune(0)
+    finally:
+        done.set()
+        thread.join()
+
+    assert solcx.get_installed_solc_versions() == [Version("0.6.12")]
+
+
+def test_prune_cli(folder, capsys):
+    main(["prune", "--max-bytes", "2K", "--keep", "0.6.12", "--keep", "0.7.6"])
+
+    assert solcx.get_installed_solc_versions() == [Version("0.7.6"), Version("0.6.12")]
+    assert "0.8.19, 0.8.20" in capsys.readouterr().out
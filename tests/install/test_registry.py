@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.utils import registry, usage
+from solcx.utils.manifest import update_manifest
+
+
+def _install(folder, version):
+    path = folder.joinpath(f"solc-v{version}")
+    if sys.platform == "win32":
+        path.mkdir()
+        path = path.joinpath("solc.exe")
+    path.touch()
+    return path
+
+
+def _age(folder, seconds=60):
+    # move the folder mtime out of the racy window, so the scan is cached
+    mtime = time.time_ns() - seconds * 1_000_000_000
+    os.utime(folder, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def folder(nosolc):
+    registry.invalidate()
+    yield nosolc
+    registry.invalidate()
+
+
+@pytest.fixture
+def no_scan(monkeypatch):
+    def glob(*args):
+        raise AssertionError("registry rescanned the installation folder")
+
+    return lambda: monkeypatch.setattr(Path, "glob", glob)
+
+
+def test_cached_lookups(folder, no_scan):
+    path = _install(folder, "0.8.20")
+    # created on the first use of a version, which modifies the folder
+    folder.joinpath(usage.USAGE_FOLDER).mkdir()
+    _age(folder)
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20")]
+
+    no_scan()
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20")]
+    assert solcx.install.get_executable("0.8.20") == path
+    with pytest.raises(solcx.exceptions.SolcNotInstalled):
+        solcx.install.get_executable("0.8.21")
+
+
+def test_invalidated_by_mtime(folder):
+    _install(folder, "0.8.20")
+    _age(folder, 120)
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20")]
+
+    _install(folder, "0.8.21")
+    _age(folder, 60)
+    assert solcx.get_installed_solc_versions() == [Version("0.8.21"), Version("0.8.20")]
+
+
+def test_racy_folder_is_not_cached(folder):
+    _install(folder, "0.8.20")
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20")]
+
+    # a recently modified folder is rescanned, even if its mtime is unchanged
+    stat = os.stat(folder)
+    _install(folder, "0.8.21")
+    os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert solcx.get_installed_solc_versions() == [Version("0.8.21"), Version("0.8.20")]
+
+
+def test_manifest_entries(folder):
+    _install(folder, "0.8.20")
+    _install(folder, "0.8.21")
+    update_manifest(folder, "0.8.20", {"sha256": "ab" * 32, "verified": True})
+
+    entry = registry.get_installed_entry(folder, Version("0.8.20"))
+    assert entry is not None
+    assert entry.sha256 == "ab" * 32
+    assert entry.verified is True
+
+    entry = registry.get_installed_entry(folder, Version("0.8.21"))
+    assert entry is not None
+    assert entry.sha256 is None
+    assert entry.verified is False
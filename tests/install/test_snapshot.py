@@ -0,0 +1,161 @@
+import io
+import json
+import sys
+import tarfile
+import time
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.exceptions import SolcInstallationError
+from solcx.utils import registry
+from solcx.utils.manifest import read_manifest
+
+
+def _install(folder, version, content):
+    path = folder.joinpath(f"solc-v{version}")
+    if sys.platform == "win32":
+        path.mkdir()
+        path = path.joinpath("solc.exe")
+    path.write_bytes(content)
+    path.chmod(0o755)
+    solcx.install._record_install(Version(version), "test", folder)
+    return path
+
+
+@pytest.fixture
+def folder(nosolc, monkeypatch):
+    monkeypatch.delenv("SOLCX_STORE_PATH", raising=False)
+    registry.invalidate()
+    _install(nosolc, "0.7.6", b"solc 0.7.6" * 1000)
+    _install(nosolc, "0.8.20", b"solc 0.8.20" * 1000)
+    nosolc.joinpath(".solcx-releases.json").write_text('{"releases": []}')
+    nosolc.joinpath(".build").mkdir()
+    nosolc.joinpath(".build", "CMakeCache.txt").write_text("cache")
+    nosolc.joinpath(".solc-v0.8.21.123.456.partial").write_text("partial")
+    yield nosolc
+    registry.invalidate()
+
+
+def _clear(folder):
+    for path in folder.glob("solc-v*"):
+        solcx.install._unlink_solc(path if path.is_file() else path.joinpath("solc.exe"))
+    folder.joinpath(".solcx-releases.json").unlink()
+    registry.invalidate()
+
+
+def test_snapshot_contents(folder, tmp_path_factory):
+    archive = solcx.snapshot(tmp_path_factory.mktemp("archive").joinpath("solcx.tar.gz"))
+
+    with tarfile.open(archive) as tar:
+        names = tar.getnames()
+        index = json.loads(tar.extractfile(names[0]).read())  # type: ignore[union-attr]
+
+    assert names[0] == ".solcx-snapshot.json"
+    assert ".solcx-manifest.json" in names
+    assert ".solcx-releases.json" in names
+    assert not [i for i in names if i.startswith(".build") or i.endswith(".partial")]
+    assert set(index["files"]) == set(names[1:])
+
+
+def test_restore(folder, tmp_path_factory):
+    archive = solcx.snapshot(tmp_path_factory.mktemp("archive").joinpath("solcx.tar.gz"))
+    manifest = read_manifest(folder)
+    _clear(folder)
+    assert solcx.get_installed_solc_versions() == []
+
+    restored = solcx.restore(archive)
+
+    assert folder.joinpath(".solcx-releases.json") in restored
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20"), Version("0.7.6")]
+    assert solcx.install.get_executable("0.7.6").read_bytes() == b"solc 0.7.6" * 1000
+    assert read_manifest(folder) == manifest
+
+
+def test_restore_skips_matching(folder, tmp_path_factory):
+    archive = solcx.snapshot(tmp_path_factory.mktemp("archive").joinpath("solcx.tar.gz"))
+    solcx.install._unlink_solc(solcx.install.get_executable("0.7.6"))
+    registry.invalidate()
+
+    restored = solcx.restore(archive)
+
+    assert restored == [solcx.install.get_executable("0.7.6")]
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20"), Version("0.7.6")]
+
+
+def test_restore_keeps_local_versions(folder, tmp_path_factory):
+    archive = solcx.snapshot(tmp_path_factory.mktemp("archive").joinpath("solcx.tar.gz"))
+    _clear(folder)
+    _install(folder, "0.6.12", b"solc 0.6.12")
+
+    with open(archive, "rb") as fp:
+        solcx.restore(fp)
+
+    assert solcx.get_installed_solc_versions() == [
+        Version("0.8.20"),
+        Version("0.7.6"),
+        Version("0.6.12"),
+    ]
+    assert set(read_manifest(folder)) == {"0.6.12", "0.7.6", "0.8.20"}
+
+
+def test_restore_bounds_pending_bytes(folder, tmp_path_factory, monkeypatch):
+    archive = solcx.snapshot(tmp_path_factory.mktemp("archive").joinpath("solcx.tar.gz"))
+    _clear(folder)
+
+    # with a budget smaller than any file, each one is written before the next is read
+    monkeypatch.setattr(solcx.archive, "MAX_PENDING_BYTES", 1)
+    restore_file = solcx.archive._restore_file
+    running = []
+    overlaps = []
+
+    def _restore_file(*args):
+        running.append(args[0])
+        overlaps.append(len(running))
+        time.sleep(0.01)
+        restore_file(*args)
+        running.remove(args[0])
+
+    monkeypatch.setattr(solcx.archive, "_restore_file", _restore_file)
+    solcx.restore(archive)
+
+    assert max(overlaps) == 1
+    assert solcx.get_installed_solc_versions() == [Version("0.8.20"), Version("0.7.6")]
+
+
+def _archive(files, contents):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        index = json.dumps({"format": 1, "files": files}).encode()
+        for name, content in [(".solcx-snapshot.json", index), *contents.items()]:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    buffer.seek(0)
+    return buffer
+
+
+def test_restore_corrupt(folder):
+    files = {"solc-v0.8.21": {"sha256": "00" * 32, "size": 3, "mode": 0o755, "mtime": 0}}
+    archive = _archive(files, {"solc-v0.8.21": b"bad"})
+
+    with pytest.raises(SolcInstallationError, match="Corrupt"):
+        solcx.restore(archive)
+    assert not folder.joinpath("solc-v0.8.21").exists()
+
+
+def test_restore_rejects_outside_paths(folder):
+    archive = _archive({"../evil": {"sha256": "00" * 32, "size": 0}}, {})
+
+    with pytest.raises(SolcInstallationError, match="Invalid path"):
+        solcx.restore(archive)
+
+
+def test_restore_not_a_snapshot(folder, tmp_path_factory):
+    path = tmp_path_factory.mktemp("archive").joinpath("other.tar.gz")
+    with tarfile.open(path, "w:gz") as tar:
+        tar.add(folder.joinpath(".solcx-releases.json"), "releases.json")
+
+    with pytest.raises(SolcInstallationError, match="not a solcx snapshot"):
+        solcx.restore(path)
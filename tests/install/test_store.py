@@ -0,0 +1,69 @@
+import hashlib
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.utils.store import gc_store, get_store_entry
+
+pytestmark = pytest.mark.skipif("sys.platform == 'win32'")
+
+DIGEST = hashlib.sha256(b"solc").hexdigest()
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path, mocker, make_mirror):
+    for folder in ("a", "b"):
+        tmp_path.joinpath(folder).mkdir()
+    monkeypatch.setenv("SOLCX_STORE_PATH", tmp_path.joinpath("store").as_posix())
+    mocker.patch("solcx.install._validate_installation")
+    solcx.set_binary_mirrors([make_mirror(tmp_path.joinpath("mirror"), {"0.8.20": b"solc"})])
+    yield tmp_path.joinpath("store")
+
+
+def test_install_adds_to_store(store, tmp_path):
+    solcx.install_solc("0.8.20", solcx_binary_path=tmp_path.joinpath("a"))
+
+    entry = get_store_entry(store, DIGEST)
+    assert entry.read_bytes() == b"solc"
+    assert entry.stat().st_ino == tmp_path.joinpath("a", "solc-v0.8.20").stat().st_ino
+
+
+def test_install_from_store(store, tmp_path, monkeypatch):
+    solcx.install_solc("0.8.20", solcx_binary_path=tmp_path.joinpath("a"))
+
+    # with the store populated, the binary itself is not downloaded again
+    binary_list = solcx.install._get_binary_list()
+    monkeypatch.setattr("solcx.install._get_binary_list", lambda: binary_list)
+    solcx.set_binary_mirrors([tmp_path.joinpath("missing")])
+    solcx.install_solc("0.8.20", solcx_binary_path=tmp_path.joinpath("b"))
+
+    installed = tmp_path.joinpath("b", "solc-v0.8.20")
+    assert installed.read_bytes() == b"solc"
+    assert installed.stat().st_nlink == 3
+
+
+def test_gc_store(store, tmp_path):
+    for folder in ("a", "b"):
+        solcx.install_solc("0.8.20", solcx_binary_path=tmp_path.joinpath(folder))
+
+    tmp_path.joinpath("a", "solc-v0.8.20").unlink()
+    assert gc_store(store) == []
+
+    tmp_path.joinpath("b", "solc-v0.8.20").unlink()
+    assert gc_store(store) == [get_store_entry(store, DIGEST)]
+    assert not get_store_entry(store, DIGEST).exists()
+
+
+def test_import_uses_store(store, tmp_path, nosolc, monkeypatch):
+    system_solc = tmp_path.joinpath("solc")
+    system_solc.write_bytes(b"solc")
+    monkeypatch.setattr("solcx.install._get_which_solc", lambda: system_solc)
+    monkeypatch.setattr("solcx.wrapper.get_solc_version", lambda *args: Version("0.8.20"))
+
+    assert solcx.import_installed_solc() == [Version("0.8.20")]
+
+    entry = get_store_entry(store, DIGEST)
+    assert nosolc.joinpath("solc-v0.8.20").stat().st_ino == entry.stat().st_ino
+    # the system binary itself is copied, never linked
+    assert system_solc.stat().st_nlink == 1
@@ -0,0 +1,111 @@
+import json
+import os
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+
+import solcx
+from solcx import artifacts
+
+CONTRACTS: Dict[str, Dict[str, Any]] = {
+    "contracts/Foo.sol:Foo": {
+        "abi": [{"type": "function", "name": "foo"}],
+        "bin": "6080",
+        "metadata": '{"language":"Solidity"}',
+        "ast": {"nodeType": "SourceUnit"},
+    },
+    "contracts/Foo.sol:Bar": {"abi": [], "bin": "6081", "ast": {"nodeType": "SourceUnit"}},
+}
+
+
+@pytest.mark.parametrize(
+    "source,expected",
+    [
+        ("contracts/Foo.sol", "contracts/Foo.sol"),
+        ("/home/user/Foo.sol", "home/user/Foo.sol"),
+        ("../lib/Foo.sol", "lib/Foo.sol"),
+        ("<stdin>", "_stdin_"),
+        ("C:\\contracts\\Foo.sol", "C_/contracts/Foo.sol"),
+    ],
+)
+def test_source_folder(tmp_path, source, expected):
+    assert artifacts.get_source_folder(tmp_path, source) == tmp_path.joinpath(expected)
+
+
+def test_write_artifacts(tmp_path):
+    written = artifacts.write_artifacts(CONTRACTS, tmp_path)
+
+    folder = tmp_path.joinpath("contracts/Foo.sol")
+    assert sorted(i.name for i in folder.iterdir()) == [
+        "Bar.abi",
+        "Bar.bin",
+        "Foo.abi",
+        "Foo.bin",
+        "Foo.metadata",
+        "ast.json",
+    ]
+    assert sorted(written) == sorted(folder.iterdir())
+    assert (
+        json.loads(folder.joinpath("Foo.abi").read_text())
+        == CONTRACTS["contracts/Foo.sol:Foo"]["abi"]
+    )
+    assert folder.joinpath("Foo.bin").read_text() == "6080"
+    assert folder.joinpath("Foo.metadata").read_text() == '{"language":"Solidity"}'
+    assert json.loads(folder.joinpath("ast.json").read_text()) == {"nodeType": "SourceUnit"}
+
+
+def test_unchanged_files_untouched(tmp_path):
+    artifacts.write_artifacts(CONTRACTS, tmp_path)
+    folder = tmp_path.joinpath("contracts/Foo.sol")
+    for path in folder.iterdir():
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    changed = dict(CONTRACTS)
+    changed["contracts/Foo.sol:Bar"] = dict(changed["contracts/Foo.sol:Bar"], bin="6082")
+    written = artifacts.write_artifacts(changed, tmp_path, max_workers=2)
+
+    assert written == [folder.joinpath("Bar.bin")]
+    assert folder.joinpath("Bar.bin").read_text() == "6082"
+    modified = [i.name for i in folder.iterdir() if i.stat().st_mtime_ns != 1_000_000_000]
+    assert modified == ["Bar.bin"]
+    assert artifacts.write_artifacts(changed, tmp_path) == []
+
+
+def test_no_temporary_files_left(tmp_path, monkeypatch):
+    def replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", replace)
+    with pytest.raises(OSError, match="disk full"):
+        artifacts.write_artifacts(CONTRACTS, tmp_path)
+    assert not [i for i in tmp_path.rglob("*") if i.is_file()]
+
+
+def test_compile_source_artifacts(tmp_path, fake_solc):
+    solcx.compile_source(
+        "contract Foo {}",
+        output_values=["abi", "bin"],
+        solc_binary=fake_solc,
+        artifacts_dir=tmp_path,
+    )
+    assert tmp_path.joinpath("_stdin_/Foo.abi").read_text() == "[]"
+    assert tmp_path.joinpath("_stdin_/Foo.bin").read_text() == "00"
+
+
+def test_compile_standard_artifacts(tmp_path, monkeypatch):
+    output = {
+        "contracts": {"Foo.sol": {"Foo": {"abi": [], "evm": {"bytecode": {"object": "6080"}}}}},
+        "sources": {"Foo.sol": {"id": 0, "ast": {"nodeType": "SourceUnit"}}},
+    }
+
+    def solc_wrapper(**kwargs):
+        return json.dumps(output), "", ["solc"], SimpleNamespace(returncode=0, rusage=None)
+
+    monkeypatch.setattr("solcx.wrapper.solc_wrapper", solc_wrapper)
+    input_data = {"language": "Solidity", "sources": {"Foo.sol": {"content": ""}}}
+    assert solcx.compile_standard(input_data, solc_binary="solc", artifacts_dir=tmp_path) == output
+
+    folder = tmp_path.joinpath("Foo.sol")
+    assert sorted(i.name for i in folder.iterdir()) == ["Foo.abi", "Foo.bin", "ast.json"]
+    assert folder.joinpath("Foo.bin").read_text() == "6080"
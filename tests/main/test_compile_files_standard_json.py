@@ -0,0 +1,192 @@
+import json
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx import wrapper
+from solcx.exceptions import SolcError
+
+
+class StandardJsonMock:
+    """
+    Mock for solcx.wrapper.solc_wrapper, that answers standard JSON input with a
+    contract for each source file.
+    """
+
+    def __init__(self):
+        self.errors = []
+        self.version = Version("0.8.20")
+        self.kwargs = None
+        self.input = None
+
+    def __call__(self, stdin=None, **kwargs):
+        self.kwargs = kwargs
+        if not kwargs.get("standard_json"):
+            return '{"contracts": {}}', "", [], SimpleNamespace(returncode=0, rusage=None)
+
+        self.input = json.loads(stdin.read_text())
+        contracts = {
+            name: {
+                name.rsplit("/")[-1][:-4]: {
+                    "abi": [],
+                    "devdoc": {"methods": {}},
+                    "evm": {
+                        "bytecode": {"object": "6080", "opcodes": "PUSH1"},
+                        "deployedBytecode": {"object": "6081"},
+                    },
+                }
+            }
+            for name in self.input["sources"]
+        }
+        sources = {name: {"id": i, "ast": {"src": name}} for i, name in enumerate(contracts)}
+        output = {"contracts": contracts, "sources": sources, "errors": self.errors}
+        return json.dumps(output), "", ["solc"], SimpleNamespace(returncode=0, rusage=None)
+
+
+@pytest.fixture
+def solc_mock(monkeypatch):
+    mock = StandardJsonMock()
+    monkeypatch.setattr("solcx.wrapper.solc_wrapper", mock)
+    monkeypatch.setattr("solcx.wrapper.get_solc_version", lambda solc_binary: mock.version)
+    # any list of files is too long
+    monkeypatch.setattr("solcx.wrapper.get_command_line_limit", lambda: 1000)
+    yield mock
+
+
+def test_switches_to_standard_json(solc_mock, foo_path, bar_path):
+    output = solcx.compile_files(
+        [foo_path, bar_path], output_values=["abi", "bin", "bin-runtime", "ast"], solc_binary="solc"
+    )
+
+    assert "source_files" not in solc_mock.kwargs
+    assert str(foo_path.parent) in solc_mock.kwargs["allow_paths"]
+    sources = solc_mock.input["sources"]
+    assert sources[foo_path.as_posix()]["content"] == foo_path.read_text()
+    assert solc_mock.input["settings"]["outputSelection"] == {
+        "*": {"*": ["abi", "evm.bytecode.object", "evm.deployedBytecode.object"], "": ["ast"]}
+    }
+
+    assert output[f"{foo_path.as_posix()}:Foo"] == {
+        "abi": [],
+        "bin": "6080",
+        "bin-runtime": "6081",
+        "ast": {"src": foo_path.as_posix()},
+    }
+    assert f"{bar_path.as_posix()}:Bar" in output
+
+
+def test_settings(solc_mock, foo_path):
+    solcx.compile_files(
+        [foo_path],
+        output_values=["abi"],
+        solc_binary="solc",
+        import_remappings={"contracts": "/tmp/contracts"},
+        evm_version="paris",
+        optimize=True,
+        optimize_runs=200,
+        metadata_hash="none",
+    )
+
+    assert solc_mock.input["settings"] == {
+        "outputSelection": {"*": {"*": ["abi"]}},
+        "remappings": ["contracts=/tmp/contracts"],
+        "evmVersion": "paris",
+        "metadata": {"bytecodeHash": "none"},
+        "optimizer": {"enabled": True, "runs": 200},
+    }
+
+
+def test_untranslatable_option(solc_mock, foo_path):
+    # options without a standard JSON equivalent are kept on the command line
+    with pytest.raises(solcx.exceptions.ContractsNotFound):
+        solcx.compile_files([foo_path], output_values=["abi"], solc_binary="solc", no_color=True)
+
+    assert solc_mock.kwargs["source_files"] == [foo_path]
+    assert solc_mock.kwargs["no_color"] is True
+
+
+def test_short_command_line(solc_mock, monkeypatch, foo_path):
+    monkeypatch.setattr("solcx.wrapper.get_command_line_limit", lambda: 1 << 20)
+    with pytest.raises(solcx.exceptions.ContractsNotFound):
+        solcx.compile_files([foo_path], output_values=["abi"], solc_binary="solc")
+
+    assert solc_mock.kwargs["combined_json"] == "abi"
+
+
+def test_errors(solc_mock, foo_path):
+    solc_mock.errors = [{"severity": "error", "formattedMessage": "ParserError: oops"}]
+    with pytest.raises(SolcError, match="ParserError: oops"):
+        solcx.compile_files([foo_path], output_values=["abi"], solc_binary="solc")
+
+
+def test_output_dir(solc_mock, foo_path, tmp_path):
+    solcx.compile_files([foo_path], output_values=["abi"], solc_binary="solc", output_dir=tmp_path)
+
+    with tmp_path.joinpath("combined.json").open() as fp:
+        assert f"{foo_path.as_posix()}:Foo" in json.load(fp)["contracts"]
+
+
+def test_string_outputs_before_0_8_0(solc_mock, foo_path, tmp_path):
+    # `solc` gives these outputs as JSON strings before 0.8.0
+    solc_mock.version = Version("0.7.6")
+    output = solcx.compile_files(
+        [foo_path], output_values=["abi", "devdoc"], solc_binary="solc", output_dir=tmp_path
+    )
+
+    contract = output[f"{foo_path.as_posix()}:Foo"]
+    assert contract["abi"] == []
+    assert contract["devdoc"] == '{"methods":{}}'
+    with tmp_path.joinpath("combined.json").open() as fp:
+        contract = json.load(fp)["contracts"][f"{foo_path.as_posix()}:Foo"]
+    assert contract["abi"] == "[]"
+    assert contract["devdoc"] == '{"methods":{}}'
+
+
+def test_source_unit_names_relative_to_base_path(solc_mock, foo_path, bar_source, tmp_path):
+    tmp_path.joinpath("Bar.sol").write_text(bar_source)
+    output = solcx.compile_files(
+        [foo_path, tmp_path.joinpath("Bar.sol")],
+        output_values=["abi"],
+        solc_binary="solc",
+        base_path=foo_path.parent,
+        allow_empty=True,
+    )
+
+    # files outside of the base path keep their absolute paths
+    assert list(solc_mock.input["sources"]) == ["Foo.sol", tmp_path.joinpath("Bar.sol").as_posix()]
+    assert "Foo.sol:Foo" in output
+
+
+@pytest.mark.parametrize("version", ["0.8.7", "0.7.6"])
+def test_source_unit_names_before_0_8_8(solc_mock, foo_path, version):
+    solc_mock.version = Version(version)
+    solcx.compile_files(
+        [foo_path], output_values=["abi"], solc_binary="solc", base_path=foo_path.parent
+    )
+
+    assert list(solc_mock.input["sources"]) == [foo_path.as_posix()]
+
+
+def test_command_line_limit():
+    assert 0 < wrapper.get_command_line_limit() < 1 << 30
+
+
+@pytest.mark.parametrize("base_path", [False, True])
+def test_same_output(all_versions, monkeypatch, foo_path, bar_path, base_path):
+    kwargs: Dict[str, Any] = {
+        "output_values": ["abi", "devdoc", "userdoc", "hashes"],
+        "import_remappings": {"contracts": foo_path.parent},
+    }
+    if base_path:
+        kwargs["base_path"] = foo_path.parent
+    expected = solcx.compile_files([foo_path, bar_path], **kwargs)
+
+    monkeypatch.setattr("solcx.wrapper.get_command_line_limit", lambda: 0)
+    output = solcx.compile_files([foo_path, bar_path], **kwargs)
+    assert output.keys() == expected.keys()
+    for key in output:
+        for value in kwargs["output_values"]:
+            assert output[key].get(value) == expected[key].get(value)
@@ -0,0 +1,133 @@
+from pathlib import Path
+
+import pytest
+from packaging.version import Version
+
+import solcx
+from solcx.exceptions import UnsupportedVersionError
+
+INSTALLED = ["0.6.12", "0.8.19"]
+INSTALLABLE = ["0.5.17", "0.6.12", "0.7.6", "0.8.19", "0.8.20"]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    calls: dict = {"list": 0, "install": [], "compile": {}}
+
+    def get_binary_list():
+        calls["list"] += 1
+        return {"releases": {i: f"solc-v{i}" for i in INSTALLABLE}}
+
+    def install_solc(version, show_progress, solcx_binary_path, binary_list):
+        assert binary_list is not None
+        calls["install"].append(version)
+
+    def compile_files(files, solc_binary, **kwargs):
+        calls["compile"][solc_binary] = [Path(i).name for i in files]
+        return {"kwargs": kwargs}
+
+    monkeypatch.setattr("solcx.install._get_binary_list", get_binary_list)
+    monkeypatch.setattr("solcx.install._install_solc", install_solc)
+    monkeypatch.setattr("solcx.project.compile_files", compile_files)
+    monkeypatch.setattr(
+        "solcx.install.get_installed_solc_versions",
+        lambda **kwargs: [Version(i) for i in INSTALLED],
+    )
+    monkeypatch.setattr("solcx.install.get_executable", lambda version, *args: version)
+
+    def _write(name, source):
+        path = tmp_path.joinpath(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+
+    yield tmp_path, _write, calls
+
+
+def test_minimal_version_set(project):
+    root, write, calls = project
+    write("A.sol", "pragma solidity ^0.8.0;")
+    write("B.sol", "pragma solidity >=0.6.0 <0.9.0;")
+    write("C.sol", "// pragma solidity ^0.5.0;\npragma solidity >=0.8.20;")
+    write("lib/D.sol", "pragma solidity ^0.6.0;")
+
+    output = solcx.compile_project(root, optimize=True)
+
+    # 0.8.20 covers three files, the remaining file needs 0.6.x
+    assert calls["compile"] == {
+        Version("0.8.20"): ["A.sol", "B.sol", "C.sol"],
+        Version("0.6.12"): ["D.sol"],
+    }
+    assert calls["install"] == [Version("0.8.20")]
+    assert calls["list"] == 1
+    assert output[Version("0.6.12")] == {
+        "kwargs": {"optimize": True, "base_path": root, "allow_paths": root}
+    }
+
+
+def test_prefers_installed(project):
+    root, write, calls = project
+    write("A.sol", "pragma solidity ^0.8.0;")
+
+    solcx.compile_project(root)
+
+    assert calls["compile"] == {Version("0.8.19"): ["A.sol"]}
+    assert calls["install"] == []
+
+
+def test_install_missing_false(project):
+    root, write, calls = project
+    write("A.sol", "pragma solidity ^0.7.0;")
+
+    with pytest.raises(UnsupportedVersionError):
+        solcx.compile_project(root, install_missing=False)
+    assert calls["list"] == 0
+
+
+def test_imports_constrain_version(project):
+    root, write, calls = project
+    write("A.sol", 'pragma solidity >=0.6.0;\nimport {B} from "./lib/B.sol";')
+    write("lib/B.sol", 'pragma solidity >=0.5.0;\nimport "lib/C.sol";')
+    write("lib/C.sol", "pragma solidity <0.7.0;")
+
+    solcx.compile_project(root)
+
+    assert calls["compile"] == {Version("0.6.12"): ["A.sol", "B.sol", "C.sol"]}
+    assert calls["install"] == []
+
+
+def test_unsupported_pragma(project):
+    root, write, calls = project
+    write("A.sol", "pragma solidity ^0.4.0;")
+
+    with pytest.raises(UnsupportedVersionError, match="A.sol"):
+        solcx.compile_project(root)
+
+
+def test_empty_project(project):
+    root, write, calls = project
+
+    assert solcx.compile_project(root) == {}
+    assert calls["list"] == 0
+
+
+def test_root_relative_imports_from_other_cwd(project, tmp_path_factory, monkeypatch):
+    root, write, calls = project
+    write("A.sol", 'pragma solidity ^0.8.0;\nimport "lib/X.sol";')
+    write("lib/X.sol", "pragma solidity >=0.8.20;")
+    monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+
+    output = solcx.compile_project(root)
+
+    assert calls["compile"] == {Version("0.8.20"): ["A.sol", "X.sol"]}
+    assert output[Version("0.8.20")] == {"kwargs": {"base_path": root, "allow_paths": root}}
+
+
+def test_base_path_not_given_to_old_versions(project):
+    root, write, calls = project
+    write("A.sol", "pragma solidity ^0.5.0;")
+
+    output = solcx.compile_project(root)
+    assert output[Version("0.5.17")] == {"kwargs": {"allow_paths": root}}
+
+    output = solcx.compile_project(root, base_path="contracts")
+    assert output[Version("0.5.17")] == {"kwargs": {"base_path": "contracts", "allow_paths": root}}
@@ -0,0 +1,74 @@
+import re
+
+import pytest
+
+import solcx
+from solcx.utils.corpus import generate_corpus
+
+
+def _imports(path):
+    return re.findall(r'import "\./(C\d+)\.sol";', path.read_text())
+
+
+def _chain_length(corpus, name):
+    imports = _imports(corpus.root.joinpath(f"{name}.sol"))
+    return 1 + max((_chain_length(corpus, i) for i in imports), default=0)
+
+
+def test_structure(tmp_path):
+    corpus = generate_corpus(tmp_path, contracts=30, fanout=3, depth=4)
+
+    assert [i.name for i in corpus.contracts] == [f"C{i}.sol" for i in range(30)]
+    assert corpus.libraries == []
+    assert max(_chain_length(corpus, f"C{i}") for i in range(30)) == 4
+    assert max(len(_imports(i)) for i in corpus.contracts) == 3
+    # every import refers to an earlier contract
+    for index, path in enumerate(corpus.contracts):
+        assert all(int(i[1:]) < index for i in _imports(path))
+
+
+def test_reproducible(tmp_path):
+    first = generate_corpus(tmp_path.joinpath("a"), contracts=20, fanout=2, depth=3, seed=1)
+    second = generate_corpus(tmp_path.joinpath("b"), contracts=20, fanout=2, depth=3, seed=1)
+    assert [i.read_text() for i in first.paths] == [i.read_text() for i in second.paths]
+
+
+def test_libraries_and_statements(tmp_path):
+    corpus = generate_corpus(tmp_path, contracts=4, libraries=2, statements=50)
+
+    assert [i.name for i in corpus.libraries] == ["Lib0.sol", "Lib1.sol"]
+    source = corpus.contracts[3].read_text()
+    assert "Lib1.scale(x)" in source
+    assert source.count("y = y *") == 25
+    assert source.count("if (y %") == 25
+
+
+def test_pragma_groups(tmp_path):
+    corpus = generate_corpus(
+        tmp_path, contracts=12, depth=3, libraries=1, pragmas=["^0.6.0", "^0.8.0"]
+    )
+
+    assert corpus.pragmas[corpus.libraries[0]] == "^0.6.0 || ^0.8.0"
+    for path in corpus.contracts:
+        pragma = corpus.pragmas[path]
+        assert f"pragma solidity {pragma};" in path.read_text()
+        assert all(corpus.pragmas[tmp_path.joinpath(f"{i}.sol")] == pragma for i in _imports(path))
+
+    with pytest.raises(ValueError):
+        corpus.get_standard_json()
+    input_json = corpus.get_standard_json("^0.8.0")
+    assert sorted(input_json["sources"]) == sorted(
+        ["Lib0.sol"] + [f"C{i}.sol" for i in range(1, 12, 2)]
+    )
+    assert input_json["sources"]["C1.sol"]["content"] == corpus.contracts[1].read_text()
+
+
+@pytest.mark.min_solc("0.5.0")
+def test_compile_standard(all_versions, tmp_path):
+    corpus = generate_corpus(tmp_path, contracts=6, fanout=2, depth=3, libraries=1, statements=10)
+    output = solcx.compile_standard(corpus.get_standard_json())
+
+    for path in corpus.contracts:
+        bytecode = output["contracts"][path.name][path.stem]["evm"]["bytecode"]["object"]
+        # library calls are left as placeholders, to be linked
+        assert "__$" in bytecode
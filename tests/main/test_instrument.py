@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+
+import solcx
+from solcx.utils import instrument
+
+
+@pytest.fixture
+def sink():
+    sink = instrument.MetricsSink()
+    instrument.add_hook(sink)
+    yield sink
+    instrument.remove_hook(sink)
+
+
+def test_disabled():
+    assert not instrument.is_enabled()
+    assert instrument.span("phase") is instrument.span("other")
+
+
+def test_metrics_sink(sink):
+    with instrument.span("phase", size=10) as span:
+        span.set(items=2)
+    with pytest.raises(ValueError):
+        with instrument.span("phase", size=5):
+            raise ValueError
+
+    stats = sink.snapshot()["phase"]
+    assert stats["count"] == 2
+    assert stats["failed"] == 1
+    assert stats["size"] == 15
+    assert stats["items"] == 2
+    assert 0 <= stats["max"] <= stats["total"]
+
+    sink.reset()
+    assert sink.snapshot() == {}
+
+
+def test_logging_hook(caplog):
+    hook = instrument.LoggingHook(level=logging.INFO)
+    instrument.add_hook(hook)
+    try:
+        with caplog.at_level(logging.INFO, logger="solcx"):
+            with instrument.span("phase", size=10):
+                pass
+    finally:
+        instrument.remove_hook(hook)
+
+    assert "phase: " in caplog.text
+    assert "size=10" in caplog.text
+
+
+def test_failing_hook(sink, fake_solc):
+    def hook(timing):
+        raise RuntimeError
+
+    instrument.add_hook(hook)
+    try:
+        assert solcx.compile_source("", solc_binary=fake_solc)
+    finally:
+        instrument.remove_hook(hook)
+
+
+def test_compile_phases(sink, fake_solc):
+    solcx.compile_source("contract Foo {}", solc_binary=fake_solc)
+
+    phases = sink.snapshot()
+    assert phases["probe.version"]["count"] == 2
+    assert phases["probe.help"]["count"] == 1
+    assert phases["spawn"]["count"] == 2
+    assert phases["communicate"]["stdin_size"] == len("contract Foo {}")
+    assert phases["communicate"]["stdout_size"] > 0
+    assert phases["decode.json"]["count"] == 1
+    assert phases["decode.abi"]["contracts"] == 1
@@ -0,0 +1,97 @@
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+import solcx
+from solcx import wrapper
+from solcx.exceptions import SolcError
+from solcx.utils.spool import SpilledText
+
+INPUT_DATA = {"language": "Solidity", "sources": {"Foo.sol": {"content": "contract Foo {}"}}}
+
+
+@pytest.fixture
+def lean(monkeypatch):
+    monkeypatch.setattr(wrapper, "SPILL_THRESHOLD", 0)
+    solcx.set_lean_mode(True)
+    yield
+    solcx.set_lean_mode(None)
+
+
+def _traceback_locals(exc):
+    tb = exc.__traceback__
+    while tb is not None:
+        yield tb.tb_frame.f_code.co_name, tb.tb_frame.f_locals
+        tb = tb.tb_next
+
+
+def test_lean_mode_from_environment(monkeypatch):
+    monkeypatch.setenv("SOLCX_LEAN_MODE", "1")
+    assert wrapper.is_lean_mode()
+    solcx.set_lean_mode(False)
+    assert not wrapper.is_lean_mode()
+    solcx.set_lean_mode(None)
+    monkeypatch.delenv("SOLCX_LEAN_MODE")
+    assert not wrapper.is_lean_mode()
+
+
+def test_process_buffers_released(fake_solc):
+    proc = wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}" * 1000)[3]
+    for name in ("_input", "_fileobj2output", "_stdout_buff", "_stderr_buff"):
+        assert getattr(proc, name, None) is None
+
+
+def test_payloads_kept(fake_solc):
+    with pytest.raises(SolcError) as exc:
+        wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}", success_return_code=1)
+    assert exc.value._stdin_data == "contract Foo {}"
+    assert isinstance(exc.value._stdout_data, str)
+
+
+def test_payloads_spilled(lean, fake_solc):
+    with pytest.raises(SolcError) as exc:
+        wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}", success_return_code=1)
+
+    assert isinstance(exc.value._stdin_data, SpilledText)
+    assert isinstance(exc.value._stdout_data, SpilledText)
+    assert exc.value.stdin_data == "contract Foo {}"
+    assert "<stdin>:Foo" in exc.value.stdout_data
+    assert "<stdin>:Foo" in str(exc.value)
+
+    frame_locals = dict(_traceback_locals(exc.value))
+    assert "stdoutdata" not in frame_locals["solc_wrapper"]
+
+
+def test_spill_threshold(fake_solc, lean, monkeypatch):
+    monkeypatch.setattr(wrapper, "SPILL_THRESHOLD", 1 << 20)
+    with pytest.raises(SolcError) as exc:
+        wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}", success_return_code=1)
+    assert exc.value._stdin_data == "contract Foo {}"
+
+
+def test_compile_standard_frames_cleared(lean, monkeypatch):
+    def solc_wrapper(stdin=None, **kwargs):
+        output = {"errors": [{"severity": "error", "formattedMessage": "ParserError: oops"}]}
+        return json.dumps(output), "", ["solc"], SimpleNamespace(returncode=0, rusage=None)
+
+    monkeypatch.setattr("solcx.wrapper.solc_wrapper", solc_wrapper)
+    with pytest.raises(SolcError, match="ParserError: oops") as exc:
+        solcx.compile_standard(INPUT_DATA, solc_binary="solc")
+
+    assert exc.value.stdin_data == json.dumps(INPUT_DATA)
+    assert "ParserError" in exc.value.stdout_data
+    frame_locals = dict(_traceback_locals(exc.value))
+    assert frame_locals["_run_standard_json"] == {}
+    assert frame_locals["_check_standard_json_errors"] == {}
+
+
+def test_pickle_reads_payloads(lean, fake_solc):
+    with pytest.raises(SolcError) as exc:
+        wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}", success_return_code=1)
+
+    error = pickle.loads(pickle.dumps(exc.value))
+    assert error._stdin_data == "contract Foo {}"
+    assert error.stdout_data == exc.value.stdout_data
+    assert error.rusage == exc.value.rusage
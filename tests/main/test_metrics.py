@@ -0,0 +1,78 @@
+import urllib.request
+
+import pytest
+
+import solcx
+from solcx.utils import instrument, metrics
+
+
+@pytest.fixture
+def collector():
+    yield metrics.enable_metrics()
+    metrics.disable_metrics()
+
+
+def test_histogram():
+    histogram = metrics.Histogram("test_seconds", "Test.", ("api",), buckets=(0.1, 1))
+    histogram.observe(("a",), 0.05)
+    histogram.observe(("a",), 0.5)
+    histogram.observe(("a",), 5)
+
+    assert histogram.render()[2:] == [
+        'test_seconds_bucket{api="a",le="0.1"} 1',
+        'test_seconds_bucket{api="a",le="1"} 2',
+        'test_seconds_bucket{api="a",le="+Inf"} 3',
+        'test_seconds_sum{api="a"} 5.55',
+        'test_seconds_count{api="a"} 3',
+    ]
+
+
+def test_label_escaping():
+    counter = metrics.Counter("test_total", "Test.", ("path",))
+    counter.inc(('a "b"\\c',))
+    assert counter.render()[-1] == 'test_total{path="a \\"b\\"\\\\c"} 1'
+
+
+def test_enable_disable():
+    collector = metrics.enable_metrics()
+    assert metrics.enable_metrics() is collector
+    assert instrument.is_enabled()
+    metrics.disable_metrics()
+    assert not instrument.is_enabled()
+
+
+def test_compile_metrics(collector, fake_solc):
+    solcx.compile_source("contract Foo {}", solc_binary=fake_solc)
+    instrument.record("cache.registry", 0.0, hit=True)
+    instrument.record("cache.registry", 0.0, hit=False)
+    instrument.record("install.download", 2.0, bytes=4096)
+
+    text = metrics.render_metrics()
+    assert (
+        'solcx_api_duration_seconds_count{api="compile_source",version="0.8.20",status="ok"} 1'
+        in text
+    )
+    assert 'solcx_solc_input_bytes_sum{version="0.8.20"} 15' in text
+    assert 'solcx_cache_requests_total{cache="registry",result="hit"} 1' in text
+    assert 'solcx_cache_requests_total{cache="registry",result="miss"} 1' in text
+    assert "solcx_download_bytes_total 4096" in text
+    assert "solcx_download_seconds_total 2" in text
+
+
+def test_failed_compile(collector, fake_solc):
+    with pytest.raises(solcx.exceptions.ContractsNotFound):
+        solcx.compile_standard({"language": "Solidity"}, solc_binary=fake_solc)
+
+    # raised before solc runs, so the version is unknown
+    assert 'api="compile_standard",version="",status="error"' in metrics.render_metrics()
+
+
+def test_metrics_server(collector, monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "*")
+    instrument.record("lock.wait", 0.2, lock="0.8.20")
+    host, port = metrics.start_metrics_server()
+
+    with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+        assert response.headers["Content-Type"] == metrics.CONTENT_TYPE
+        body = response.read().decode()
+    assert 'solcx_lock_wait_seconds_count{status="acquired"} 1' in body
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+import solcx
+from solcx.exceptions import SolcError
+from solcx.utils import rusage
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    rusage.reset_resource_stats()
+    yield
+    rusage.reset_resource_stats()
+
+
+def test_rusage_on_return_value(fake_solc):
+    proc = solcx.wrapper.solc_wrapper(solc_binary=fake_solc, stdin="contract Foo {}")[3]
+
+    usage: Any = proc.rusage
+    assert usage.wall_time > 0
+    if hasattr(os, "wait4"):
+        assert usage.user_time + usage.system_time > 0
+        # the fake solc is a python process, which needs at least a megabyte
+        assert usage.max_rss > 1 << 20
+
+
+def test_rusage_on_error(fake_solc):
+    with pytest.raises(SolcError) as exc:
+        solcx.wrapper.solc_wrapper(
+            solc_binary=fake_solc, stdin="contract Foo {}", success_return_code=1
+        )
+    assert exc.value.rusage is not None
+    assert exc.value.rusage.wall_time > 0
+
+
+def test_aggregated_stats(fake_solc, foo_path):
+    solcx.compile_source("contract Foo {}", solc_binary=fake_solc, output_values=["abi"])
+    solcx.compile_source("contract Foo {}", solc_binary=fake_solc, output_values=["abi"])
+    solcx.compile_files([foo_path], solc_binary=fake_solc, output_values=["abi"])
+
+    stats = rusage.get_resource_stats()
+    assert stats["versions"]["0.8.20"]["count"] == 3
+    assert stats["inputs"][str(foo_path)]["count"] == 1
+    stdin_keys = [i for i in stats["inputs"] if i.startswith("stdin:")]
+    assert len(stdin_keys) == 1
+    assert stats["inputs"][stdin_keys[0]]["count"] == 2
+
+
+def test_tracked_inputs_bounded(monkeypatch):
+    monkeypatch.setattr(rusage, "MAX_TRACKED_INPUTS", 2)
+    usage = rusage.ResourceUsage(1.0, None, None, None)
+    for key in ["a", "b", "a", "c"]:
+        rusage.record_usage("0.8.20", key, usage)
+
+    stats = rusage.get_resource_stats()
+    assert list(stats["inputs"]) == ["a", "c"]
+    assert stats["versions"]["0.8.20"] == {"count": 4, "wall_time": 4.0}
+
+
+@pytest.mark.parametrize(
+    "code,returncode",
+    [
+        ("exit(3)", 3),
+        pytest.param(
+            "import os; os.abort()", -6, marks=pytest.mark.skipif("sys.platform == 'win32'")
+        ),
+    ],
+)
+def test_return_code(code, returncode):
+    proc = rusage.AccountedPopen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+    proc.communicate()
+    assert proc.returncode == returncode
+    assert (proc.get_usage(1.0).max_rss is not None) == hasattr(os, "wait4")
+
+
+@pytest.mark.skipif("not hasattr(os, 'wait4')")
+def test_no_usage_when_reaped_elsewhere():
+    proc = rusage.AccountedPopen([sys.executable, "-c", "pass"])
+    os.waitpid(proc.pid, 0)
+    proc.wait()
+    assert proc.get_usage(1.0) == rusage.ResourceUsage(1.0, None, None, None)
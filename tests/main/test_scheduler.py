@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+
+import pytest
+
+import solcx
+from solcx import scheduler
+from solcx.scheduler import Scheduler, get_job_key, read_history
+
+
+class Tracker:
+    """
+    Records the order that jobs start in, and the most that ran at once.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = []
+        self.running = 0
+        self.max_running = 0
+
+    def job(self, name, duration=0.05):
+        def fn():
+            with self.lock:
+                self.started.append(name)
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            time.sleep(duration)
+            with self.lock:
+                self.running -= 1
+            return name
+
+        return fn
+
+
+@pytest.fixture
+def tracker():
+    yield Tracker()
+
+
+def test_cpu_budget(tracker):
+    with Scheduler(max_workers=2, max_memory=None) as sched:
+        futures = [sched.submit(str(i), tracker.job(i)) for i in range(6)]
+
+    assert [i.result() for i in futures] == list(range(6))
+    assert tracker.max_running == 2
+
+
+def test_memory_budget(tracker, tmp_path):
+    history_path = tmp_path.joinpath("history.json")
+    scheduler.update_history(history_path, {str(i): {"max_rss": 1000} for i in range(4)})
+
+    # two jobs fit in the budget at once, with the margin
+    with Scheduler(max_workers=4, max_memory=2600, history_path=history_path) as sched:
+        for i in range(4):
+            sched.submit(str(i), tracker.job(i))
+
+    assert tracker.max_running == 2
+
+
+def test_oversized_job_runs_alone(tracker, tmp_path):
+    history_path = tmp_path.joinpath("history.json")
+    scheduler.update_history(history_path, {"big": {"max_rss": 10_000}})
+
+    with Scheduler(max_workers=4, max_memory=5000, history_path=history_path) as sched:
+        big = sched.submit("big", tracker.job("big"))
+        small = [sched.submit(str(i), tracker.job(i)) for i in range(3)]
+
+    assert big.result() == "big"
+    assert [i.result() for i in small] == [0, 1, 2]
+    # the small jobs have no history, so each is expected to need more than the budget
+    assert tracker.max_running == 1
+
+
+def test_longest_job_first(tracker, tmp_path):
+    history_path = tmp_path.joinpath("history.json")
+    scheduler.update_history(
+        history_path, {"short": {"wall_time": 1.0}, "long": {"wall_time": 30.0}}
+    )
+
+    with Scheduler(max_workers=1, max_memory=None, history_path=history_path) as sched:
+        # occupies the only worker until the other jobs are queued
+        sched.submit("first", tracker.job("first", 0.2))
+        sched.submit("short", tracker.job("short"))
+        sched.submit("long", tracker.job("long"))
+        sched.submit("small", tracker.job("small"), size=10)
+        sched.submit("large", tracker.job("large"), size=1000)
+
+    # jobs that have not run before come first, largest first
+    assert tracker.started == ["first", "large", "small", "long", "short"]
+
+
+def test_failing_job_releases_budget(tmp_path):
+    def fail():
+        raise ValueError
+
+    with Scheduler(max_workers=1, max_memory=None) as sched:
+        failed = sched.submit("fail", fail)
+        ok = sched.submit("ok", lambda: 42)
+
+    with pytest.raises(ValueError):
+        failed.result()
+    assert ok.result() == 42
+
+
+def test_learns_from_compile(fake_solc, foo_path, tmp_path):
+    history_path = tmp_path.joinpath("history.json")
+    key = get_job_key("0.8.20", [foo_path])
+
+    with Scheduler(history_path=history_path) as sched:
+        sched.submit(key, lambda: solcx.compile_files([foo_path], solc_binary=fake_solc)).result()
+
+    entry = read_history(history_path)[key]
+    assert entry["wall_time"] > 0
+    if hasattr(os, "wait4"):
+        assert entry["max_rss"] > 1 << 20
+
+    # the estimate is used by the next scheduler
+    with Scheduler(history_path=history_path) as sched:
+        assert sched._history[key]["max_rss"] == entry.get("max_rss")
+
+
+def test_history_bounded(monkeypatch, tmp_path):
+    monkeypatch.setattr(scheduler, "MAX_HISTORY", 2)
+    history_path = tmp_path.joinpath("history.json")
+    for i in range(4):
+        scheduler.update_history(history_path, {str(i): {"wall_time": 1, "last_run": i}})
+
+    assert sorted(read_history(history_path)) == ["2", "3"]
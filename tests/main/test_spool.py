@@ -0,0 +1,110 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import solcx
+from solcx.exceptions import SolcError
+from solcx.utils import rusage, spool
+from solcx.utils.spool import SpilledText, SpooledInput
+
+INPUT_DATA = {
+    "language": "Solidity",
+    "sources": {
+        "Foo.sol": {"content": "contract Foo {}"},
+        "Bär.sol": {"content": 'contract Bar { string s = "\\u00e9\\n"; }'},
+    },
+    "settings": {"outputSelection": {"*": {"*": ["abi"]}}},
+}
+
+
+def test_write_json_matches_dumps():
+    with SpooledInput() as stdin:
+        stdin.write_json(INPUT_DATA)
+        expected = json.dumps(INPUT_DATA)
+        assert stdin.read_text() == expected
+        assert stdin.size == len(expected.encode())
+
+
+def test_write_json_buffered(monkeypatch):
+    monkeypatch.setattr(spool, "WRITE_BUFFER_SIZE", 16)
+    with SpooledInput() as stdin:
+        stdin.write_json(INPUT_DATA)
+        assert stdin.read_text() == json.dumps(INPUT_DATA)
+
+
+def test_input_key_matches_string():
+    with SpooledInput() as stdin:
+        stdin.write_json(INPUT_DATA)
+        assert rusage.get_input_key(None, stdin, True) == rusage.get_input_key(
+            None, json.dumps(INPUT_DATA), True
+        )
+
+
+def test_temporary_file_fallback(monkeypatch):
+    monkeypatch.delattr("os.memfd_create", raising=False)
+    with SpooledInput() as stdin:
+        stdin.write_json(INPUT_DATA)
+        assert stdin.read_text() == json.dumps(INPUT_DATA)
+
+
+def test_passed_to_solc(fake_solc):
+    with SpooledInput() as stdin:
+        stdin.write_json(INPUT_DATA)
+        stdoutdata = solcx.wrapper.solc_wrapper(solc_binary=fake_solc, stdin=stdin)[0]
+    assert "<stdin>:Foo" in json.loads(stdoutdata)["contracts"]
+
+
+def test_stdin_data_read_on_error(fake_solc):
+    with SpooledInput() as stdin:
+        stdin.write_json(INPUT_DATA)
+        with pytest.raises(SolcError) as exc:
+            solcx.wrapper.solc_wrapper(solc_binary=fake_solc, stdin=stdin, success_return_code=1)
+
+    # the error holds a copy on disk, which outlives the spool
+    assert isinstance(exc.value._stdin_data, SpilledText)
+    assert exc.value.stdin_data == json.dumps(INPUT_DATA)
+    assert exc.value.stdin_data == json.dumps(INPUT_DATA)
+
+
+def test_spool_closed_on_error(monkeypatch):
+    spools = []
+
+    def solc_wrapper(stdin=None, **kwargs):
+        spools.append(stdin)
+        output = {"errors": [{"severity": "error", "formattedMessage": "ParserError: oops"}]}
+        return json.dumps(output), "", ["solc"], SimpleNamespace(returncode=0, rusage=None)
+
+    monkeypatch.setattr("solcx.wrapper.solc_wrapper", solc_wrapper)
+    with pytest.raises(SolcError) as exc:
+        solcx.compile_standard(INPUT_DATA, solc_binary="solc")
+
+    assert spools[0].file.closed
+    assert exc.value.stdin_data == json.dumps(INPUT_DATA)
+
+
+def test_spool_closed_on_invalid_output(monkeypatch):
+    spools = []
+
+    def solc_wrapper(stdin=None, **kwargs):
+        spools.append(stdin)
+        return "not json", "", ["solc"], SimpleNamespace(returncode=0, rusage=None)
+
+    monkeypatch.setattr("solcx.wrapper.solc_wrapper", solc_wrapper)
+    with pytest.raises(json.JSONDecodeError):
+        solcx.compile_standard(INPUT_DATA, solc_binary="solc")
+    assert spools[0].file.closed
+
+
+def test_compile_standard_spools_input(monkeypatch):
+    calls = []
+
+    def solc_wrapper(stdin=None, **kwargs):
+        calls.append(stdin.read_text())
+        return '{"contracts": {"Foo.sol": {"Foo": {}}}}', "", ["solc"], None
+
+    monkeypatch.setattr("solcx.wrapper.solc_wrapper", solc_wrapper)
+    output = solcx.compile_standard(INPUT_DATA, solc_binary="solc")
+
+    assert calls == [json.dumps(INPUT_DATA)]
+    assert output["contracts"] == {"Foo.sol": {"Foo": {}}}
@@ -1,4 +1,3 @@
-import subprocess
 from typing import Mapping, cast
 
 import pytest
@@ -10,7 +9,7 @@ from solcx.exceptions import UnknownOption, UnknownValue
 
 class PopenPatch:
     def __init__(self):
-        self.proc = subprocess.Popen
+        self.proc = solcx.utils.rusage.AccountedPopen
         self.args = []
 
     def __call__(self, cmd, **kwargs):
@@ -28,7 +27,7 @@ class PopenPatch:
 @pytest.fixture
 def popen(monkeypatch):
     patch = PopenPatch()
-    monkeypatch.setattr("subprocess.Popen", patch)
+    monkeypatch.setattr("solcx.utils.rusage.AccountedPopen", patch)
     yield patch
 
 